@@ -9,13 +9,26 @@ from flask_wtf.csrf import CSRFProtect
 
 from csi3335f2025 import mysql
 
+from .admission import parse_admission_limits
+from .cache import LRUCache
+
 db = SQLAlchemy()
 login_manager = LoginManager()
 csrf = CSRFProtect()
 migrate = Migrate()
+team_batting_cache = LRUCache('TEAM_BATTING_CACHE_SIZE', maxsize=256)
+player_career_cache = LRUCache('PLAYER_CAREER_CACHE_SIZE', maxsize=512)
+team_fragment_cache = LRUCache(
+    'TEAM_FRAGMENT_CACHE_SIZE',
+    maxsize=1024,
+    bytes_config_key='TEAM_FRAGMENT_CACHE_BYTES',
+    max_bytes=32 * 1024 * 1024,
+    weigh=lambda fragments: sum(len(fragment.encode('utf-8')) for fragment in fragments),
+)
+user_cache = LRUCache('USER_CACHE_SIZE', maxsize=1024, ttl_config_key='USER_CACHE_TTL', ttl=300)
 
 
-def create_app() -> Flask:
+def create_app(config: Optional[dict] = None) -> Flask:
     app = Flask(__name__)
     app.config['SECRET_KEY'] = os.environ.get('FLASK_SECRET_KEY', 'change-me')
 
@@ -24,14 +37,53 @@ def create_app() -> Flask:
     host = mysql.get('host') or mysql.get('location') or 'localhost'
     database = mysql['database']
     app.config['SQLALCHEMY_DATABASE_URI'] = f"mysql+pymysql://{user}:{password}@{host}/{database}"
+    # Hosts serving copies of the read-only baseball tables, from READ_REPLICA_HOSTS or mysql['replicas'].
+    replica_hosts = os.environ.get('READ_REPLICA_HOSTS', ','.join(mysql.get('replicas', [])))
+    app.config['READ_REPLICA_URIS'] = [
+        f"mysql+pymysql://{user}:{password}@{replica_host.strip()}/{database}"
+        for replica_host in replica_hosts.split(',') if replica_host.strip()
+    ]
+    app.config['READ_REPLICA_RETRY_SECONDS'] = float(os.environ.get('READ_REPLICA_RETRY_SECONDS', 30))
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
         'pool_pre_ping': True,
         'pool_recycle': 300,
     }
+    app.config['TEAM_BATTING_CACHE_SIZE'] = int(os.environ.get('TEAM_BATTING_CACHE_SIZE', 256))
+    app.config['TEAM_FRAGMENT_CACHE_SIZE'] = int(os.environ.get('TEAM_FRAGMENT_CACHE_SIZE', 1024))
+    app.config['TEAM_FRAGMENT_CACHE_BYTES'] = int(os.environ.get('TEAM_FRAGMENT_CACHE_BYTES', 32 * 1024 * 1024))
+    app.config['PLAYER_CAREER_CACHE_SIZE'] = int(os.environ.get('PLAYER_CAREER_CACHE_SIZE', 512))
+    app.config['USER_CACHE_SIZE'] = int(os.environ.get('USER_CACHE_SIZE', 1024))
+    app.config['USER_CACHE_TTL'] = float(os.environ.get('USER_CACHE_TTL', 300))
+    app.config['TEMPLATE_VERSION'] = os.environ.get('TEMPLATE_VERSION', '2')
+    app.config['DATASET_VERSION'] = os.environ.get('DATASET_VERSION', 'baseball-1871-2024')
+    app.config['DATASET_LAST_MODIFIED'] = os.environ.get('DATASET_LAST_MODIFIED')
+    app.config['DATASET_CACHE_CONTROL'] = os.environ.get('DATASET_CACHE_CONTROL', 'private, max-age=86400')
+    app.config['EXPORT_CHUNK_ROWS'] = int(os.environ.get('EXPORT_CHUNK_ROWS', 1000))
+    app.config['TRIVIA_POOL_SIZE'] = int(os.environ.get('TRIVIA_POOL_SIZE', 200))
+    app.config['TRIVIA_POOL_LOW_WATER'] = int(os.environ.get('TRIVIA_POOL_LOW_WATER', 50))
+    app.config['TRIVIA_REFILL_BATCH_SIZE'] = int(os.environ.get('TRIVIA_REFILL_BATCH_SIZE', 100))
+    app.config['LEADERBOARD_SEASON_MIN_PA'] = int(os.environ.get('LEADERBOARD_SEASON_MIN_PA', 400))
+    app.config['LEADERBOARD_CAREER_MIN_PA'] = int(os.environ.get('LEADERBOARD_CAREER_MIN_PA', 3000))
+    app.config['SNAPSHOT_DIR'] = os.environ.get('SNAPSHOT_DIR', '')
+    app.config['QUERY_EXECUTOR_WORKERS'] = int(os.environ.get('QUERY_EXECUTOR_WORKERS', 4))
+    app.config['ADMISSION_CONTROL'] = os.environ.get('ADMISSION_CONTROL', '1') != '0'
+    app.config['ADMISSION_LIMITS'] = parse_admission_limits(os.environ.get('ADMISSION_LIMITS', ''))
+    app.config['QUERY_TIMEOUT'] = float(os.environ.get('QUERY_TIMEOUT', 10))
+    app.config['QUERY_INSTRUMENTATION'] = os.environ.get('QUERY_INSTRUMENTATION', '1') != '0'
+    app.config['QUERY_STATS_WINDOW'] = int(os.environ.get('QUERY_STATS_WINDOW', 1000))
+    app.config['ADMIN_USERNAMES'] = {
+        name.strip() for name in os.environ.get('ADMIN_USERNAMES', 'admin').split(',') if name.strip()
+    }
+    if config:
+        app.config.update(config)
 
     db.init_app(app)
     csrf.init_app(app)
+    team_batting_cache.init_app(app)
+    team_fragment_cache.init_app(app)
+    player_career_cache.init_app(app)
+    user_cache.init_app(app)
     login_manager.init_app(app)
     login_manager.login_view = 'auth.login'
     login_manager.login_message_category = 'warning'
@@ -39,21 +91,63 @@ def create_app() -> Flask:
     migrations_path = os.path.join(app.root_path, os.pardir, 'migrations')
     migrate.init_app(app, db, directory=migrations_path)
 
-    from .models import User
+    from .models import SessionUser, User
+
+    def _session_user(user_id: int) -> Optional[SessionUser]:
+        user = db.session.get(User, user_id)
+        return SessionUser.from_user(user) if user else None
 
     @login_manager.user_loader
-    def load_user(user_id: str) -> Optional[User]:
+    def load_user(user_id: str) -> Optional[SessionUser]:
+        # Served from user_cache so a signed-in request normally runs no users query. Unknown
+        # ids are not cached, so stale or forged session cookies cannot fill the cache.
         if not user_id:
             return None
         try:
-            return db.session.get(User, int(user_id))
+            user_id = int(user_id)
         except (ValueError, TypeError):
             return None
+        user = user_cache.get(user_id)
+        if user is None:
+            user = _session_user(user_id)
+            if user is not None:
+                user_cache.set(user_id, user)
+        return user
 
+    from .admin import admin_bp
+    from .admission import admission
+    from .api import api_bp
     from .auth import auth_bp
+    from .connection import close_connection
+    from .indexes import check_indexes_command
+    from .instrumentation import query_stats
+    from .leaderboards import leaderboards
+    from .materialized import build_player_seasons_command
+    from .parallel import query_executor
+    from .registry import query_registry
+    from .replicas import check_replicas_command, replicas
     from .routes import core_bp
+    from .snapshot import export_snapshot_command, snapshot
+    from .trivia import trivia_pool
+
+    app.teardown_appcontext(close_connection)
+    replicas.init_app(app)
+    query_registry.init_app(app)
+    snapshot.init_app(app)
+    trivia_pool.init_app(app)
+    leaderboards.init_app(app)
+    query_executor.init_app(app)
+    admission.init_app(app)
+    with app.app_context():
+        query_stats.init_app(app, db.engine, *replicas.engines())
 
     app.register_blueprint(auth_bp)
     app.register_blueprint(core_bp)
+    app.register_blueprint(api_bp)
+    app.register_blueprint(admin_bp)
+    app.cli.add_command(build_player_seasons_command)
+    app.cli.add_command(check_indexes_command)
+    app.cli.add_command(export_snapshot_command)
+    app.cli.add_command(check_replicas_command)
 
     return app
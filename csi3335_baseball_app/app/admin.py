@@ -0,0 +1,54 @@
+from flask import Blueprint, current_app, render_template
+from flask_login import current_user, login_required
+
+from .admission import ENDPOINT_CLASSES, admission
+from .instrumentation import HISTOGRAM_BUCKETS_MS, query_stats
+from .replicas import replicas
+
+admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
+
+
+def is_admin(user) -> bool:
+    return user.is_authenticated and user.username in current_app.config['ADMIN_USERNAMES']
+
+
+@admin_bp.before_request
+@login_required
+def _require_admin():
+    if not is_admin(current_user):
+        message = 'This page is only available to administrators.'
+        return render_template('error.html', message=message), 403
+    return None
+
+
+@admin_bp.route('/queries')
+def queries():
+    bucket_labels = [f"≤{bound} ms" for bound in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]} ms"]
+    rows = query_stats.summary()
+    for row in rows:
+        tallest = max(row['histogram']) or 1
+        row['bars'] = [round(100 * count / tallest) for count in row['histogram']]
+    return render_template(
+        'admin_queries.html',
+        rows=rows,
+        bucket_labels=bucket_labels,
+        window=query_stats.window,
+    )
+
+
+@admin_bp.route('/admission')
+def admission_stats():
+    endpoints: dict[str, list[str]] = {}
+    for endpoint, endpoint_class in ENDPOINT_CLASSES.items():
+        endpoints.setdefault(endpoint_class, []).append(endpoint)
+    return render_template(
+        'admin_admission.html',
+        rows=admission.stats(),
+        endpoints=endpoints,
+        enabled=admission.enabled,
+    )
+
+
+@admin_bp.route('/replicas')
+def replica_stats():
+    return render_template('admin_replicas.html', rows=replicas.stats(), fallbacks=replicas.primary_fallbacks)
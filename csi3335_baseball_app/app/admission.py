@@ -0,0 +1,140 @@
+import math
+import threading
+import time
+from typing import Optional
+
+from flask import g, render_template, request
+from flask_login import current_user
+
+# Endpoint class -> (concurrent requests, waiting requests, seconds a request may wait).
+DEFAULT_ADMISSION_LIMITS = {
+    'export': (4, 8, 5.0),
+    'compare': (4, 8, 2.0),
+    'game': (4, 8, 2.0),
+}
+ENDPOINT_CLASSES = {
+    'core.team_download': 'export',
+    'core.season_download': 'export',
+    'core.franchise_download': 'export',
+    'core.teams_compare': 'compare',
+    'core.team_compare': 'compare',
+    'core.game': 'game',
+}
+
+
+def parse_admission_limits(value: str) -> dict[str, tuple[int, int, float]]:
+    # "export=4/8/5,game=2/4/1" -> {'export': (4, 8, 5.0), 'game': (2, 4, 1.0)}
+    limits = {}
+    for item in value.split(','):
+        if not item.strip():
+            continue
+        name, _, spec = item.partition('=')
+        slots, queue, wait = spec.split('/')
+        limits[name.strip()] = (int(slots), int(queue), float(wait))
+    return limits
+
+
+class _Limiter:
+    def __init__(self, name: str, slots: int, queue: int, wait: float):
+        self.name = name
+        self.slots = slots
+        self.queue = queue
+        self.wait = wait
+        self.active = 0
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> bool:
+        with self._condition:
+            if self.active < self.slots:
+                self.active += 1
+                self.admitted += 1
+                return True
+            if self.waiting >= self.queue:
+                self.rejected += 1
+                return False
+
+            self.waiting += 1
+            self.peak_waiting = max(self.peak_waiting, self.waiting)
+            deadline = time.monotonic() + self.wait
+            try:
+                while self.active >= self.slots:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.timed_out += 1
+                        return False
+                    self._condition.wait(remaining)
+            finally:
+                self.waiting -= 1
+            self.active += 1
+            self.admitted += 1
+            return True
+
+    def release(self) -> None:
+        with self._condition:
+            self.active -= 1
+            self._condition.notify()
+
+    def stats(self) -> dict:
+        with self._condition:
+            return {
+                'name': self.name,
+                'slots': self.slots,
+                'queue': self.queue,
+                'wait': self.wait,
+                'active': self.active,
+                'waiting': self.waiting,
+                'peak_waiting': self.peak_waiting,
+                'admitted': self.admitted,
+                'rejected': self.rejected,
+                'timed_out': self.timed_out,
+            }
+
+
+class AdmissionControl:
+    def __init__(self):
+        self.enabled = True
+        self._limiters: dict[str, _Limiter] = {}
+
+    def init_app(self, app) -> None:
+        self.enabled = bool(app.config.setdefault('ADMISSION_CONTROL', self.enabled))
+        limits = dict(DEFAULT_ADMISSION_LIMITS)
+        limits.update(app.config.setdefault('ADMISSION_LIMITS', {}))
+        self._limiters = {name: _Limiter(name, *limit) for name, limit in limits.items()}
+        if not self.enabled:
+            return
+        app.before_request(self._admit)
+        app.teardown_request(self._release)
+
+    def limiter_for(self, endpoint: Optional[str]) -> Optional[_Limiter]:
+        return self._limiters.get(ENDPOINT_CLASSES.get(endpoint))
+
+    def _admit(self):
+        limiter = self.limiter_for(request.endpoint)
+        # Every limited view needs a login; anonymous requests are only redirected, so they
+        # must not take slots or queue places from signed-in users.
+        if limiter is None or not current_user.is_authenticated:
+            return None
+        if not limiter.acquire():
+            message = 'The server is busy with other requests like this one. Please try again in a moment.'
+            return render_template('error.html', message=message), 503, {
+                'Retry-After': str(max(1, math.ceil(limiter.wait))),
+            }
+        # Released in teardown, which for streamed CSV downloads runs after the last chunk.
+        g.admission_limiter = limiter
+        return None
+
+    def _release(self, exception: Optional[BaseException] = None) -> None:
+        limiter = g.pop('admission_limiter', None)
+        if limiter is not None:
+            limiter.release()
+
+    def stats(self) -> list[dict]:
+        return [limiter.stats() for limiter in self._limiters.values()]
+
+
+admission = AdmissionControl()
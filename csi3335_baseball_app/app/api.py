@@ -0,0 +1,109 @@
+from flask import Blueprint, jsonify, request
+from flask_login import login_required
+
+from .formatting import FORMATTED_COLUMNS
+from .http_cache import conditional_dataset_response
+from .routes import _team_batting, _team_metadata
+from .seasons import season_directory
+
+api_bp = Blueprint('api', __name__, url_prefix='/api/v1')
+
+# Raw values are the default payload; the *_display / badge strings are available on request.
+DEFAULT_BATTING_FIELDS = [
+    'playerID',
+    'player_name',
+    'age',
+    'games',
+    'at_bats',
+    'hits',
+    'doubles',
+    'triples',
+    'home_runs',
+    'runs_batted_in',
+    'walks',
+    'strikeouts',
+    'stolen_bases',
+    'caught_stealing',
+    'sb_pct',
+    'avg',
+    'obp',
+    'slg',
+    'ops',
+    'ops_plus',
+    'hall_of_famer',
+    'all_star',
+]
+BATTING_FIELDS = DEFAULT_BATTING_FIELDS + FORMATTED_COLUMNS
+_WHOLE_FIELDS = {'age'}
+_FLAG_FIELDS = {'hall_of_famer', 'all_star'}
+
+
+def _error(message: str, status: int):
+    return jsonify({'error': message}), status
+
+
+def _requested_fields():
+    raw = request.args.get('fields', '')
+    if not raw.strip():
+        return DEFAULT_BATTING_FIELDS, []
+    fields = list(dict.fromkeys(name.strip() for name in raw.split(',') if name.strip()))
+    unknown = [name for name in fields if name not in BATTING_FIELDS]
+    return fields, unknown
+
+
+def _column_values(name: str, series) -> list:
+    if name in _FLAG_FIELDS:
+        return series.astype(bool).tolist()
+    if series.dtype.kind != 'f':
+        return series.tolist()
+    missing = series.isna().to_numpy()
+    values = (series.fillna(0).astype(int) if name in _WHOLE_FIELDS else series).to_numpy(dtype=object)
+    values[missing] = None
+    return values.tolist()
+
+
+@api_bp.route('/seasons/<int:year_id>/teams')
+@login_required
+@conditional_dataset_response('seasons-json')
+def season_teams(year_id: int):
+    teams = season_directory.teams(year_id)
+    if not teams:
+        first, last = season_directory.bounds()
+        return _error(f"No teams found for {year_id}. Seasons run from {first} to {last}.", 404)
+    return jsonify({
+        'year': year_id,
+        'teams': [{'teamID': team_id, 'name': name} for team_id, name in teams],
+    })
+
+
+@api_bp.route('/team/<team_id>/<int:year_id>/batting')
+@login_required
+@conditional_dataset_response('team-json', query_args=('fields',))
+def team_batting(team_id: str, year_id: int):
+    fields, unknown = _requested_fields()
+    if unknown:
+        return _error(f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(BATTING_FIELDS)}.", 400)
+
+    if not season_directory.covers(year_id):
+        return _error(f"Season {year_id} is outside the supported range.", 404)
+
+    team = _team_metadata(team_id, year_id)
+    if not team:
+        return _error(f"No records for team {team_id} in {year_id}.", 404)
+
+    _, _, comparison_df = _team_batting(team_id, year_id)
+    if comparison_df.empty:
+        return _error(f"No batting stats available for team {team_id} in {year_id}.", 404)
+
+    return jsonify({
+        'team': {
+            'teamID': team['teamID'],
+            'name': team['name'],
+            'lgID': team['lgID'],
+            'franchID': team['franchID'],
+        },
+        'year': year_id,
+        'rows': len(comparison_df),
+        'fields': fields,
+        'columns': {name: _column_values(name, comparison_df[name]) for name in fields},
+    })
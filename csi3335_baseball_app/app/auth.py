@@ -2,7 +2,7 @@ from flask import Blueprint, flash, redirect, render_template, request, url_for
 from flask_login import current_user, login_required, login_user, logout_user
 from sqlalchemy import select
 
-from . import db
+from . import db, user_cache
 from .forms import LoginForm, RegisterForm
 from .models import User
 
@@ -64,6 +64,7 @@ def login():
 @auth_bp.route('/logout')
 @login_required
 def logout():
+    user_cache.invalidate(current_user.id)
     logout_user()
     flash('You have been logged out.', 'info')
     return redirect(url_for('core.index'))
@@ -0,0 +1,55 @@
+import threading
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .registry import query_registry
+from .snapshot import snapshot
+
+
+class AwardIndex:
+    def __init__(self):
+        self._indexes: Optional[tuple[pd.Index, pd.MultiIndex]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> tuple[pd.Index, pd.MultiIndex]:
+        if snapshot.available():
+            inductees, all_stars = snapshot.award_frames()
+        else:
+            inductees = query_registry.frame('HALL_OF_FAME_INDUCTEES')
+            all_stars = query_registry.frame('ALL_STAR_SEASONS')
+        return (
+            pd.Index(inductees['playerID']),
+            pd.MultiIndex.from_arrays([all_stars['playerID'], all_stars['yearID'].astype(int)]),
+        )
+
+    def indexes(self) -> tuple[pd.Index, pd.MultiIndex]:
+        if self._indexes is None:
+            with self._lock:
+                if self._indexes is None:
+                    self._indexes = self._load()
+        return self._indexes
+
+    def hall_of_famer(self, player_ids) -> np.ndarray:
+        inductees, _ = self.indexes()
+        return pd.Index(player_ids).isin(inductees).astype(int)
+
+    def all_star(self, player_ids, year_ids) -> np.ndarray:
+        # year_ids is one season or a per-row array, matching _derive_player_batting.
+        _, seasons = self.indexes()
+        player_ids = np.asarray(player_ids, dtype=object)
+        year_ids = np.broadcast_to(np.asarray(year_ids).astype(int), player_ids.shape)
+        return pd.MultiIndex.from_arrays([player_ids, year_ids]).isin(seasons).astype(int)
+
+    def attach(self, frame: pd.DataFrame, year_ids) -> pd.DataFrame:
+        frame['hall_of_famer'] = self.hall_of_famer(frame['playerID'])
+        frame['all_star'] = self.all_star(frame['playerID'], year_ids)
+        return frame
+
+    def reload(self) -> None:
+        with self._lock:
+            self._indexes = None
+
+
+award_index = AwardIndex()
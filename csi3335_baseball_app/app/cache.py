@@ -0,0 +1,142 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+_MISSING = object()
+
+
+class LRUCache:
+    def __init__(
+        self,
+        config_key: Optional[str] = None,
+        maxsize: int = 128,
+        bytes_config_key: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        weigh: Optional[Callable[[Any], int]] = None,
+        ttl_config_key: Optional[str] = None,
+        ttl: Optional[float] = None,
+    ):
+        self.config_key = config_key
+        self.maxsize = maxsize
+        # Optional memory bound: entries are weighed on insert and the oldest are
+        # evicted until the total fits, in addition to the entry-count bound.
+        self.bytes_config_key = bytes_config_key
+        self.max_bytes = max_bytes
+        self.weigh = weigh
+        # Optional time bound in seconds: an entry older than this reads as a miss.
+        self.ttl_config_key = ttl_config_key
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.total_bytes = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._weights: dict = {}
+        self._expires: dict = {}
+        self._lock = threading.RLock()
+
+    def init_app(self, app) -> None:
+        if self.config_key:
+            self.maxsize = int(app.config.setdefault(self.config_key, self.maxsize))
+        if self.bytes_config_key:
+            self.max_bytes = int(app.config.setdefault(self.bytes_config_key, self.max_bytes))
+        if self.ttl_config_key:
+            self.ttl = float(app.config.setdefault(self.ttl_config_key, self.ttl))
+        self.clear()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is not _MISSING and key in self._expires and self._expires[key] <= time.monotonic():
+                self._discard(key)
+                self.expirations += 1
+                value = _MISSING
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        weight = self.weigh(value) if self.weigh else 0
+        if self.max_bytes is not None and weight > self.max_bytes:
+            return
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = value
+            self._weights[key] = weight
+            self.total_bytes += weight
+            if self.ttl is not None:
+                self._expires[key] = time.monotonic() + self.ttl
+            while len(self._entries) > self.maxsize or (
+                self.max_bytes is not None and self.total_bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self.evictions += 1
+
+    def _discard(self, key: Hashable) -> bool:
+        if self._entries.pop(key, _MISSING) is _MISSING:
+            return False
+        self.total_bytes -= self._weights.pop(key, 0)
+        self._expires.pop(key, None)
+        return True
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            # Computed outside the lock so a slow miss never blocks readers of other keys.
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._discard(key)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        with self._lock:
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                self._discard(key)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._weights.clear()
+            self._expires.clear()
+            self.total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'ttl': self.ttl,
+                'expirations': self.expirations,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,89 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from . import player_career_cache
+from .awards import award_index
+from .league import league_baselines
+from .materialized import player_seasons_available
+from .registry import query_registry
+from .stats import COUNTING_COLUMNS, add_rate_columns, ops_plus
+
+
+class PlayerCareer:
+    # One row per season (stints and teams summed) plus running totals, so any
+    # year-range total is prefix[end] - prefix[start] rather than a new GROUP BY.
+    def __init__(self, player_id: str, player_name: str, birth_year, seasons: pd.DataFrame):
+        self.player_id = player_id
+        self.player_name = player_name
+        self.birth_year = None if pd.isna(birth_year) or birth_year <= 0 else int(birth_year)
+        self.years = seasons.index.to_numpy(dtype=int)
+        self.teams = seasons['teams'].tolist()
+        self.hall_of_famer = bool(seasons['hall_of_famer'].any())
+        self.all_star_years = self.years[seasons['all_star'].to_numpy() > 0].tolist()
+        self.counts = seasons[COUNTING_COLUMNS].to_numpy(dtype=float)
+        self.prefix = np.vstack([np.zeros((1, len(COUNTING_COLUMNS))), np.cumsum(self.counts, axis=0)])
+
+    @property
+    def first_year(self) -> int:
+        return int(self.years[0])
+
+    @property
+    def last_year(self) -> int:
+        return int(self.years[-1])
+
+    def range_totals(self, start_year: int, end_year: int) -> pd.Series:
+        start = np.searchsorted(self.years, start_year, side='left')
+        end = np.searchsorted(self.years, end_year, side='right')
+        totals = pd.Series(self.prefix[end] - self.prefix[start], index=COUNTING_COLUMNS)
+        totals['seasons'] = end - start
+        return totals
+
+    def season_frame(self) -> pd.DataFrame:
+        seasons = pd.DataFrame(self.counts, columns=COUNTING_COLUMNS)
+        seasons.insert(0, 'yearID', self.years)
+        seasons.insert(1, 'teams', self.teams)
+        add_rate_columns(seasons)
+
+        league = league_baselines.for_years(self.years)
+        seasons['ops_plus'] = np.where(
+            seasons['plate_appearances'] > 0,
+            ops_plus(seasons['obp'], seasons['slg'], league['obp'].to_numpy(), league['slg'].to_numpy()),
+            np.nan,
+        )
+
+        cumulative = add_rate_columns(pd.DataFrame(self.prefix[1:], columns=COUNTING_COLUMNS))
+        for column in ('avg', 'obp', 'slg', 'ops'):
+            seasons[f'career_{column}'] = cumulative[column].to_numpy()
+        return seasons
+
+
+def _load_player_career(player_id: str) -> Optional[PlayerCareer]:
+    materialized = player_seasons_available()
+    career_query = 'PLAYER_CAREER_BATTING_MATERIALIZED' if materialized else 'PLAYER_CAREER_BATTING'
+    dataframe = query_registry.frame(career_query, {'playerId': player_id})
+    if dataframe.empty:
+        return None
+
+    dataframe[COUNTING_COLUMNS] = dataframe[COUNTING_COLUMNS].fillna(0)
+    if not materialized:
+        award_index.attach(dataframe, dataframe['yearID'])
+
+    aggregations = {column: 'sum' for column in COUNTING_COLUMNS}
+    aggregations.update({'hall_of_famer': 'max', 'all_star': 'max', 'teamID': ' / '.join})
+    seasons = dataframe.groupby('yearID', sort=True).agg(aggregations).rename(columns={'teamID': 'teams'})
+
+    first = dataframe.iloc[0]
+    return PlayerCareer(player_id, first['player_name'] or player_id, first['birthYear'], seasons)
+
+
+def player_career(player_id: str) -> Optional[PlayerCareer]:
+    # Careers never change between data loads. Unknown IDs are not cached, so requests for
+    # random /player/<id> URLs cannot evict real careers.
+    career = player_career_cache.get(player_id)
+    if career is None:
+        career = _load_player_career(player_id)
+        if career is not None:
+            player_career_cache.set(player_id, career)
+    return career
@@ -0,0 +1,23 @@
+from typing import Optional
+
+from flask import g
+from sqlalchemy.engine import Connection
+
+from .replicas import replicas
+
+
+def get_connection() -> Connection:
+    # One pooled connection per app context, shared by every query helper and
+    # returned to the pool when the context tears down. It comes from a read replica
+    # when any are configured.
+    connection = g.get('db_connection')
+    if connection is None:
+        connection = replicas.connect()
+        g.db_connection = connection
+    return connection
+
+
+def close_connection(exception: Optional[BaseException] = None) -> None:
+    connection = g.pop('db_connection', None)
+    if connection is not None:
+        connection.close()
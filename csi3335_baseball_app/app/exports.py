@@ -0,0 +1,70 @@
+from typing import Iterable, Iterator
+
+import pandas as pd
+from flask import Response, stream_with_context
+
+TEAM_EXPORT_COLUMNS = [
+    ('Player ID', 'playerID'),
+    ('Player', 'player_name'),
+    ('Age', 'age_export'),
+    ('Games', 'games'),
+    ('At Bats', 'at_bats'),
+    ('Hits', 'hits'),
+    ('Doubles', 'doubles'),
+    ('Triples', 'triples'),
+    ('Home Runs', 'home_runs'),
+    ('RBIs', 'runs_batted_in'),
+    ('Walks', 'walks'),
+    ('Strikeouts', 'strikeouts'),
+    ('Stolen Bases', 'stolen_bases'),
+    ('Caught Stealing', 'caught_stealing'),
+    ('SB%', 'sb_pct_display'),
+    ('AVG', 'avg_display'),
+    ('OBP', 'obp_display'),
+    ('SLG', 'slg_display'),
+    ('OPS', 'ops_display'),
+    ('OPS+', 'ops_plus_display'),
+    ('Hall of Fame', 'hall_of_famer_display'),
+    ('All-Star', 'all_star_display'),
+    ('Badges', 'badges_text'),
+]
+
+BULK_EXPORT_COLUMNS = [('Season', 'yearID'), ('Team ID', 'teamID')] + TEAM_EXPORT_COLUMNS
+
+_INTEGER_SOURCES = {
+    'yearID',
+    'games',
+    'at_bats',
+    'hits',
+    'doubles',
+    'triples',
+    'home_runs',
+    'runs_batted_in',
+    'walks',
+    'strikeouts',
+    'stolen_bases',
+    'caught_stealing',
+}
+
+
+def export_frame(frame: pd.DataFrame, columns: list[tuple[str, str]]) -> pd.DataFrame:
+    data = {}
+    for header, source in columns:
+        series = frame[source]
+        data[header] = series.astype(int) if source in _INTEGER_SOURCES else series
+    return pd.DataFrame(data)
+
+
+def csv_chunks(headers: list[str], frames: Iterable[pd.DataFrame], chunk_rows: int) -> Iterator[str]:
+    # Header goes out before the first query row is read so the client sees bytes immediately.
+    yield pd.DataFrame(columns=headers).to_csv(index=False)
+    for frame in frames:
+        for start in range(0, len(frame), chunk_rows):
+            yield frame.iloc[start:start + chunk_rows].to_csv(index=False, header=False)
+
+
+def csv_response(filename: str, chunks: Iterator[str]) -> Response:
+    response = Response(stream_with_context(chunks))
+    response.headers['Content-Type'] = 'text/csv'
+    response.headers['Content-Disposition'] = f'attachment; filename={filename}'
+    return response
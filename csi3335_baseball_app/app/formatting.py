@@ -0,0 +1,139 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from markupsafe import escape
+
+MISSING = '—'
+
+# Precomputed strings for every rounded step 0 .. _TABLE_LIMIT at a given precision.
+# Formatting a column becomes one rint plus one fancy-index lookup instead of a
+# Python call per cell; anything off the table or sitting on a .5 rounding tie
+# falls back to str.format so output stays byte-identical to f"{value:.3f}".
+_TABLE_LIMIT = 20000
+
+FORMATTED_COLUMNS = [
+    'age_display',
+    'age_export',
+    'sb_pct_display',
+    'avg_display',
+    'obp_display',
+    'slg_display',
+    'ops_display',
+    'ops_plus_display',
+    'hall_of_famer_display',
+    'all_star_display',
+    'badges_html',
+    'badges_text',
+]
+
+
+@lru_cache(maxsize=None)
+def _lookup_table(decimals: int) -> np.ndarray:
+    scale = 10 ** decimals
+    return np.array([f"{step / scale:.{decimals}f}" for step in range(_TABLE_LIMIT + 1)])
+
+
+def format_fixed(values, decimals: int, missing: str = MISSING, suffix: str = '') -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    magnitude = np.abs(values) * (10 ** decimals)
+    missing_mask = np.isnan(values)
+    steps = np.rint(np.where(missing_mask, 0, magnitude))
+
+    fallback = ~missing_mask & (
+        (steps > _TABLE_LIMIT) | (np.abs(magnitude - np.floor(magnitude) - 0.5) < 1e-6)
+    )
+    lookup = _lookup_table(decimals)
+    text = lookup[np.where(fallback, 0, steps).astype(np.intp)].astype(object)
+    if fallback.any():
+        text[fallback] = [f"{value:.{decimals}f}" for value in np.abs(values[fallback])]
+
+    negative = np.signbit(values) & ~missing_mask
+    if negative.any():
+        text[negative] = '-' + text[negative]
+    if suffix:
+        text = text + suffix
+    text[missing_mask] = missing
+    return text
+
+
+def format_rate(values, missing: str = MISSING) -> np.ndarray:
+    return format_fixed(values, 3, missing)
+
+
+def format_percent(values, missing: str = MISSING) -> np.ndarray:
+    return format_fixed(np.asarray(values, dtype=float) * 100, 1, missing, suffix='%')
+
+
+def format_index(values, missing: str = MISSING) -> np.ndarray:
+    return format_fixed(values, 0, missing)
+
+
+def format_difference(values, decimals: int, suffix: str = '') -> tuple[np.ndarray, np.ndarray]:
+    # Signed differences plus their CSS class; anything that rounds to zero is shown
+    # unsigned as 'even', and missing values become MISSING.
+    values = np.asarray(values, dtype=float)
+    magnitude = format_fixed(np.abs(values), decimals, missing='')
+    missing_mask = np.isnan(values)
+    even = missing_mask | (magnitude == f"{0:.{decimals}f}")
+    sign = np.where(even, '', np.where(values > 0, '+', '-')).astype(object)
+    text = sign + magnitude + suffix
+    text[missing_mask] = MISSING
+    classes = np.where(even, 'even', np.where(values > 0, 'positive', 'negative')).astype(object)
+    return text, classes
+
+
+def format_whole(values, missing: str = MISSING) -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    missing_mask = np.isnan(values)
+    text = np.where(missing_mask, 0, values).astype(np.int64).astype(str).astype(object)
+    text[missing_mask] = missing
+    return text
+
+
+def format_flag(values, yes: str = 'Yes', no: str = 'No') -> np.ndarray:
+    return np.where(np.asarray(values).astype(bool), yes, no).astype(object)
+
+
+def badge_columns(hall_of_famer, all_star, year_id) -> tuple[np.ndarray, np.ndarray]:
+    hof = np.asarray(hall_of_famer).astype(bool)
+    star = np.asarray(all_star).astype(bool)
+    # year_id is one season for a team page or a per-row array for multi-season exports.
+    all_star_text = 'All-Star ' + np.broadcast_to(np.asarray(year_id).astype(int).astype(str), hof.shape).astype(object)
+
+    html = np.where(hof, '<span class="badge badge-hof">Hall of Fame</span>', '').astype(object)
+    html = html + np.where(hof & star, ' ', '')
+    html = html + np.where(star, '<span class="badge badge-allstar">' + all_star_text + '</span>', '')
+
+    text = np.where(hof, 'Hall of Fame', '').astype(object)
+    text = text + np.where(hof & star, ', ', '')
+    text = text + np.where(star, all_star_text, '')
+    return html, text
+
+
+def player_links(player_ids, names, base_url: str) -> np.ndarray:
+    # base_url is url_for('core.player_view', player_id=''); playerIDs are URL-safe.
+    ids = np.asarray(player_ids).astype(str).astype(object)
+    labels = np.array([str(escape(name)) if isinstance(name, str) else '' for name in names], dtype=object)
+    return '<a href="' + base_url + ids + '">' + labels + '</a>'
+
+
+def formatted_batting_columns(frame: pd.DataFrame, year_id) -> pd.DataFrame:
+    badges_html, badges_text = badge_columns(frame['hall_of_famer'], frame['all_star'], year_id)
+    return pd.DataFrame(
+        {
+            'age_display': format_whole(frame['age']),
+            'age_export': format_whole(frame['age'], missing=''),
+            'sb_pct_display': format_percent(frame['sb_pct']),
+            'avg_display': format_rate(frame['avg']),
+            'obp_display': format_rate(frame['obp']),
+            'slg_display': format_rate(frame['slg']),
+            'ops_display': format_rate(frame['ops']),
+            'ops_plus_display': format_index(frame['ops_plus']),
+            'hall_of_famer_display': format_flag(frame['hall_of_famer']),
+            'all_star_display': format_flag(frame['all_star']),
+            'badges_html': badges_html,
+            'badges_text': badges_text,
+        },
+        index=frame.index,
+    )
@@ -1,6 +1,8 @@
 from flask_wtf import FlaskForm
 from wtforms import BooleanField, IntegerField, PasswordField, SelectField, StringField, SubmitField
-from wtforms.validators import DataRequired, Email, EqualTo, Length, NumberRange
+from wtforms.validators import DataRequired, Email, EqualTo, Length, ValidationError
+
+from .seasons import season_directory
 
 
 class RegisterForm(FlaskForm):
@@ -18,10 +20,26 @@ class LoginForm(FlaskForm):
     submit = SubmitField('Sign In')
 
 
+class SeasonRange:
+    # Bounds come from the loaded season directory instead of a hardcoded range.
+    def __call__(self, form, field):
+        first, last = season_directory.bounds()
+        if field.data is not None and not first <= field.data <= last:
+            raise ValidationError(f"Year must be between {first} and {last}")
+
+
+class SeasonYearField(IntegerField):
+    def __call__(self, **kwargs):
+        first, last = season_directory.bounds()
+        kwargs.setdefault('min', first)
+        kwargs.setdefault('max', last)
+        return super().__call__(**kwargs)
+
+
 class TeamYearForm(FlaskForm):
-    year = IntegerField(
+    year = SeasonYearField(
         'Season Year',
-        validators=[DataRequired(), NumberRange(min=1871, max=2024, message='Year must be between 1871 and 2024')],
+        validators=[DataRequired(), SeasonRange()],
     )
     team_id = SelectField('Team', choices=[], validators=[DataRequired(message='Select a team')], coerce=str)
     submit_load = SubmitField('Load Teams')
@@ -35,9 +53,9 @@ class PlayerCompareForm(FlaskForm):
 
 
 class TeamCompareForm(FlaskForm):
-    year = IntegerField(
+    year = SeasonYearField(
         'Season Year',
-        validators=[DataRequired(), NumberRange(min=1871, max=2024, message='Year must be between 1871 and 2024')],
+        validators=[DataRequired(), SeasonRange()],
     )
     team_one = SelectField('Team One', choices=[], validators=[DataRequired()], coerce=str)
     team_two = SelectField('Team Two', choices=[], validators=[DataRequired()], coerce=str)
@@ -0,0 +1,62 @@
+import hashlib
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Optional
+
+from flask import current_app, make_response, request
+
+
+def dataset_etag(kind: str, view_args: dict) -> str:
+    # Both versions go in the key: new data or new page markup must both change the validator.
+    versions = [current_app.config['DATASET_VERSION'], current_app.config['TEMPLATE_VERSION']]
+    key = ':'.join(versions + [kind] + [f"{name}={view_args[name]}" for name in sorted(view_args)])
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]
+
+
+def _dataset_last_modified() -> Optional[datetime]:
+    value = current_app.config.get('DATASET_LAST_MODIFIED')
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _apply_validators(response, etag: str, last_modified: Optional[datetime]):
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.headers['Cache-Control'] = current_app.config['DATASET_CACHE_CONTROL']
+    response.vary.add('Cookie')
+    return response
+
+
+def conditional_dataset_response(kind: str, query_args: tuple[str, ...] = ()):
+    # Answers If-None-Match / If-Modified-Since with 304 before the view runs any query.
+    # Place below @login_required so anonymous requests still get redirected.
+    # query_args names the query-string parameters that change the body and so the ETag.
+    def decorator(view):
+        @wraps(view)
+        def wrapped(*args, **kwargs):
+            key_args = dict(kwargs)
+            for name in query_args:
+                key_args[f'?{name}'] = request.args.get(name, '')
+            etag = dataset_etag(kind, key_args)
+            last_modified = _dataset_last_modified()
+
+            if request.if_none_match:
+                not_modified = request.if_none_match.contains(etag)
+            else:
+                since = request.if_modified_since
+                not_modified = bool(last_modified and since and last_modified.replace(microsecond=0) <= since)
+            if not_modified:
+                return _apply_validators(current_app.response_class(status=304), etag, last_modified)
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                _apply_validators(response, etag, last_modified)
+            return response
+
+        return wrapped
+
+    return decorator
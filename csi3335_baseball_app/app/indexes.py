@@ -0,0 +1,121 @@
+import re
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import bindparam, inspect, text
+
+from . import db
+from . import queries
+
+# Statements that read every row on purpose: random sampling, whole-table counts, the
+# one-off leaderboard and season directory loads, and the snapshot export.
+FULL_SCAN_EXPECTED = {
+    'ALL_PLAYER_SEASONS',
+    'ALL_PLAYER_SEASONS_MATERIALIZED',
+    'SEASON_TEAM_DIRECTORY',
+    'SNAPSHOT_BATTING',
+    'SNAPSHOT_PEOPLE',
+    'SNAPSHOT_TEAMS',
+    'TRIVIA_PLAYER_SEASON_SAMPLE',
+    'TRIVIA_PLAYER_SEASON_SAMPLE_MATERIALIZED',
+    'PLAYER_SEASON_BATTING_COUNT',
+}
+
+_SQLITE_SCAN = re.compile(r'^SCAN (?:TABLE )?(\w+)')
+
+
+def select_statements() -> list[tuple[str, str]]:
+    return [
+        (name, value)
+        for name, value in vars(queries).items()
+        if name.isupper() and isinstance(value, str) and value.lstrip().upper().startswith('SELECT')
+    ]
+
+
+def _sample_params(connection) -> dict:
+    team = connection.execute(text(queries.LATEST_TEAM_SEASON)).mappings().first()
+    if team is None:
+        raise click.ClickException('The teams table is empty; load the baseball data first.')
+    return {
+        'teamId': team['teamID'],
+        'yearId': team['yearID'],
+        'franchId': team['franchID'],
+        'teamIds': [team['teamID']],
+        'yearIds': [team['yearID']],
+        'sampleSize': 10,
+        # Plans depend on the indexes, not the value, so any well-formed ID will do.
+        'playerId': 'aaronha01',
+    }
+
+
+def _explain_clause(prefix: str, statement: str, params: dict):
+    used = {name: value for name, value in params.items() if re.search(rf':{name}\b', statement)}
+    clause = text(prefix + statement)
+    expanding = [bindparam(name, expanding=True) for name, value in used.items() if isinstance(value, list)]
+    if expanding:
+        clause = clause.bindparams(*expanding)
+    return clause, used
+
+
+def explain_full_scans(connection, statement: str, params: dict) -> tuple[list[str], list[str]]:
+    # Returns the plan lines plus the base tables the plan reads front to back.
+    if connection.dialect.name == 'sqlite':
+        clause, used = _explain_clause('EXPLAIN QUERY PLAN ', statement, params)
+        details = [row[-1] for row in connection.execute(clause, used)]
+        scans = []
+        for detail in details:
+            match = _SQLITE_SCAN.match(detail)
+            # SCAN ... USING COVERING INDEX reads only the index, like MariaDB's "Using index".
+            if match and 'COVERING INDEX' not in detail and match.group(1) != 'CONSTANT':
+                scans.append(match.group(1))
+        return details, scans
+
+    clause, used = _explain_clause('EXPLAIN ', statement, params)
+    rows = connection.execute(clause, used).mappings().all()
+    details = [
+        f"{row['table']}: type={row['type']} key={row['key']} rows={row['rows']} {row['Extra'] or ''}".rstrip()
+        for row in rows
+    ]
+    # <derived2> / <subquery3> rows read an intermediate result, not a base table. A full
+    # index scan only counts as indexed when the index covers the query ("Using index").
+    scans = [
+        row['table']
+        for row in rows
+        if not str(row['table']).startswith('<')
+        and (row['type'] == 'ALL' or (row['type'] == 'index' and 'Using index' not in (row['Extra'] or '')))
+    ]
+    return details, scans
+
+
+@click.command('check-indexes')
+@click.option('--verbose', is_flag=True, help='Print the full plan for every statement.')
+@with_appcontext
+def check_indexes_command(verbose: bool) -> None:
+    """EXPLAIN every SELECT in app/queries.py and fail on unexpected full table scans."""
+    failures = []
+    with db.engine.connect() as connection:
+        params = _sample_params(connection)
+        has_player_seasons = inspect(connection).has_table(queries.PLAYER_SEASON_TABLE)
+        for name, statement in select_statements():
+            if queries.PLAYER_SEASON_TABLE in statement and not has_player_seasons:
+                click.echo(f"{name:<42} skipped (run flask build-player-seasons first)")
+                continue
+            details, scans = explain_full_scans(connection, statement, params)
+            if not scans:
+                status = 'ok'
+            elif name in FULL_SCAN_EXPECTED:
+                status = f"full scan of {', '.join(scans)} (expected)"
+            else:
+                status = f"FULL SCAN of {', '.join(scans)}"
+                failures.append(name)
+            click.echo(f"{name:<42} {status}")
+            if verbose or (scans and name not in FULL_SCAN_EXPECTED):
+                for line in details:
+                    click.echo(f"    {line}")
+
+    if failures:
+        raise click.ClickException(
+            f"{len(failures)} queries fall back to full table scans: {', '.join(failures)}. "
+            'Apply the index migrations with flask db upgrade.'
+        )
+    click.echo('Every query reads through an index.')
@@ -0,0 +1,145 @@
+import threading
+import time
+from collections import defaultdict, deque
+
+import numpy as np
+from flask import g, has_app_context
+from flask_login import current_user
+from sqlalchemy import event
+from sqlalchemy.sql.elements import TextClause
+
+from . import queries
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended.
+HISTOGRAM_BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000]
+
+
+def _query_names() -> dict[str, str]:
+    names = {}
+    for name, value in vars(queries).items():
+        if not name.isupper():
+            continue
+        if isinstance(value, str):
+            names.setdefault(value, name)
+        elif isinstance(value, list):
+            for index, statement in enumerate(value):
+                names.setdefault(statement, f"{name}[{index}]")
+    return names
+
+
+def _statement_tag(clauseelement) -> str:
+    if isinstance(clauseelement, TextClause):
+        return _QUERY_NAMES.get(clauseelement.text, 'TEXT')
+    return f"ORM_{getattr(clauseelement, '__visit_name__', 'statement').upper()}"
+
+
+_QUERY_NAMES = _query_names()
+
+
+class QueryStats:
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self.enabled = True
+        self._samples: dict[str, deque] = {}
+        self._counts: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def init_app(self, app, *engines) -> None:
+        self.window = int(app.config.setdefault('QUERY_STATS_WINDOW', self.window))
+        self.enabled = bool(app.config.setdefault('QUERY_INSTRUMENTATION', self.enabled))
+        self.reset()
+        if not self.enabled:
+            return
+
+        for engine in engines:
+            event.listen(engine, 'before_execute', self._before_execute)
+            event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+            event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+            event.listen(engine, 'handle_error', self._handle_error)
+        app.before_request(self._start_request)
+        app.after_request(self._add_server_timing)
+
+    def _before_execute(self, conn, clauseelement, multiparams, params, execution_options):
+        # Tagged here because only this hook still sees the text() clause, not the compiled SQL.
+        # Registry statements carry their name, since a timeout prefix changes their text.
+        conn.info['query_tag'] = execution_options.get('query_name') or _statement_tag(clauseelement)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info['query_started'].pop()) * 1000
+        tag = conn.info.pop('query_tag', 'OTHER')
+        self.record(tag, elapsed_ms)
+        if has_app_context():
+            timings = g.setdefault('query_timings', [])
+            timings.append((tag, elapsed_ms))
+
+    def _handle_error(self, exception_context) -> None:
+        conn = exception_context.connection
+        if conn is not None and conn.info.get('query_started'):
+            conn.info['query_started'].pop()
+            conn.info.pop('query_tag', None)
+
+    def _start_request(self) -> None:
+        g.request_started = time.perf_counter()
+
+    def _add_server_timing(self, response):
+        # Query names and timings are internal details, so only administrators get the header.
+        from .admin import is_admin
+
+        if not is_admin(current_user):
+            return response
+        # Streamed bodies run their queries after this point, so only setup queries are counted for them.
+        timings = g.get('query_timings', [])
+        by_tag: dict[str, float] = defaultdict(float)
+        for tag, elapsed_ms in timings:
+            by_tag[tag] += elapsed_ms
+        metrics = [f'db;desc="queries: {len(timings)}";dur={sum(by_tag.values()):.2f}']
+        metrics.extend(
+            f'q-{tag.replace("[", "-").replace("]", "")};dur={elapsed_ms:.2f}'
+            for tag, elapsed_ms in sorted(by_tag.items(), key=lambda item: -item[1])
+        )
+        started = g.get('request_started')
+        if started is not None:
+            metrics.append(f'app;dur={(time.perf_counter() - started) * 1000:.2f}')
+        response.headers['Server-Timing'] = ', '.join(metrics)
+        return response
+
+    def record(self, tag: str, elapsed_ms: float) -> None:
+        with self._lock:
+            samples = self._samples.get(tag)
+            if samples is None:
+                samples = self._samples[tag] = deque(maxlen=self.window)
+            samples.append(elapsed_ms)
+            self._counts[tag] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+
+    def summary(self) -> list[dict]:
+        with self._lock:
+            snapshot = {tag: np.array(samples) for tag, samples in self._samples.items()}
+            counts = dict(self._counts)
+
+        edges = np.array(HISTOGRAM_BUCKETS_MS, dtype=float)
+        rows = []
+        for tag, samples in snapshot.items():
+            buckets = np.bincount(np.searchsorted(edges, samples, side='left'), minlength=len(edges) + 1)
+            rows.append({
+                'tag': tag,
+                'count': counts[tag],
+                'window': len(samples),
+                'p50': float(np.percentile(samples, 50)),
+                'p95': float(np.percentile(samples, 95)),
+                'max': float(samples.max()),
+                'total': float(samples.sum()),
+                'histogram': buckets.tolist(),
+            })
+        rows.sort(key=lambda row: row['total'], reverse=True)
+        return rows
+
+
+query_stats = QueryStats()
@@ -0,0 +1,151 @@
+import threading
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .league import league_baselines
+from .materialized import player_seasons_available
+from .registry import query_registry
+from .stats import COUNTING_COLUMNS, add_rate_columns, ops_plus
+
+# stat -> (label, kind). Rate stats are only ranked among hitters who meet the PA threshold.
+LEADERBOARD_STATS = {
+    'ops': ('OPS', 'rate'),
+    'avg': ('AVG', 'rate'),
+    'obp': ('OBP', 'rate'),
+    'slg': ('SLG', 'rate'),
+    'ops_plus': ('OPS+', 'index'),
+    'home_runs': ('Home Runs', 'count'),
+    'runs_batted_in': ('RBIs', 'count'),
+    'hits': ('Hits', 'count'),
+    'doubles': ('Doubles', 'count'),
+    'triples': ('Triples', 'count'),
+    'walks': ('Walks', 'count'),
+    'stolen_bases': ('Stolen Bases', 'count'),
+}
+SCOPES = ('season', 'career')
+
+
+class _Board:
+    # Rows plus, per stat, the row positions in ranking order. Season boards are ordered
+    # by year first, so one season is a contiguous slice found by binary search.
+    def __init__(self, frame: pd.DataFrame, by_year: bool):
+        self.frame = frame.reset_index(drop=True)
+        self.plate_appearances = self.frame['plate_appearances'].to_numpy()
+        self.orders: dict[str, np.ndarray] = {}
+        years = self.frame['yearID'].to_numpy() if by_year else None
+        for stat in LEADERBOARD_STATS:
+            descending = -self.frame[stat].to_numpy(dtype=float)
+            self.orders[stat] = np.lexsort((descending, years)) if by_year else np.argsort(descending, kind='stable')
+        self.sorted_years = np.sort(years) if by_year else None
+
+    def candidates(self, stat: str, year: Optional[int]) -> np.ndarray:
+        order = self.orders[stat]
+        if self.sorted_years is None:
+            return order
+        start = np.searchsorted(self.sorted_years, year, side='left')
+        end = np.searchsorted(self.sorted_years, year, side='right')
+        return order[start:end]
+
+
+def _season_frame(rows: pd.DataFrame) -> pd.DataFrame:
+    rows[COUNTING_COLUMNS] = rows[COUNTING_COLUMNS].fillna(0)
+    aggregations = {column: 'sum' for column in COUNTING_COLUMNS}
+    aggregations.update({'player_name': 'first', 'teamID': ' / '.join})
+    seasons = rows.groupby(['playerID', 'yearID'], sort=True).agg(aggregations).reset_index()
+    seasons = seasons.rename(columns={'teamID': 'teams'})
+    add_rate_columns(seasons)
+
+    league = league_baselines.for_years(seasons['yearID'])
+    seasons['league_obp'] = league['obp'].to_numpy()
+    seasons['league_slg'] = league['slg'].to_numpy()
+    seasons['ops_plus'] = np.where(
+        seasons['plate_appearances'] > 0,
+        ops_plus(seasons['obp'], seasons['slg'], seasons['league_obp'], seasons['league_slg']),
+        np.nan,
+    )
+    return seasons
+
+
+def _career_frame(seasons: pd.DataFrame) -> pd.DataFrame:
+    # Career OPS+ compares against the league averages of the player's own seasons, weighted by PA.
+    weighted = seasons.assign(
+        league_obp_weight=seasons['league_obp'] * seasons['plate_appearances'],
+        league_slg_weight=seasons['league_slg'] * seasons['plate_appearances'],
+    )
+    aggregations = {column: 'sum' for column in COUNTING_COLUMNS + ['league_obp_weight', 'league_slg_weight']}
+    aggregations.update({'player_name': 'first', 'yearID': ['min', 'max', 'count']})
+    careers = weighted.groupby('playerID', sort=True).agg(aggregations)
+    careers.columns = [
+        {'min': 'first_year', 'max': 'last_year', 'count': 'seasons'}.get(how, column)
+        if column == 'yearID' else column
+        for column, how in careers.columns
+    ]
+    careers = careers.reset_index()
+    add_rate_columns(careers)
+
+    plate_appearances = careers['plate_appearances'].to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        league_obp = np.where(plate_appearances > 0, careers['league_obp_weight'] / plate_appearances, 0)
+        league_slg = np.where(plate_appearances > 0, careers['league_slg_weight'] / plate_appearances, 0)
+    careers['ops_plus'] = np.where(plate_appearances > 0, ops_plus(careers['obp'], careers['slg'], league_obp, league_slg), np.nan)
+    return careers
+
+
+class Leaderboards:
+    def __init__(self, season_min_pa: int = 400, career_min_pa: int = 3000):
+        self.min_pa = {'season': season_min_pa, 'career': career_min_pa}
+        self._boards: Optional[dict[str, _Board]] = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        self.min_pa = {
+            'season': int(app.config.setdefault('LEADERBOARD_SEASON_MIN_PA', self.min_pa['season'])),
+            'career': int(app.config.setdefault('LEADERBOARD_CAREER_MIN_PA', self.min_pa['career'])),
+        }
+        self.reload()
+
+    def _load(self) -> dict[str, _Board]:
+        leaders_query = 'ALL_PLAYER_SEASONS_MATERIALIZED' if player_seasons_available() else 'ALL_PLAYER_SEASONS'
+        rows = query_registry.frame(leaders_query)
+        seasons = _season_frame(rows)
+        return {
+            'season': _Board(seasons, by_year=True),
+            'career': _Board(_career_frame(seasons), by_year=False),
+        }
+
+    def boards(self) -> dict[str, _Board]:
+        if self._boards is None:
+            with self._lock:
+                if self._boards is None:
+                    self._boards = self._load()
+        return self._boards
+
+    def last_season(self) -> Optional[int]:
+        years = self.boards()['season'].sorted_years
+        return int(years[-1]) if len(years) else None
+
+    def default_min_pa(self, stat: str, scope: str) -> int:
+        return self.min_pa[scope] if LEADERBOARD_STATS[stat][1] != 'count' else 0
+
+    def leaders(self, stat: str, scope: str = 'season', year: Optional[int] = None,
+                min_pa: int = 0, offset: int = 0, limit: int = 50) -> tuple[pd.DataFrame, int]:
+        # Returns one page of ranked rows (with a rank column) and the number of qualified rows.
+        board = self.boards()[scope]
+        candidates = board.candidates(stat, year)
+        keep = ~np.isnan(board.frame[stat].to_numpy(dtype=float)[candidates])
+        if min_pa > 0:
+            keep &= board.plate_appearances[candidates] >= min_pa
+        qualified = candidates[keep]
+
+        page = board.frame.iloc[qualified[offset:offset + limit]].copy()
+        page.insert(0, 'rank', np.arange(offset + 1, offset + 1 + len(page)))
+        return page, len(qualified)
+
+    def reload(self) -> None:
+        with self._lock:
+            self._boards = None
+
+
+leaderboards = Leaderboards()
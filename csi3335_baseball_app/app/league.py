@@ -0,0 +1,85 @@
+import threading
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .registry import query_registry
+
+_EMPTY_BASELINE = {'avg': 0.0, 'obp': 0.0, 'slg': 0.0, 'ops': 0.0}
+
+
+def _safe_ratio(numerator: pd.Series, denominator: pd.Series) -> np.ndarray:
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros(len(numerator), dtype=float),
+        where=denominator.to_numpy() > 0,
+    )
+
+
+def compute_league_baselines(totals: pd.DataFrame) -> dict[int, dict]:
+    if totals.empty:
+        return {}
+    totals = totals.fillna(0).astype(float)
+    singles = totals['hits'] - totals['doubles'] - totals['triples'] - totals['home_runs']
+    total_bases = singles + 2 * totals['doubles'] + 3 * totals['triples'] + 4 * totals['home_runs']
+    plate_appearances = totals['at_bats'] + totals['walks'] + totals['hit_by_pitch'] + totals['sacrifice_flies']
+
+    baselines = pd.DataFrame(index=totals.index.astype(int))
+    baselines['avg'] = _safe_ratio(totals['hits'], totals['at_bats'])
+    baselines['obp'] = _safe_ratio(totals['hits'] + totals['walks'] + totals['hit_by_pitch'], plate_appearances)
+    baselines['slg'] = _safe_ratio(total_bases, totals['at_bats'])
+    baselines['ops'] = baselines['obp'] + baselines['slg']
+    return baselines.to_dict(orient='index')
+
+
+class LeagueBaselines:
+    def __init__(self):
+        self._baselines: Optional[dict[int, dict]] = None
+        self._table: Optional[tuple[np.ndarray, np.ndarray]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[int, dict]:
+        totals = query_registry.frame('LEAGUE_BATTING_BY_YEAR', index_col='yearID')
+        return compute_league_baselines(totals)
+
+    def all(self) -> dict[int, dict]:
+        if self._baselines is None:
+            with self._lock:
+                if self._baselines is None:
+                    self._baselines = self._load()
+        return self._baselines
+
+    def for_year(self, year_id: int) -> dict:
+        return self.all().get(int(year_id), _EMPTY_BASELINE)
+
+    def _year_table(self) -> tuple[np.ndarray, np.ndarray]:
+        # Sorted years and their baseline rows. Looked up with searchsorted rather than a shared
+        # pandas index, whose lazily built hash table is not safe to probe from several threads.
+        if self._table is None:
+            baselines = self.all()
+            with self._lock:
+                if self._table is None:
+                    years = np.array(sorted(baselines), dtype=int)
+                    values = np.array([[baselines[year][key] for key in _EMPTY_BASELINE] for year in years], dtype=float)
+                    self._table = years, values.reshape(len(years), len(_EMPTY_BASELINE))
+        return self._table
+
+    def for_years(self, year_ids) -> pd.DataFrame:
+        years, values = self._year_table()
+        year_ids = np.asarray(year_ids, dtype=int)
+        rows = np.zeros((len(year_ids), len(_EMPTY_BASELINE)))
+        if len(years):
+            positions = np.minimum(np.searchsorted(years, year_ids), len(years) - 1)
+            found = years[positions] == year_ids
+            rows[found] = values[positions[found]]
+        return pd.DataFrame(rows, index=year_ids, columns=list(_EMPTY_BASELINE))
+
+    def reload(self) -> None:
+        with self._lock:
+            self._baselines = None
+            self._table = None
+
+
+league_baselines = LeagueBaselines()
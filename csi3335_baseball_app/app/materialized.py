@@ -0,0 +1,75 @@
+import threading
+import time
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import inspect, text
+
+from . import db
+from . import queries
+from .connection import get_connection
+
+_lock = threading.Lock()
+_availability: dict = {}
+
+
+def player_seasons_available() -> bool:
+    # Checked once per process; restart workers after the first build to pick the table up.
+    with _lock:
+        if 'player_seasons' not in _availability:
+            _availability['player_seasons'] = inspect(get_connection()).has_table(queries.PLAYER_SEASON_TABLE)
+        return _availability['player_seasons']
+
+
+def reset_availability() -> None:
+    with _lock:
+        _availability.clear()
+
+
+def _create_player_seasons(connection, table: str) -> None:
+    connection.execute(text(queries.PLAYER_SEASON_BATTING_DROP.format(table=table)))
+    connection.execute(text(queries.PLAYER_SEASON_BATTING_BUILD.format(table=table)))
+    for statement in queries.PLAYER_SEASON_BATTING_INDEXES:
+        connection.execute(text(statement.format(table=table)))
+
+
+def build_player_seasons() -> int:
+    if db.engine.dialect.name == 'sqlite':
+        # pysqlite commits DDL as soon as it runs, so its own transaction handling is turned
+        # off and the rebuild runs in place inside an explicit BEGIN; readers keep seeing the
+        # old table until the COMMIT. (Index names are schema-wide, so there is no swap here.)
+        with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+            connection.exec_driver_sql('BEGIN IMMEDIATE')
+            try:
+                _create_player_seasons(connection, queries.PLAYER_SEASON_TABLE)
+            except BaseException:
+                connection.exec_driver_sql('ROLLBACK')
+                raise
+            connection.exec_driver_sql('COMMIT')
+    else:
+        # MariaDB commits every DDL statement on its own, so the new table is built and
+        # indexed beside the live one and swapped in with a single RENAME TABLE.
+        with db.engine.connect() as connection:
+            connection.execute(text(queries.PLAYER_SEASON_BATTING_DROP.format(table=queries.PLAYER_SEASON_OLD_TABLE)))
+            _create_player_seasons(connection, queries.PLAYER_SEASON_BUILD_TABLE)
+            if inspect(connection).has_table(queries.PLAYER_SEASON_TABLE):
+                connection.execute(text(queries.PLAYER_SEASON_BATTING_SWAP))
+            else:
+                connection.execute(text(queries.PLAYER_SEASON_BATTING_PUBLISH))
+            connection.execute(text(queries.PLAYER_SEASON_BATTING_DROP.format(table=queries.PLAYER_SEASON_OLD_TABLE)))
+            connection.commit()
+
+    with db.engine.connect() as connection:
+        row_count = connection.execute(text(queries.PLAYER_SEASON_BATTING_COUNT)).scalar_one()
+    reset_availability()
+    return int(row_count)
+
+
+@click.command('build-player-seasons')
+@with_appcontext
+def build_player_seasons_command() -> None:
+    """Build or refresh the pre-aggregated player_season_batting table."""
+    started = time.perf_counter()
+    row_count = build_player_seasons()
+    elapsed = time.perf_counter() - started
+    click.echo(f"Built {queries.PLAYER_SEASON_TABLE} with {row_count} rows in {elapsed:.1f}s.")
@@ -1,9 +1,11 @@
 from datetime import datetime
 
 from flask_login import UserMixin
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
 from werkzeug.security import check_password_hash, generate_password_hash
 
-from . import db
+from . import db, user_cache
 
 
 class User(UserMixin, db.Model):
@@ -26,3 +28,35 @@ class User(UserMixin, db.Model):
 
     def check_password(self, password: str) -> bool:
         return check_password_hash(self.pw_hash, password)
+
+
+class SessionUser(UserMixin):
+    # Detached copy of the fields a request needs; safe to cache and share between threads.
+    def __init__(self, id: int, username: str, email: str):
+        self.id = id
+        self.username = username
+        self.email = email
+
+    @classmethod
+    def from_user(cls, user: User) -> 'SessionUser':
+        return cls(user.id, user.username, user.email)
+
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _collect_changed_user(mapper, connection, target: User) -> None:
+    # Flush runs before commit, so a concurrent load could still cache the old row here;
+    # the ids are dropped from the cache once the change is committed.
+    object_session(target).info.setdefault('changed_user_ids', set()).add(target.id)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_cached_users(session: Session) -> None:
+    # Only this process's cache is cleared; other workers catch up within USER_CACHE_TTL.
+    for user_id in session.info.pop('changed_user_ids', ()):
+        user_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _forget_changed_users(session: Session) -> None:
+    session.info.pop('changed_user_ids', None)
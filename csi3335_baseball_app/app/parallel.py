@@ -0,0 +1,73 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
+
+from flask import current_app, g, has_request_context
+from flask.globals import request_ctx
+
+# Set on pool threads, so helpers that call run() again from a worker run their calls inline
+# instead of waiting on slots held by their own callers.
+_worker_state = threading.local()
+
+
+class QueryExecutor:
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        self.max_workers = int(app.config.setdefault('QUERY_EXECUTOR_WORKERS', self.max_workers))
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='query')
+        return self._executor
+
+    @staticmethod
+    def _call_in_context(context, call: Callable[[], Any]) -> tuple[Any, list]:
+        # Each worker context has its own g, so get_connection() checks out a separate pooled
+        # connection and close_connection() returns it when the context pops.
+        _worker_state.active = True
+        try:
+            with context:
+                return call(), g.get('query_timings', [])
+        finally:
+            _worker_state.active = False
+
+    def run(self, *calls: Callable[[], Any]) -> list[Any]:
+        # Runs independent helpers at once and returns their results in order. The first call
+        # stays on this thread; the rest get a copy of the current request context (helpers only
+        # read the request, for url_for) or a fresh app context outside requests.
+        if self.max_workers <= 0 or len(calls) < 2 or getattr(_worker_state, 'active', False):
+            return [call() for call in calls]
+
+        if has_request_context():
+            contexts = [request_ctx.copy() for _ in calls[1:]]
+        else:
+            app = current_app._get_current_object()
+            contexts = [app.app_context() for _ in calls[1:]]
+        futures = [
+            self._pool().submit(self._call_in_context, context, call)
+            for context, call in zip(contexts, calls[1:])
+        ]
+
+        try:
+            results = [calls[0]()]
+        finally:
+            wait(futures)
+        outcomes = [future.result() for future in futures]
+        timings = g.setdefault('query_timings', [])
+        for result, worker_timings in outcomes:
+            timings.extend(worker_timings)
+            results.append(result)
+        return results
+
+
+query_executor = QueryExecutor()
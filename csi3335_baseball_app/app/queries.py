@@ -1,8 +1,7 @@
-TEAM_IDS_FOR_YEAR = """
-SELECT teamID, team_name AS name
+SEASON_TEAM_DIRECTORY = """
+SELECT yearID, teamID, team_name AS name
 FROM teams
-WHERE yearID = :yearId
-ORDER BY teamID;
+ORDER BY yearID, teamID;
 """
 
 TEAM_INFO = """
@@ -37,31 +36,139 @@ SELECT
     SUM(b.b_CS) AS caught_stealing,
     SUM(b.b_HBP) AS hit_by_pitch,
     SUM(b.b_SF) AS sacrifice_flies,
-    SUM(b.b_SH) AS sacrifice_hits,
-    MAX(CASE WHEN hof.inducted = 'Y' THEN 1 ELSE 0 END) AS hall_of_famer,
-    MAX(CASE WHEN af.playerID IS NOT NULL THEN 1 ELSE 0 END) AS all_star
+    SUM(b.b_SH) AS sacrifice_hits
 FROM batting AS b
 INNER JOIN people AS p ON b.playerID = p.playerID
-LEFT JOIN halloffame AS hof
-       ON hof.playerID = b.playerID
-      AND hof.inducted = 'Y'
-LEFT JOIN allstarfull AS af
-       ON af.playerID = b.playerID
-      AND af.yearID = b.yearId
 WHERE b.yearId = :yearId
   AND b.teamID = :teamId
 GROUP BY b.playerID, p.nameFirst, p.nameLast, p.birthYear
 ORDER BY home_runs DESC, hits DESC;
 """
 
-LEAGUE_BATTING_AGGREGATES = """
+SEASON_BATTING = """
+SELECT
+    b.playerID,
+    b.teamID,
+    b.yearId AS yearID,
+    CONCAT_WS(' ', NULLIF(p.nameFirst, ''), NULLIF(p.nameLast, '')) AS player_name,
+    p.birthYear,
+    SUM(b.b_G) AS games,
+    SUM(b.b_AB) AS at_bats,
+    SUM(b.b_H) AS hits,
+    SUM(b.b_2B) AS doubles,
+    SUM(b.b_3B) AS triples,
+    SUM(b.b_HR) AS home_runs,
+    SUM(b.b_RBI) AS runs_batted_in,
+    SUM(b.b_BB) AS walks,
+    SUM(b.b_SO) AS strikeouts,
+    SUM(b.b_SB) AS stolen_bases,
+    SUM(b.b_CS) AS caught_stealing,
+    SUM(b.b_HBP) AS hit_by_pitch,
+    SUM(b.b_SF) AS sacrifice_flies,
+    SUM(b.b_SH) AS sacrifice_hits
+FROM batting AS b
+INNER JOIN people AS p ON b.playerID = p.playerID
+WHERE b.yearId = :yearId
+GROUP BY b.playerID, b.teamID, b.yearId, p.nameFirst, p.nameLast, p.birthYear
+ORDER BY b.teamID, home_runs DESC, hits DESC;
+"""
+
+HALL_OF_FAME_INDUCTEES = """
+SELECT DISTINCT playerID
+FROM halloffame
+WHERE inducted = 'Y';
+"""
+
+ALL_STAR_SEASONS = """
+SELECT DISTINCT playerID, yearID
+FROM allstarfull;
+"""
+
+PLAYER_CAREER_BATTING = """
+SELECT
+    b.playerID,
+    b.teamID,
+    b.yearId AS yearID,
+    CONCAT_WS(' ', NULLIF(p.nameFirst, ''), NULLIF(p.nameLast, '')) AS player_name,
+    p.birthYear,
+    SUM(b.b_G) AS games,
+    SUM(b.b_AB) AS at_bats,
+    SUM(b.b_H) AS hits,
+    SUM(b.b_2B) AS doubles,
+    SUM(b.b_3B) AS triples,
+    SUM(b.b_HR) AS home_runs,
+    SUM(b.b_RBI) AS runs_batted_in,
+    SUM(b.b_BB) AS walks,
+    SUM(b.b_SO) AS strikeouts,
+    SUM(b.b_SB) AS stolen_bases,
+    SUM(b.b_CS) AS caught_stealing,
+    SUM(b.b_HBP) AS hit_by_pitch,
+    SUM(b.b_SF) AS sacrifice_flies,
+    SUM(b.b_SH) AS sacrifice_hits
+FROM batting AS b
+INNER JOIN people AS p ON b.playerID = p.playerID
+WHERE b.playerID = :playerId
+GROUP BY b.playerID, b.teamID, b.yearId, p.nameFirst, p.nameLast, p.birthYear
+ORDER BY b.yearId, MIN(b.stint);
+"""
+
+ALL_PLAYER_SEASONS = """
+SELECT
+    b.playerID,
+    b.teamID,
+    b.yearId AS yearID,
+    CONCAT_WS(' ', NULLIF(p.nameFirst, ''), NULLIF(p.nameLast, '')) AS player_name,
+    SUM(b.b_G) AS games,
+    SUM(b.b_AB) AS at_bats,
+    SUM(b.b_H) AS hits,
+    SUM(b.b_2B) AS doubles,
+    SUM(b.b_3B) AS triples,
+    SUM(b.b_HR) AS home_runs,
+    SUM(b.b_RBI) AS runs_batted_in,
+    SUM(b.b_BB) AS walks,
+    SUM(b.b_SO) AS strikeouts,
+    SUM(b.b_SB) AS stolen_bases,
+    SUM(b.b_CS) AS caught_stealing,
+    SUM(b.b_HBP) AS hit_by_pitch,
+    SUM(b.b_SF) AS sacrifice_flies,
+    SUM(b.b_SH) AS sacrifice_hits
+FROM batting AS b
+INNER JOIN people AS p ON b.playerID = p.playerID
+WHERE b.yearId BETWEEN 1871 AND 2024
+GROUP BY b.playerID, b.teamID, b.yearId, p.nameFirst, p.nameLast;
+"""
+
+LATEST_TEAM_SEASON = """
+SELECT teamID, yearID, franchID
+FROM teams
+WHERE yearID = (SELECT MAX(yearID) FROM teams)
+ORDER BY teamID
+LIMIT 1;
+"""
+
+FRANCHISE_SEASONS = """
+SELECT
+    COUNT(*) AS seasons,
+    MIN(yearID) AS first_year,
+    MAX(yearID) AS last_year
+FROM teams
+WHERE franchID = :franchId;
+"""
+
+FRANCHISE_BATTING = """
 SELECT
+    b.playerID,
+    b.teamID,
+    b.yearId AS yearID,
+    CONCAT_WS(' ', NULLIF(p.nameFirst, ''), NULLIF(p.nameLast, '')) AS player_name,
+    p.birthYear,
     SUM(b.b_G) AS games,
     SUM(b.b_AB) AS at_bats,
     SUM(b.b_H) AS hits,
     SUM(b.b_2B) AS doubles,
     SUM(b.b_3B) AS triples,
     SUM(b.b_HR) AS home_runs,
+    SUM(b.b_RBI) AS runs_batted_in,
     SUM(b.b_BB) AS walks,
     SUM(b.b_SO) AS strikeouts,
     SUM(b.b_SB) AS stolen_bases,
@@ -70,5 +177,418 @@ SELECT
     SUM(b.b_SF) AS sacrifice_flies,
     SUM(b.b_SH) AS sacrifice_hits
 FROM batting AS b
-WHERE b.yearId = :yearId;
+INNER JOIN teams AS t ON t.teamID = b.teamID AND t.yearID = b.yearId
+INNER JOIN people AS p ON b.playerID = p.playerID
+WHERE t.franchID = :franchId
+GROUP BY b.playerID, b.teamID, b.yearId, p.nameFirst, p.nameLast, p.birthYear
+ORDER BY b.yearId, b.teamID, home_runs DESC, hits DESC;
+"""
+
+TEAMS_COMPARISON = """
+SELECT
+    t.teamID,
+    t.team_name AS name,
+    t.franchID,
+    t.lgID,
+    t.team_W AS W,
+    t.team_L AS L,
+    s.playerID,
+    s.games,
+    s.at_bats,
+    s.hits,
+    s.doubles,
+    s.triples,
+    s.home_runs,
+    s.runs_batted_in,
+    s.walks,
+    s.strikeouts,
+    s.stolen_bases,
+    s.caught_stealing,
+    s.hit_by_pitch,
+    s.sacrifice_flies,
+    s.sacrifice_hits
+FROM teams AS t
+LEFT JOIN (
+    SELECT
+        b.teamID,
+        b.playerID,
+        SUM(b.b_G) AS games,
+        SUM(b.b_AB) AS at_bats,
+        SUM(b.b_H) AS hits,
+        SUM(b.b_2B) AS doubles,
+        SUM(b.b_3B) AS triples,
+        SUM(b.b_HR) AS home_runs,
+        SUM(b.b_RBI) AS runs_batted_in,
+        SUM(b.b_BB) AS walks,
+        SUM(b.b_SO) AS strikeouts,
+        SUM(b.b_SB) AS stolen_bases,
+        SUM(b.b_CS) AS caught_stealing,
+        SUM(b.b_HBP) AS hit_by_pitch,
+        SUM(b.b_SF) AS sacrifice_flies,
+        SUM(b.b_SH) AS sacrifice_hits
+    FROM batting AS b
+    INNER JOIN people AS p ON b.playerID = p.playerID
+    WHERE b.yearId = :yearId
+      AND b.teamID IN :teamIds
+    GROUP BY b.teamID, b.playerID
+) AS s ON s.teamID = t.teamID
+WHERE t.yearID = :yearId
+  AND t.teamID IN :teamIds
+ORDER BY t.teamID;
+"""
+
+LEAGUE_BATTING_BY_YEAR = """
+SELECT
+    b.yearId AS yearID,
+    SUM(b.b_AB) AS at_bats,
+    SUM(b.b_H) AS hits,
+    SUM(b.b_2B) AS doubles,
+    SUM(b.b_3B) AS triples,
+    SUM(b.b_HR) AS home_runs,
+    SUM(b.b_BB) AS walks,
+    SUM(b.b_HBP) AS hit_by_pitch,
+    SUM(b.b_SF) AS sacrifice_flies
+FROM batting AS b
+WHERE b.yearId BETWEEN 1871 AND 2024
+GROUP BY b.yearId;
+"""
+
+TRIVIA_PLAYER_SEASON_SAMPLE = """
+SELECT
+    CONCAT_WS(' ', NULLIF(p.nameFirst, ''), NULLIF(p.nameLast, '')) AS player_name,
+    b.playerID AS player_id,
+    b.teamID AS team_id,
+    b.yearId AS year_id,
+    SUM(b.b_HR) AS home_runs,
+    SUM(b.b_RBI) AS runs_batted_in,
+    SUM(b.b_H) AS hits,
+    t.team_name AS team_name
+FROM batting AS b
+INNER JOIN people AS p ON b.playerID = p.playerID
+INNER JOIN teams AS t ON t.teamID = b.teamID AND t.yearID = b.yearId
+WHERE b.yearId BETWEEN 1901 AND 2024
+GROUP BY b.playerID, b.teamID, b.yearId, p.nameFirst, p.nameLast, t.team_name
+ORDER BY RAND()
+LIMIT :sampleSize;
+"""
+
+TRIVIA_TEAMS_FOR_YEARS = """
+SELECT yearID, teamID, team_name
+FROM teams
+WHERE yearID IN :yearIds;
+"""
+
+PLAYER_SEASON_TABLE = 'player_season_batting'
+PLAYER_SEASON_BUILD_TABLE = 'player_season_batting_new'
+PLAYER_SEASON_OLD_TABLE = 'player_season_batting_old'
+
+# The build statements take the target table as {table}, so a rebuild can fill
+# player_season_batting_new beside the live table and swap it in afterwards.
+PLAYER_SEASON_BATTING_DROP = """
+DROP TABLE IF EXISTS {table};
+"""
+
+# One row per (playerID, teamID, yearID) with stints summed and award flags resolved
+# through EXISTS so multi-row All-Star years cannot inflate the counting stats.
+PLAYER_SEASON_BATTING_BUILD = """
+CREATE TABLE {table} AS
+SELECT
+    s.playerID,
+    s.teamID,
+    s.yearID,
+    CONCAT_WS(' ', NULLIF(p.nameFirst, ''), NULLIF(p.nameLast, '')) AS player_name,
+    p.birthYear,
+    t.team_name,
+    s.games,
+    s.at_bats,
+    s.hits,
+    s.doubles,
+    s.triples,
+    s.home_runs,
+    s.runs_batted_in,
+    s.walks,
+    s.strikeouts,
+    s.stolen_bases,
+    s.caught_stealing,
+    s.hit_by_pitch,
+    s.sacrifice_flies,
+    s.sacrifice_hits,
+    CASE WHEN EXISTS (
+        SELECT 1 FROM halloffame AS hof
+        WHERE hof.playerID = s.playerID AND hof.inducted = 'Y'
+    ) THEN 1 ELSE 0 END AS hall_of_famer,
+    CASE WHEN EXISTS (
+        SELECT 1 FROM allstarfull AS af
+        WHERE af.playerID = s.playerID AND af.yearID = s.yearID
+    ) THEN 1 ELSE 0 END AS all_star
+FROM (
+    SELECT
+        b.playerID,
+        b.teamID,
+        b.yearId AS yearID,
+        SUM(b.b_G) AS games,
+        SUM(b.b_AB) AS at_bats,
+        SUM(b.b_H) AS hits,
+        SUM(b.b_2B) AS doubles,
+        SUM(b.b_3B) AS triples,
+        SUM(b.b_HR) AS home_runs,
+        SUM(b.b_RBI) AS runs_batted_in,
+        SUM(b.b_BB) AS walks,
+        SUM(b.b_SO) AS strikeouts,
+        SUM(b.b_SB) AS stolen_bases,
+        SUM(b.b_CS) AS caught_stealing,
+        SUM(b.b_HBP) AS hit_by_pitch,
+        SUM(b.b_SF) AS sacrifice_flies,
+        SUM(b.b_SH) AS sacrifice_hits
+    FROM batting AS b
+    GROUP BY b.playerID, b.teamID, b.yearId
+) AS s
+INNER JOIN people AS p ON p.playerID = s.playerID
+LEFT JOIN teams AS t ON t.teamID = s.teamID AND t.yearID = s.yearID;
+"""
+
+PLAYER_SEASON_BATTING_INDEXES = [
+    "CREATE INDEX ix_player_season_batting_year_team ON {table} (yearID, teamID);",
+    "CREATE INDEX ix_player_season_batting_player ON {table} (playerID, yearID);",
+]
+
+# One atomic statement on MariaDB: readers see either the old table or the new one, never neither.
+PLAYER_SEASON_BATTING_SWAP = """
+RENAME TABLE player_season_batting TO player_season_batting_old,
+             player_season_batting_new TO player_season_batting;
+"""
+
+PLAYER_SEASON_BATTING_PUBLISH = """
+RENAME TABLE player_season_batting_new TO player_season_batting;
+"""
+
+PLAYER_SEASON_BATTING_COUNT = """
+SELECT COUNT(*) AS row_count FROM player_season_batting;
+"""
+
+TEAM_BATTING_MATERIALIZED = """
+SELECT
+    playerID,
+    player_name,
+    birthYear,
+    games,
+    at_bats,
+    hits,
+    doubles,
+    triples,
+    home_runs,
+    runs_batted_in,
+    walks,
+    strikeouts,
+    stolen_bases,
+    caught_stealing,
+    hit_by_pitch,
+    sacrifice_flies,
+    sacrifice_hits,
+    hall_of_famer,
+    all_star
+FROM player_season_batting
+WHERE yearID = :yearId
+  AND teamID = :teamId
+ORDER BY home_runs DESC, hits DESC;
+"""
+
+TRIVIA_PLAYER_SEASON_SAMPLE_MATERIALIZED = """
+SELECT
+    player_name,
+    playerID AS player_id,
+    teamID AS team_id,
+    yearID AS year_id,
+    home_runs,
+    runs_batted_in,
+    hits,
+    team_name
+FROM player_season_batting
+WHERE yearID BETWEEN 1901 AND 2024
+  AND team_name IS NOT NULL
+ORDER BY RAND()
+LIMIT :sampleSize;
+"""
+
+TEAMS_COMPARISON_MATERIALIZED = """
+SELECT
+    t.teamID,
+    t.team_name AS name,
+    t.franchID,
+    t.lgID,
+    t.team_W AS W,
+    t.team_L AS L,
+    s.playerID,
+    s.games,
+    s.at_bats,
+    s.hits,
+    s.doubles,
+    s.triples,
+    s.home_runs,
+    s.runs_batted_in,
+    s.walks,
+    s.strikeouts,
+    s.stolen_bases,
+    s.caught_stealing,
+    s.hit_by_pitch,
+    s.sacrifice_flies,
+    s.sacrifice_hits,
+    s.hall_of_famer,
+    s.all_star
+FROM teams AS t
+LEFT JOIN player_season_batting AS s
+       ON s.teamID = t.teamID
+      AND s.yearID = t.yearID
+WHERE t.yearID = :yearId
+  AND t.teamID IN :teamIds
+ORDER BY t.teamID;
+"""
+
+SEASON_BATTING_MATERIALIZED = """
+SELECT
+    s.playerID,
+    s.teamID,
+    s.yearID,
+    s.player_name,
+    s.birthYear,
+    s.games,
+    s.at_bats,
+    s.hits,
+    s.doubles,
+    s.triples,
+    s.home_runs,
+    s.runs_batted_in,
+    s.walks,
+    s.strikeouts,
+    s.stolen_bases,
+    s.caught_stealing,
+    s.hit_by_pitch,
+    s.sacrifice_flies,
+    s.sacrifice_hits,
+    s.hall_of_famer,
+    s.all_star
+FROM player_season_batting AS s
+WHERE s.yearID = :yearId
+ORDER BY s.teamID, s.home_runs DESC, s.hits DESC;
+"""
+
+FRANCHISE_BATTING_MATERIALIZED = """
+SELECT
+    s.playerID,
+    s.teamID,
+    s.yearID,
+    s.player_name,
+    s.birthYear,
+    s.games,
+    s.at_bats,
+    s.hits,
+    s.doubles,
+    s.triples,
+    s.home_runs,
+    s.runs_batted_in,
+    s.walks,
+    s.strikeouts,
+    s.stolen_bases,
+    s.caught_stealing,
+    s.hit_by_pitch,
+    s.sacrifice_flies,
+    s.sacrifice_hits,
+    s.hall_of_famer,
+    s.all_star
+FROM player_season_batting AS s
+INNER JOIN teams AS t ON t.teamID = s.teamID AND t.yearID = s.yearID
+WHERE t.franchID = :franchId
+ORDER BY s.yearID, s.teamID, s.home_runs DESC, s.hits DESC;
+"""
+
+PLAYER_CAREER_BATTING_MATERIALIZED = """
+SELECT
+    playerID,
+    teamID,
+    yearID,
+    player_name,
+    birthYear,
+    games,
+    at_bats,
+    hits,
+    doubles,
+    triples,
+    home_runs,
+    runs_batted_in,
+    walks,
+    strikeouts,
+    stolen_bases,
+    caught_stealing,
+    hit_by_pitch,
+    sacrifice_flies,
+    sacrifice_hits,
+    hall_of_famer,
+    all_star
+FROM player_season_batting
+WHERE playerID = :playerId
+ORDER BY yearID, teamID;
+"""
+
+ALL_PLAYER_SEASONS_MATERIALIZED = """
+SELECT
+    playerID,
+    teamID,
+    yearID,
+    player_name,
+    games,
+    at_bats,
+    hits,
+    doubles,
+    triples,
+    home_runs,
+    runs_batted_in,
+    walks,
+    strikeouts,
+    stolen_bases,
+    caught_stealing,
+    hit_by_pitch,
+    sacrifice_flies,
+    sacrifice_hits
+FROM player_season_batting
+WHERE yearID BETWEEN 1871 AND 2024;
+"""
+
+SNAPSHOT_BATTING = """
+SELECT
+    playerID,
+    yearId AS yearID,
+    stint,
+    teamID,
+    b_G AS games,
+    b_AB AS at_bats,
+    b_H AS hits,
+    b_2B AS doubles,
+    b_3B AS triples,
+    b_HR AS home_runs,
+    b_RBI AS runs_batted_in,
+    b_BB AS walks,
+    b_SO AS strikeouts,
+    b_SB AS stolen_bases,
+    b_CS AS caught_stealing,
+    b_HBP AS hit_by_pitch,
+    b_SF AS sacrifice_flies,
+    b_SH AS sacrifice_hits
+FROM batting;
+"""
+
+SNAPSHOT_PEOPLE = """
+SELECT playerID, nameFirst, nameLast, birthYear
+FROM people;
+"""
+
+SNAPSHOT_TEAMS = """
+SELECT
+    yearID,
+    teamID,
+    team_name AS name,
+    franchID,
+    lgID,
+    team_W AS W,
+    team_L AS L
+FROM teams;
 """
@@ -0,0 +1,177 @@
+import time
+from typing import Optional
+
+import pandas as pd
+from flask import current_app, jsonify, render_template, request
+from sqlalchemy import bindparam, make_url, text
+from sqlalchemy.engine import Connection, Result
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.sql.elements import TextClause
+
+from . import queries
+from .connection import get_connection
+
+# name in queries.py -> (statement timeout in seconds, row limit). A timeout of None uses
+# QUERY_TIMEOUT and 0 means none; a row limit of None means unbounded. Whole-table loads
+# run once per process and get longer; streamed exports and snapshot exports are unbounded.
+QUERY_SPECS = {
+    'SEASON_TEAM_DIRECTORY': (60, None),
+    'TEAM_INFO': (None, None),
+    'TEAM_BATTING': (None, 10_000),
+    'TEAM_BATTING_MATERIALIZED': (None, 10_000),
+    'TEAMS_COMPARISON': (None, 20_000),
+    'TEAMS_COMPARISON_MATERIALIZED': (None, 20_000),
+    'SEASON_BATTING': (0, None),
+    'SEASON_BATTING_MATERIALIZED': (0, None),
+    'FRANCHISE_SEASONS': (None, None),
+    'FRANCHISE_BATTING': (0, None),
+    'FRANCHISE_BATTING_MATERIALIZED': (0, None),
+    'PLAYER_CAREER_BATTING': (None, 1_000),
+    'PLAYER_CAREER_BATTING_MATERIALIZED': (None, 1_000),
+    'TRIVIA_PLAYER_SEASON_SAMPLE': (60, None),
+    'TRIVIA_PLAYER_SEASON_SAMPLE_MATERIALIZED': (60, None),
+    'TRIVIA_TEAMS_FOR_YEARS': (None, None),
+    'LEAGUE_BATTING_BY_YEAR': (60, None),
+    'HALL_OF_FAME_INDUCTEES': (60, None),
+    'ALL_STAR_SEASONS': (60, None),
+    'ALL_PLAYER_SEASONS': (120, None),
+    'ALL_PLAYER_SEASONS_MATERIALIZED': (120, None),
+    'SNAPSHOT_BATTING': (0, None),
+    'SNAPSHOT_PEOPLE': (0, None),
+    'SNAPSHOT_TEAMS': (0, None),
+}
+EXPANDING_PARAMS = {
+    'TEAMS_COMPARISON': ('teamIds',),
+    'TEAMS_COMPARISON_MATERIALIZED': ('teamIds',),
+    'TRIVIA_TEAMS_FOR_YEARS': ('yearIds',),
+}
+STREAMED_QUERIES = {'SEASON_BATTING', 'SEASON_BATTING_MATERIALIZED', 'FRANCHISE_BATTING', 'FRANCHISE_BATTING_MATERIALIZED'}
+
+# SQLite calls the progress handler every this many VM instructions.
+SQLITE_PROGRESS_STEPS = 10_000
+MARIADB_STATEMENT_TIMEOUT = 1969
+
+
+class QueryCancelled(RuntimeError):
+    message = 'That request took too long and was cancelled. Please try again in a moment.'
+    status_code = 503
+
+    def __init__(self, name: str, reason: str):
+        super().__init__(f"{name} {reason}")
+        self.name = name
+
+
+class RowLimitExceeded(QueryCancelled):
+    # Retrying returns the same rows, so the user is asked to narrow the request instead.
+    message = 'That request matched too many rows. Please narrow it and try again.'
+    status_code = 400
+
+
+class _NamedQuery:
+    def __init__(self, name: str, timeout: float, max_rows: Optional[int], backends: set[str]):
+        self.name = name
+        self.timeout = timeout
+        self.max_rows = max_rows
+        self.statements = {backend: self._compile(backend) for backend in backends}
+
+    def statement(self, backend: str) -> TextClause:
+        if backend not in self.statements:
+            self.statements[backend] = self._compile(backend)
+        return self.statements[backend]
+
+    def _compile(self, backend: str) -> TextClause:
+        sql = getattr(queries, self.name).strip()
+        if self.timeout and backend in ('mysql', 'mariadb'):
+            # MariaDB kills the statement server-side and frees the connection for the next checkout.
+            sql = f"SET STATEMENT max_statement_time={self.timeout:g} FOR {sql}"
+        statement = text(sql)
+        expanding = EXPANDING_PARAMS.get(self.name)
+        if expanding:
+            statement = statement.bindparams(*(bindparam(param, expanding=True) for param in expanding))
+        options = {'query_name': self.name}
+        if self.name in STREAMED_QUERIES:
+            options['stream_results'] = True
+        return statement.execution_options(**options)
+
+
+def _timed_out(error: DBAPIError) -> bool:
+    args = getattr(error.orig, 'args', ())
+    return bool(args) and (args[0] == MARIADB_STATEMENT_TIMEOUT or args[0] == 'interrupted')
+
+
+def _cancelled_response(error: QueryCancelled):
+    current_app.logger.warning('Cancelled query: %s', error)
+    if request.blueprint == 'api':
+        return jsonify({'error': error.message}), error.status_code
+    return render_template('error.html', message=error.message), error.status_code
+
+
+class QueryRegistry:
+    def __init__(self, timeout: float = 10.0):
+        self.timeout = timeout
+        self._queries: dict[str, _NamedQuery] = {}
+
+    def init_app(self, app) -> None:
+        self.timeout = float(app.config.setdefault('QUERY_TIMEOUT', self.timeout))
+        uris = [app.config['SQLALCHEMY_DATABASE_URI'], *app.config.get('READ_REPLICA_URIS', [])]
+        backends = {make_url(uri).get_backend_name() for uri in uris}
+        self._queries = {
+            name: _NamedQuery(name, self.timeout if timeout is None else timeout, max_rows, backends)
+            for name, (timeout, max_rows) in QUERY_SPECS.items()
+        }
+        app.register_error_handler(QueryCancelled, _cancelled_response)
+
+    def _fetch(self, query: _NamedQuery, result) -> list:
+        if query.max_rows is None:
+            return result.fetchall()
+        rows = result.fetchmany(query.max_rows + 1)
+        if len(rows) > query.max_rows:
+            result.close()
+            raise RowLimitExceeded(query.name, f"returned more than {query.max_rows} rows")
+        return rows
+
+    def _run(self, name: str, params: Optional[dict], connection: Optional[Connection], consume):
+        # The one path every named query takes: pick the statement compiled for this backend,
+        # bound its run time, and map a server-side cancel to QueryCancelled.
+        query = self._queries[name]
+        connection = connection if connection is not None else get_connection()
+        statement = query.statement(connection.dialect.name)
+        interrupt = query.timeout and connection.dialect.name == 'sqlite'
+        if interrupt:
+            deadline = time.monotonic() + query.timeout
+            dbapi_connection = connection.connection.dbapi_connection
+            dbapi_connection.set_progress_handler(lambda: time.monotonic() > deadline, SQLITE_PROGRESS_STEPS)
+        try:
+            return consume(query, connection.execute(statement, params or {}))
+        except DBAPIError as error:
+            if _timed_out(error):
+                raise QueryCancelled(name, f"exceeded its {query.timeout:g}s statement timeout") from error
+            raise
+        finally:
+            if interrupt:
+                dbapi_connection.set_progress_handler(None, 0)
+
+    def rows(self, name: str, params: Optional[dict] = None, connection: Optional[Connection] = None) -> list[dict]:
+        return self._run(name, params, connection, lambda query, result: [
+            dict(row) for row in self._fetch(query, result.mappings())
+        ])
+
+    def first(self, name: str, params: Optional[dict] = None, connection: Optional[Connection] = None) -> Optional[dict]:
+        def consume(query, result):
+            row = result.mappings().first()
+            return dict(row) if row else None
+        return self._run(name, params, connection, consume)
+
+    def frame(self, name: str, params: Optional[dict] = None, connection: Optional[Connection] = None,
+              index_col: Optional[str] = None) -> pd.DataFrame:
+        def consume(query, result):
+            frame = pd.DataFrame.from_records(self._fetch(query, result), columns=list(result.keys()), coerce_float=True)
+            return frame.set_index(index_col) if index_col else frame
+        return self._run(name, params, connection, consume)
+
+    def stream(self, name: str, params: Optional[dict] = None, connection: Optional[Connection] = None) -> Result:
+        # Rows are fetched by the caller after this returns, so streamed queries carry no timeout.
+        return self._run(name, params, connection, lambda query, result: result)
+
+
+query_registry = QueryRegistry()
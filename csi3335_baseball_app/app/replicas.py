@@ -0,0 +1,132 @@
+import threading
+import time
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+
+from . import db
+
+
+class _Replica:
+    def __init__(self, uri: str, engine: Engine):
+        self.name = make_url(uri).render_as_string(hide_password=True)
+        self.engine = engine
+        self.healthy = True
+        self.retry_at = 0.0
+        self.checkouts = 0
+        self.failures = 0
+        self.last_error = ''
+
+
+class ReplicaRouter:
+    # Hands out connections for the read-only baseball tables round-robin across the
+    # replicas. The users table goes through db.session, so it always stays on the primary.
+    def __init__(self, retry_seconds: float = 30.0):
+        self.retry_seconds = retry_seconds
+        self.primary_fallbacks = 0
+        self._replicas: list[_Replica] = []
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        self.retry_seconds = float(app.config.setdefault('READ_REPLICA_RETRY_SECONDS', self.retry_seconds))
+        uris = app.config.setdefault('READ_REPLICA_URIS', [])
+        options = app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {})
+        with self._lock:
+            for replica in self._replicas:
+                replica.engine.dispose()
+            self._replicas = [_Replica(uri, create_engine(uri, **options)) for uri in uris]
+            self._next = 0
+            self.primary_fallbacks = 0
+
+    def engines(self) -> list[Engine]:
+        return [replica.engine for replica in self._replicas]
+
+    def _candidates(self) -> list[_Replica]:
+        # Rotation order from the next replica on. A replica that failed sits out until its
+        # retry time; the next checkout after that is its health check.
+        with self._lock:
+            if not self._replicas:
+                return []
+            start = self._next
+            self._next = (start + 1) % len(self._replicas)
+            ordered = self._replicas[start:] + self._replicas[:start]
+        now = time.monotonic()
+        return [replica for replica in ordered if replica.healthy or now >= replica.retry_at]
+
+    def _mark_down(self, replica: _Replica, error: Exception) -> None:
+        with self._lock:
+            replica.healthy = False
+            replica.retry_at = time.monotonic() + self.retry_seconds
+            replica.failures += 1
+            replica.last_error = str(getattr(error, 'orig', error)).splitlines()[0]
+
+    def _mark_up(self, replica: _Replica) -> None:
+        with self._lock:
+            replica.healthy = True
+            replica.checkouts += 1
+
+    def connect(self) -> Connection:
+        for replica in self._candidates():
+            try:
+                # pool_pre_ping tests reused connections here, so a dead replica fails now
+                # rather than partway through a request.
+                connection = replica.engine.connect()
+            except DBAPIError as error:
+                self._mark_down(replica, error)
+                continue
+            self._mark_up(replica)
+            return connection
+        if self._replicas:
+            with self._lock:
+                self.primary_fallbacks += 1
+        return db.engine.connect()
+
+    def check(self) -> list[dict]:
+        # Probes every replica now, healthy or not, and updates its state.
+        for replica in list(self._replicas):
+            try:
+                with replica.engine.connect() as connection:
+                    connection.execute(text('SELECT 1'))
+            except DBAPIError as error:
+                self._mark_down(replica, error)
+            else:
+                with self._lock:
+                    replica.healthy = True
+        return self.stats()
+
+    def stats(self) -> list[dict]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    'name': replica.name,
+                    'healthy': replica.healthy,
+                    'retry_in': max(0.0, replica.retry_at - now) if not replica.healthy else 0.0,
+                    'checkouts': replica.checkouts,
+                    'failures': replica.failures,
+                    'last_error': replica.last_error,
+                }
+                for replica in self._replicas
+            ]
+
+
+replicas = ReplicaRouter()
+
+
+@click.command('check-replicas')
+@with_appcontext
+def check_replicas_command() -> None:
+    """Connect to every read replica and report which ones are reachable."""
+    rows = replicas.check()
+    if not rows:
+        click.echo('No read replicas configured; reads use the primary.')
+        return
+    for row in rows:
+        status = 'ok' if row['healthy'] else f"down: {row['last_error']}"
+        click.echo(f"{row['name']:<60} {status}")
+    if not any(row['healthy'] for row in rows):
+        raise click.ClickException('No replica is reachable; reads will fall back to the primary.')
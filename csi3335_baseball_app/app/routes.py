@@ -1,148 +1,145 @@
-from decimal import Decimal
-import random
-
 import pandas as pd
 import numpy as np
-from flask import Blueprint, flash, make_response, redirect, render_template, request, session, url_for
+from flask import Blueprint, current_app, flash, redirect, render_template, request, session, url_for
 from flask_login import login_required
-from sqlalchemy import text
 
-from . import db
+from . import team_batting_cache, team_fragment_cache
 from .forms import TeamYearForm, PlayerCompareForm, TeamCompareForm
-from . import queries
+from .awards import award_index
+from .careers import player_career
+from .exports import BULK_EXPORT_COLUMNS, TEAM_EXPORT_COLUMNS, csv_chunks, csv_response, export_frame
+from .formatting import (
+    FORMATTED_COLUMNS,
+    format_difference,
+    format_fixed,
+    format_index,
+    format_percent,
+    format_rate,
+    format_whole,
+    formatted_batting_columns,
+    player_links,
+)
+from .http_cache import conditional_dataset_response
+from .leaderboards import LEADERBOARD_STATS, SCOPES, leaderboards
+from .league import league_baselines
+from .materialized import player_seasons_available
+from .parallel import query_executor
+from .registry import query_registry
+from .seasons import season_directory
+from .snapshot import snapshot
+from .stats import COUNTING_COLUMNS, add_rate_columns, add_rates_from_totals, ops_plus
+from .trivia import trivia_pool
 
 core_bp = Blueprint('core', __name__)
 
+# metric type on the compare pages -> (scale, decimals, value suffix, difference suffix)
+COMPARE_FORMATS = {
+    'int': (1, 0, '', ''),
+    'percent': (100, 1, '%', ' pts'),
+    'rate': (1, 3, '', ''),
+}
+
 
 def _team_choices_for_year(year: int):
     if not year:
         return []
-    with db.engine.connect() as connection:
-        result = connection.execute(text(queries.TEAM_IDS_FOR_YEAR), {'yearId': year})
-        rows = result.mappings().all()
-    return [(row['teamID'], f"{row['teamID']} — {row['name']}") for row in rows]
+    return [(team_id, f"{team_id} — {name}") for team_id, name in season_directory.teams(year)]
+
+
+def _no_teams_message() -> str:
+    first, last = season_directory.bounds()
+    return f"No teams found for that season. Enter a year between {first} and {last}."
 
 
 def _team_metadata(team_id: str, year_id: int):
-    with db.engine.connect() as connection:
-        result = connection.execute(text(queries.TEAM_INFO), {'teamId': team_id, 'yearId': year_id})
-        record = result.mappings().first()
-    return dict(record) if record else None
-
-
-def _league_batting_summary(year_id: int):
-    with db.engine.connect() as connection:
-        result = connection.execute(text(queries.LEAGUE_BATTING_AGGREGATES), {'yearId': year_id})
-        record = result.mappings().first()
-    if not record:
-        return {}
-    cleaned = {}
-    for key, value in dict(record).items():
-        if value is None:
-            cleaned[key] = 0
-        elif isinstance(value, Decimal):
-            cleaned[key] = float(value)
-        else:
-            cleaned[key] = value
-    return cleaned
+    if snapshot.available():
+        return snapshot.team_info(team_id, year_id)
+    return query_registry.first('TEAM_INFO', {'teamId': team_id, 'yearId': year_id})
 
 
 def _team_batting(team_id: str, year_id: int):
-    with db.engine.connect() as connection:
-        dataframe = pd.read_sql_query(
-            text(queries.TEAM_BATTING),
-            connection,
-            params={'teamId': team_id, 'yearId': year_id},
-        )
-    if dataframe.empty:
-        return dataframe, {}, pd.DataFrame()
+    # Cached frames are shared between requests; callers must copy before mutating.
+    return team_batting_cache.get_or_set(
+        (team_id, year_id),
+        lambda: _compute_team_batting(team_id, year_id),
+    )
 
-    numeric_columns = [col for col in dataframe.columns if col not in {'playerID', 'player_name', 'birthYear'}]
+
+def _team_fragments(team_id: str, year_id: int):
+    # Pre-rendered (table_html, summary_html) so a warm team page only stitches strings into team.html.
+    key = (team_id, year_id, current_app.config['TEMPLATE_VERSION'], current_app.config['DATASET_VERSION'])
+    fragments = team_fragment_cache.get(key)
+    if fragments is None:
+        batting_df, extra_summary, _ = _team_batting(team_id, year_id)
+        if batting_df.empty:
+            return None
+        table_html = batting_df.to_html(classes='data-table', index=False, border=0, justify='center', escape=False)
+        leaders = extra_summary.get('leaders', {}) if extra_summary else {}
+        summary_html = render_template('_team_summary.html', summary=extra_summary, leaders=leaders)
+        fragments = (table_html, summary_html)
+        team_fragment_cache.set(key, fragments)
+    return fragments
+
+
+def _derive_player_batting(dataframe: pd.DataFrame, year_ids) -> pd.DataFrame:
+    # year_ids is a single season for one team or a per-row Series for season/franchise exports.
+    if 'hall_of_famer' not in dataframe.columns:
+        # Raw batting queries leave the award flags to the in-memory index; the materialized table carries them.
+        award_index.attach(dataframe, year_ids)
+    label_columns = {'playerID', 'player_name', 'birthYear', 'teamID', 'yearID'}
+    numeric_columns = [col for col in dataframe.columns if col not in label_columns]
     dataframe[numeric_columns] = dataframe[numeric_columns].fillna(0)
 
     age_series = np.where(
         dataframe['birthYear'].notna() & (dataframe['birthYear'] > 0),
-        year_id - dataframe['birthYear'],
+        year_ids - dataframe['birthYear'],
         np.nan,
     )
     dataframe['age'] = age_series
 
-    singles = (dataframe['hits'] - dataframe['doubles'] - dataframe['triples'] - dataframe['home_runs']).clip(lower=0)
-    total_bases = singles + (2 * dataframe['doubles']) + (3 * dataframe['triples']) + (4 * dataframe['home_runs'])
-    plate_appearances = (
-        dataframe['at_bats']
-        + dataframe['walks']
-        + dataframe['hit_by_pitch']
-        + dataframe['sacrifice_flies']
-        + dataframe['sacrifice_hits']
-    )
+    add_rate_columns(dataframe)
 
-    dataframe['avg'] = np.where(dataframe['at_bats'] > 0, dataframe['hits'] / dataframe['at_bats'], 0)
-    dataframe['obp'] = np.where(
-        plate_appearances > 0,
-        (dataframe['hits'] + dataframe['walks'] + dataframe['hit_by_pitch']) / plate_appearances,
-        0,
+    league = league_baselines.for_years(np.broadcast_to(year_ids, len(dataframe)))
+    dataframe['ops_plus'] = np.where(
+        dataframe['plate_appearances'] > 0,
+        ops_plus(dataframe['obp'], dataframe['slg'], league['obp'].to_numpy(), league['slg'].to_numpy()),
+        np.nan,
     )
-    dataframe['slg'] = np.where(dataframe['at_bats'] > 0, total_bases / dataframe['at_bats'], 0)
-    dataframe['ops'] = dataframe['obp'] + dataframe['slg']
-
-    sb_attempts = dataframe['stolen_bases'] + dataframe['caught_stealing']
-    dataframe['sb_pct'] = np.where(sb_attempts > 0, dataframe['stolen_bases'] / sb_attempts, np.nan)
-
-    league_summary = _league_batting_summary(year_id)
-    league_ops = None
-    if league_summary:
-        league_singles = (
-            league_summary['hits']
-            - league_summary['doubles']
-            - league_summary['triples']
-            - league_summary['home_runs']
-        )
-        league_total_bases = (
-            league_singles
-            + 2 * league_summary['doubles']
-            + 3 * league_summary['triples']
-            + 4 * league_summary['home_runs']
-        )
-        league_plate_appearances = (
-            league_summary['at_bats']
-            + league_summary['walks']
-            + league_summary['hit_by_pitch']
-            + league_summary['sacrifice_flies']
-        )
-        league_avg = (
-            league_summary['hits'] / league_summary['at_bats'] if league_summary['at_bats'] else 0
-        )
-        league_obp = (
-            (league_summary['hits'] + league_summary['walks'] + league_summary['hit_by_pitch']) / league_plate_appearances
-            if league_plate_appearances
-            else 0
+
+    formatted = formatted_batting_columns(dataframe, year_ids)
+    return pd.concat([dataframe, formatted], axis=1)
+
+
+def _reference_loaders(materialized: bool) -> list:
+    # Per-process lookups the pandas stage needs; only the first request in a process does any work.
+    return [league_baselines.all] if materialized else [league_baselines.all, award_index.indexes]
+
+
+def _compute_team_batting(team_id: str, year_id: int):
+    if snapshot.available():
+        dataframe, *_ = query_executor.run(
+            lambda: snapshot.team_batting(team_id, year_id),
+            *_reference_loaders(False),
         )
-        league_slg = league_total_bases / league_summary['at_bats'] if league_summary['at_bats'] else 0
-        league_avg = float(league_avg)
-        league_obp = float(league_obp)
-        league_slg = float(league_slg)
-        league_ops = float(league_obp + league_slg) if (league_obp or league_slg) else 0.0
     else:
-        league_avg = league_obp = league_slg = 0
-
-    def _badge_variants(row):
-        html_badges = []
-        text_badges = []
-        if row['hall_of_famer']:
-            html_badges.append('<span class="badge badge-hof">Hall of Fame</span>')
-            text_badges.append('Hall of Fame')
-        if row['all_star']:
-            badge_text = f"All-Star {year_id}"
-            html_badges.append(f'<span class="badge badge-allstar">{badge_text}</span>')
-            text_badges.append(badge_text)
-        return pd.Series({
-            'badges_html': ' '.join(html_badges),
-            'badges_text': ', '.join(text_badges),
-        })
-
-    badge_variants = dataframe.apply(_badge_variants, axis=1)
-    dataframe = pd.concat([dataframe, badge_variants], axis=1)
+        materialized = player_seasons_available()
+        batting_query = 'TEAM_BATTING_MATERIALIZED' if materialized else 'TEAM_BATTING'
+        dataframe, *_ = query_executor.run(
+            lambda: query_registry.frame(batting_query, {'teamId': team_id, 'yearId': year_id}),
+            *_reference_loaders(materialized),
+        )
+    if dataframe.empty:
+        return dataframe, {}, pd.DataFrame()
+
+    dataframe = _derive_player_batting(dataframe, year_id)
+    total_bases = dataframe['total_bases']
+    plate_appearances = dataframe['plate_appearances']
+
+    league = league_baselines.for_year(year_id)
+    league_avg = league['avg']
+    league_obp = league['obp']
+    league_slg = league['slg']
+    league_ops = league['ops']
 
     comparison_columns = [
         'playerID',
@@ -164,23 +161,16 @@ def _team_batting(team_id: str, year_id: int):
         'obp',
         'slg',
         'ops',
+        'ops_plus',
         'hall_of_famer',
         'all_star',
-        'badges_text',
-        'badges_html',
-    ]
+    ] + FORMATTED_COLUMNS
     comparison_df = dataframe[comparison_columns].copy()
 
-    def _format_rate(value: float) -> str:
-        return f"{value:.3f}"
-
-    def _format_percent(value: float) -> str:
-        return f"{value * 100:.1f}%" if not np.isnan(value) else "—"
-
     display_columns = pd.DataFrame({
-        'Player': dataframe['player_name'],
+        'Player': player_links(dataframe['playerID'], dataframe['player_name'], url_for('core.player_view', player_id='')),
         'Badges': dataframe['badges_html'],
-        'Age': dataframe['age'].apply(lambda v: int(v) if not np.isnan(v) else '—'),
+        'Age': dataframe['age_display'],
         'Games': dataframe['games'].astype(int),
         'At Bats': dataframe['at_bats'].astype(int),
         'Hits': dataframe['hits'].astype(int),
@@ -192,11 +182,12 @@ def _team_batting(team_id: str, year_id: int):
         'Strikeouts': dataframe['strikeouts'].astype(int),
         'Stolen Bases': dataframe['stolen_bases'].astype(int),
         'Caught Stealing': dataframe['caught_stealing'].astype(int),
-        'SB%': dataframe['sb_pct'].apply(_format_percent),
-        'AVG': dataframe['avg'].apply(_format_rate),
-        'OBP': dataframe['obp'].apply(_format_rate),
-        'SLG': dataframe['slg'].apply(_format_rate),
-        'OPS': dataframe['ops'].apply(_format_rate),
+        'SB%': dataframe['sb_pct_display'],
+        'AVG': dataframe['avg_display'],
+        'OBP': dataframe['obp_display'],
+        'SLG': dataframe['slg_display'],
+        'OPS': dataframe['ops_display'],
+        'OPS+': dataframe['ops_plus_display'],
     })
 
     team_at_bats = dataframe['at_bats'].sum()
@@ -209,8 +200,11 @@ def _team_batting(team_id: str, year_id: int):
     team_obp_val = (team_hits + team_walks + team_hbp) / team_plate_appearances if team_plate_appearances else 0
     team_slg_val = team_total_bases / team_at_bats if team_at_bats else 0
     team_ops_val = team_obp_val + team_slg_val
+    team_ops_plus_val = float(ops_plus(team_obp_val, team_slg_val, league_obp, league_slg)) if team_plate_appearances else np.nan
     team_sb_attempts = (dataframe['stolen_bases'] + dataframe['caught_stealing']).sum()
     team_sb_pct = (dataframe['stolen_bases'].sum() / team_sb_attempts) if team_sb_attempts else np.nan
+    # Same module formatters as the player rows, so totals and players round and show gaps alike.
+    team_avg, team_obp, team_slg, team_ops = format_rate([team_avg_val, team_obp_val, team_slg_val, team_ops_val])
 
     totals_row = {
         'Player': 'Team Totals',
@@ -227,11 +221,12 @@ def _team_batting(team_id: str, year_id: int):
         'Strikeouts': int(dataframe['strikeouts'].sum()),
         'Stolen Bases': int(dataframe['stolen_bases'].sum()),
         'Caught Stealing': int(dataframe['caught_stealing'].sum()),
-        'SB%': _format_percent(team_sb_pct),
-        'AVG': _format_rate(team_avg_val),
-        'OBP': _format_rate(team_obp_val),
-        'SLG': _format_rate(team_slg_val),
-        'OPS': _format_rate(team_ops_val),
+        'SB%': format_percent([team_sb_pct])[0],
+        'AVG': team_avg,
+        'OBP': team_obp,
+        'SLG': team_slg,
+        'OPS': team_ops,
+        'OPS+': format_index([team_ops_plus_val])[0],
     }
     display_columns = pd.concat([display_columns, pd.DataFrame([totals_row])], ignore_index=True)
 
@@ -256,21 +251,23 @@ def _team_batting(team_id: str, year_id: int):
         'team_obp': totals_row['OBP'],
         'team_slg': totals_row['SLG'],
         'team_ops': totals_row['OPS'],
+        'team_ops_plus': totals_row['OPS+'],
         'team_sb_pct': totals_row['SB%'],
         'home_runs': int(dataframe['home_runs'].sum()),
         'stolen_bases': int(dataframe['stolen_bases'].sum()),
         'hall_of_famers': int(dataframe['hall_of_famer'].sum()),
         'all_stars': int(dataframe['all_star'].sum()),
         'leaders': leaders,
-        'league_avg': _format_rate(league_avg),
-        'league_obp': _format_rate(league_obp),
-        'league_slg': _format_rate(league_slg),
-        'league_ops': _format_rate(league_ops) if league_ops is not None else '0.000',
+        'league_avg': format_rate([league_avg])[0],
+        'league_obp': format_rate([league_obp])[0],
+        'league_slg': format_rate([league_slg])[0],
+        'league_ops': format_rate([league_ops])[0],
         'raw': {
             'avg': float(team_avg_val),
             'obp': float(team_obp_val),
             'slg': float(team_slg_val),
             'ops': float(team_ops_val),
+            'ops_plus': float(team_ops_plus_val),
             'sb_pct': float(team_sb_pct) if not np.isnan(team_sb_pct) else np.nan,
         },
     }
@@ -278,112 +275,90 @@ def _team_batting(team_id: str, year_id: int):
     return display_columns, summary, comparison_df
 
 
-def _random_player_season():
-    query = text(
-        """
-        SELECT
-            CONCAT_WS(' ', NULLIF(p.nameFirst, ''), NULLIF(p.nameLast, '')) AS player_name,
-            b.playerID AS player_id,
-            b.teamID AS team_id,
-            b.yearId AS year_id,
-            SUM(b.b_HR) AS home_runs,
-            SUM(b.b_RBI) AS runs_batted_in,
-            SUM(b.b_H) AS hits,
-            t.team_name AS team_name
-        FROM batting AS b
-        INNER JOIN people AS p ON b.playerID = p.playerID
-        INNER JOIN teams AS t ON t.teamID = b.teamID AND t.yearID = b.yearId
-        WHERE b.yearId BETWEEN 1901 AND 2024
-        GROUP BY b.playerID, b.teamID, b.yearId, p.nameFirst, p.nameLast, t.team_name
-        ORDER BY RAND()
-        LIMIT 1;
-        """
+def _format_stats(values, metric_types) -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    metric_types = np.asarray(metric_types)
+    text = np.empty(len(values), dtype=object)
+    for metric_type, (scale, decimals, suffix, _) in COMPARE_FORMATS.items():
+        rows = metric_types == metric_type
+        if rows.any():
+            text[rows] = format_fixed(values[rows] * scale, decimals, suffix=suffix)
+    return text
+
+
+def _format_differences(differences, metric_types) -> tuple[np.ndarray, np.ndarray]:
+    differences = np.asarray(differences, dtype=float)
+    metric_types = np.asarray(metric_types)
+    text = np.empty(len(differences), dtype=object)
+    classes = np.empty(len(differences), dtype=object)
+    for metric_type, (scale, decimals, _, suffix) in COMPARE_FORMATS.items():
+        rows = metric_types == metric_type
+        if rows.any():
+            text[rows], classes[rows] = format_difference(differences[rows] * scale, decimals, suffix)
+    return text, classes
+
+
+def _team_comparison(team_ids: list[str], year_id: int):
+    if snapshot.available():
+        dataframe, *_ = query_executor.run(
+            lambda: snapshot.teams_comparison(list(team_ids), year_id),
+            *_reference_loaders(False),
+        )
+    else:
+        materialized = player_seasons_available()
+        comparison_query = 'TEAMS_COMPARISON_MATERIALIZED' if materialized else 'TEAMS_COMPARISON'
+        dataframe, *_ = query_executor.run(
+            lambda: query_registry.frame(comparison_query, {'yearId': year_id, 'teamIds': list(team_ids)}),
+            *_reference_loaders(materialized),
+        )
+    if dataframe.empty:
+        return {}, {}
+
+    metadata_columns = ['teamID', 'name', 'franchID', 'lgID', 'W', 'L']
+    metadata = {
+        record['teamID']: record
+        for record in dataframe[metadata_columns].drop_duplicates('teamID').to_dict(orient='records')
+    }
+
+    total_columns = COUNTING_COLUMNS + ['total_bases', 'plate_appearances', 'hall_of_famer', 'all_star']
+    players = dataframe.dropna(subset=['playerID']).copy()
+    if 'hall_of_famer' not in players.columns:
+        award_index.attach(players, year_id)
+    players[COUNTING_COLUMNS + ['hall_of_famer', 'all_star']] = (
+        players[COUNTING_COLUMNS + ['hall_of_famer', 'all_star']].fillna(0).astype(float)
     )
-    with db.engine.connect() as connection:
-        record = connection.execute(query).mappings().first()
-    return dict(record) if record else None
-
-
-def _team_choices_for_year_random(year_id: int, exclude_team: str, limit: int = 3):
-    query = text(
-        """
-        SELECT teamID, team_name
-        FROM teams
-        WHERE yearID = :yearId AND teamID <> :teamId
-        ORDER BY RAND()
-        LIMIT :limitVal;
-        """
+    add_rate_columns(players)
+    totals = players.groupby('teamID')[total_columns].sum().reindex(list(metadata), fill_value=0)
+    add_rates_from_totals(totals)
+    league = league_baselines.for_year(year_id)
+    totals['ops_plus'] = np.where(
+        totals['plate_appearances'] > 0,
+        ops_plus(totals['obp'], totals['slg'], league['obp'], league['slg']),
+        np.nan,
     )
-    with db.engine.connect() as connection:
-        rows = connection.execute(
-            query, {'yearId': year_id, 'teamId': exclude_team, 'limitVal': limit}
-        ).mappings().all()
-    return [dict(row) for row in rows]
-
-
-def _stat_option_values(correct_value: int, count: int = 4):
-    options = {max(0, int(correct_value))}
-    while len(options) < count:
-        jitter = random.randint(-8, 12)
-        candidate = max(0, correct_value + jitter)
-        options.add(candidate)
-    values = list(options)
-    random.shuffle(values)
-    return values
-
-
-def _generate_trivia_question():
-    record = _random_player_season()
-    if not record:
-        return None
-
-    question_builders = ['team', 'stat_hits', 'stat_home_runs', 'stat_rbi']
-    random.shuffle(question_builders)
-
-    for builder in question_builders:
-        if builder == 'team':
-            other_teams = _team_choices_for_year_random(record['year_id'], record['team_id'])
-            if len(other_teams) < 3:
-                continue
-            options = [
-                {'id': record['team_id'], 'label': f"{record['team_name']} ({record['team_id']})", 'is_correct': True}
-            ]
-            for row in other_teams:
-                options.append({'id': row['teamID'], 'label': f"{row['team_name']} ({row['teamID']})", 'is_correct': False})
-            random.shuffle(options)
-            correct_option = next(opt for opt in options if opt['is_correct'])
-            return {
-                'prompt': f"Which team did {record['player_name']} play for in {record['year_id']}?",
-                'options': [{'id': str(opt['id']), 'label': opt['label']} for opt in options],
-                'correct_id': str(correct_option['id']),
-                'correct_label': correct_option['label'],
-                'detail': f"{record['player_name']} appeared for {record['team_name']} in {record['year_id']}.",
-            }
-
-        if builder.startswith('stat_'):
-            metric_map = {
-                'stat_hits': ('hits', 'hit', 'hits'),
-                'stat_home_runs': ('home_runs', 'home run', 'home runs'),
-                'stat_rbi': ('runs_batted_in', 'RBI', 'RBIs'),
-            }
-            metric_key, singular, plural = metric_map[builder]
-            correct_value = int(record.get(metric_key) or 0)
-            option_values = _stat_option_values(correct_value)
-            options = []
-            for val in option_values:
-                label_text = singular if val == 1 else plural
-                options.append({'id': str(val), 'label': f"{val} {label_text}"})
-            random.shuffle(options)
-            answer_label = singular if correct_value == 1 else plural
-            return {
-                'prompt': f"How many {plural} did {record['player_name']} record for {record['team_name']} in {record['year_id']}?",
-                'options': options,
-                'correct_id': str(correct_value),
-                'correct_label': f"{correct_value} {answer_label}",
-                'detail': f"{record['player_name']} tallied {correct_value} {answer_label} in {record['year_id']}.",
-            }
-
-    return None
+
+    display = pd.DataFrame(
+        {
+            'team_avg': format_rate(totals['avg']),
+            'team_obp': format_rate(totals['obp']),
+            'team_slg': format_rate(totals['slg']),
+            'team_ops': format_rate(totals['ops']),
+            'team_ops_plus': format_index(totals['ops_plus']),
+            'team_sb_pct': format_percent(totals['sb_pct']),
+        },
+        index=totals.index,
+    )
+    summaries = {}
+    for team_id, row in totals.iterrows():
+        summaries[team_id] = {
+            **display.loc[team_id].to_dict(),
+            'home_runs': int(row['home_runs']),
+            'stolen_bases': int(row['stolen_bases']),
+            'hall_of_famers': int(row['hall_of_famer']),
+            'all_stars': int(row['all_star']),
+            'raw': {key: float(row[key]) for key in ('avg', 'obp', 'slg', 'ops', 'ops_plus', 'sb_pct')},
+        }
+    return metadata, summaries
 
 
 @core_bp.route('/', methods=['GET', 'POST'])
@@ -409,7 +384,7 @@ def index():
     if request.method == 'POST':
         if form.submit_load.data:
             if not has_choices:
-                flash('No teams found for that season. Enter a year between 1871 and 2024.', 'warning')
+                flash(_no_teams_message(), 'warning')
             return render_template('index.html', form=form, has_choices=has_choices)
 
         if form.submit_view.data:
@@ -452,31 +427,6 @@ def teams_compare():
     team_cards: list[dict] = []
     comparison_rows: list[dict] = []
 
-    def _format_stat(value: float, metric_type: str) -> str:
-        if pd.isna(value):
-            return '—'
-        if metric_type == 'int':
-            return f"{int(round(value))}"
-        if metric_type == 'percent':
-            return f"{value * 100:.1f}%"
-        return f"{value:.3f}"
-
-    def _format_diff(diff_value: float, metric_type: str) -> tuple[str, str]:
-        if pd.isna(diff_value):
-            return '—', 'even'
-        if metric_type == 'int':
-            diff_int = int(round(diff_value))
-            if diff_int == 0:
-                return '0', 'even'
-            return f"{diff_int:+d}", 'positive' if diff_int > 0 else 'negative'
-        if metric_type == 'percent':
-            if abs(diff_value) < 0.0005:
-                return '0.0 pts', 'even'
-            return f"{diff_value * 100:+.1f} pts", 'positive' if diff_value > 0 else 'negative'
-        if abs(diff_value) < 0.0005:
-            return '0.000', 'even'
-        return f"{diff_value:+.3f}", 'positive' if diff_value > 0 else 'negative'
-
     def _build_team_card(team_meta: dict, summary: dict) -> dict:
         return {
             'title': f"{team_meta['name']} ({team_meta['teamID']})",
@@ -493,7 +443,7 @@ def teams_compare():
     if request.method == 'POST':
         if form.submit_load.data:
             if not has_choices:
-                flash('No teams found for that season. Enter a year between 1871 and 2024.', 'warning')
+                flash(_no_teams_message(), 'warning')
             elif not has_two_choices:
                 flash('Need at least two teams in the season to compare.', 'warning')
             return render_template(
@@ -519,14 +469,15 @@ def teams_compare():
                 valid = False
 
             if valid:
-                team_one_meta = _team_metadata(form.team_one.data, form.year.data)
-                team_two_meta = _team_metadata(form.team_two.data, form.year.data)
+                team_metadata, team_summaries = _team_comparison([form.team_one.data, form.team_two.data], form.year.data)
+                team_one_meta = team_metadata.get(form.team_one.data)
+                team_two_meta = team_metadata.get(form.team_two.data)
 
                 if not team_one_meta or not team_two_meta:
                     flash('Could not find one of the selected teams for that season.', 'danger')
                 else:
-                    _, summary_one, _ = _team_batting(form.team_one.data, form.year.data)
-                    _, summary_two, _ = _team_batting(form.team_two.data, form.year.data)
+                    summary_one = team_summaries[form.team_one.data]
+                    summary_two = team_summaries[form.team_two.data]
 
                     team_cards = [
                         _build_team_card(team_one_meta, summary_one),
@@ -538,18 +489,20 @@ def teams_compare():
                         ('obp', 'OBP', 'rate'),
                         ('slg', 'SLG', 'rate'),
                         ('ops', 'OPS', 'rate'),
+                        ('ops_plus', 'OPS+', 'int'),
                         ('sb_pct', 'SB%', 'percent'),
                         ('home_runs', 'Home Runs', 'int'),
                         ('stolen_bases', 'Stolen Bases', 'int'),
                     ]
 
-                    comparison_rows = []
+                    values_one, values_two = [], []
                     for key, label, metric_type in stat_config:
                         display_map = {
                             'avg': 'team_avg',
                             'obp': 'team_obp',
                             'slg': 'team_slg',
                             'ops': 'team_ops',
+                            'ops_plus': 'team_ops_plus',
                             'sb_pct': 'team_sb_pct',
                             'home_runs': 'home_runs',
                             'stolen_bases': 'stolen_bases',
@@ -565,14 +518,15 @@ def teams_compare():
                             display_one = summary_one[display_map[key]]
                             display_two = summary_two[display_map[key]]
 
-                        diff_display, diff_class = _format_diff(value_one - value_two, metric_type)
-                        comparison_rows.append({
-                            'label': label,
-                            'team_one': display_one,
-                            'team_two': display_two,
-                            'difference': diff_display,
-                            'diff_class': diff_class,
-                        })
+                        values_one.append(value_one)
+                        values_two.append(value_two)
+                        comparison_rows.append({'label': label, 'team_one': display_one, 'team_two': display_two})
+
+                    differences, diff_classes = _format_differences(
+                        np.subtract(values_one, values_two), [metric_type for _, _, metric_type in stat_config]
+                    )
+                    for row, difference, diff_class in zip(comparison_rows, differences, diff_classes):
+                        row.update(difference=difference, diff_class=diff_class)
 
                     comparison_ready = True
 
@@ -589,37 +543,38 @@ def teams_compare():
 
 @core_bp.route('/team/<team_id>/<int:year_id>')
 @login_required
+@conditional_dataset_response('team')
 def team_view(team_id: str, year_id: int):
-    if year_id < 1871 or year_id > 2024:
+    if not season_directory.covers(year_id):
         message = f"Season {year_id} is outside the supported range."
         return render_template('error.html', message=message), 404
 
-    team = _team_metadata(team_id, year_id)
+    team, fragments = query_executor.run(
+        lambda: _team_metadata(team_id, year_id),
+        lambda: _team_fragments(team_id, year_id),
+    )
     if not team:
         message = f"No records for team {team_id} in {year_id}."
         return render_template('error.html', message=message), 404
 
-    batting_df, extra_summary, _ = _team_batting(team_id, year_id)
-    if batting_df.empty:
+    if fragments is None:
         message = f"No batting stats available for team {team_id} in {year_id}."
         return render_template('error.html', message=message), 404
 
-    table_html = batting_df.to_html(classes='data-table', index=False, border=0, justify='center', escape=False)
-    leaders = extra_summary.get('leaders', {}) if extra_summary else {}
-
+    table_html, summary_html = fragments
     return render_template(
         'team.html',
         team=team,
         year_id=year_id,
         table_html=table_html,
-        summary=extra_summary,
-        leaders=leaders,
+        summary_html=summary_html,
     )
 
 @core_bp.route('/team/<team_id>/<int:year_id>/download')
 @login_required
+@conditional_dataset_response('team-csv')
 def team_download(team_id: str, year_id: int):
-    if year_id < 1871 or year_id > 2024:
+    if not season_directory.covers(year_id):
         message = f"Season {year_id} is outside the supported range."
         return render_template('error.html', message=message), 404
 
@@ -637,41 +592,7 @@ def team_download(team_id: str, year_id: int):
         message = f"No batting stats available for team {team_id} in {year_id}."
         return render_template('error.html', message=message), 404
 
-    def _format_rate(value: float) -> str:
-        return f"{value:.3f}" if not np.isnan(value) else '—'
-
-    def _format_percent(value: float) -> str:
-        return f"{value * 100:.1f}%" if not np.isnan(value) else '—'
-
-    def _format_int(value) -> str:
-        if value is None or (isinstance(value, float) and np.isnan(value)):
-            return ''
-        return str(int(value))
-
-    export_df = pd.DataFrame({
-        'Player ID': raw_df['playerID'],
-        'Player': raw_df['player_name'],
-        'Age': raw_df['age'].apply(lambda v: _format_int(v) if not np.isnan(v) else ''),
-        'Games': raw_df['games'].astype(int),
-        'At Bats': raw_df['at_bats'].astype(int),
-        'Hits': raw_df['hits'].astype(int),
-        'Doubles': raw_df['doubles'].astype(int),
-        'Triples': raw_df['triples'].astype(int),
-        'Home Runs': raw_df['home_runs'].astype(int),
-        'RBIs': raw_df['runs_batted_in'].astype(int),
-        'Walks': raw_df['walks'].astype(int),
-        'Strikeouts': raw_df['strikeouts'].astype(int),
-        'Stolen Bases': raw_df['stolen_bases'].astype(int),
-        'Caught Stealing': raw_df['caught_stealing'].astype(int),
-        'SB%': raw_df['sb_pct'].apply(_format_percent),
-        'AVG': raw_df['avg'].apply(_format_rate),
-        'OBP': raw_df['obp'].apply(_format_rate),
-        'SLG': raw_df['slg'].apply(_format_rate),
-        'OPS': raw_df['ops'].apply(_format_rate),
-        'Hall of Fame': raw_df['hall_of_famer'].apply(lambda v: 'Yes' if v else 'No'),
-        'All-Star': raw_df['all_star'].apply(lambda v: 'Yes' if v else 'No'),
-        'Badges': raw_df['badges_text'],
-    })
+    export_df = export_frame(raw_df, TEAM_EXPORT_COLUMNS)
 
     totals_row = {
         'Player ID': '',
@@ -693,23 +614,239 @@ def team_download(team_id: str, year_id: int):
         'OBP': summary.get('team_obp', ''),
         'SLG': summary.get('team_slg', ''),
         'OPS': summary.get('team_ops', ''),
+        'OPS+': summary.get('team_ops_plus', ''),
         'Hall of Fame': '',
         'All-Star': '',
         'Badges': '',
     }
-    export_df = pd.concat([export_df, pd.DataFrame([totals_row])], ignore_index=True)
-    csv_data = export_df.to_csv(index=False)
     filename = f"{team_id}_{year_id}_batting.csv"
-    response = make_response(csv_data)
-    response.headers['Content-Type'] = 'text/csv'
-    response.headers['Content-Disposition'] = f'attachment; filename={filename}'
-    return response
+    chunks = csv_chunks(
+        list(export_df.columns),
+        [export_df, pd.DataFrame([totals_row])],
+        current_app.config['EXPORT_CHUNK_ROWS'],
+    )
+    return csv_response(filename, chunks)
+
+
+def _bulk_batting_frames(batting_query: str, params: dict):
+    result = query_registry.stream(batting_query, params)
+    columns = list(result.keys())
+    for partition in result.partitions(current_app.config['EXPORT_CHUNK_ROWS']):
+        chunk = pd.DataFrame.from_records(partition, columns=columns, coerce_float=True)
+        chunk = _derive_player_batting(chunk, chunk['yearID'])
+        yield export_frame(chunk, BULK_EXPORT_COLUMNS)
+
+
+def _bulk_batting_response(filename: str, batting_query: str, params: dict):
+    headers = [header for header, _ in BULK_EXPORT_COLUMNS]
+    frames = _bulk_batting_frames(batting_query, params)
+    return csv_response(filename, csv_chunks(headers, frames, current_app.config['EXPORT_CHUNK_ROWS']))
+
+
+@core_bp.route('/season/<int:year_id>/download')
+@login_required
+@conditional_dataset_response('season-csv')
+def season_download(year_id: int):
+    if not season_directory.covers(year_id):
+        message = f"Season {year_id} is outside the supported range."
+        return render_template('error.html', message=message), 404
+
+    if not _team_choices_for_year(year_id):
+        message = f"No teams found for {year_id}."
+        return render_template('error.html', message=message), 404
+
+    batting_query = 'SEASON_BATTING_MATERIALIZED' if player_seasons_available() else 'SEASON_BATTING'
+    return _bulk_batting_response(f"{year_id}_season_batting.csv", batting_query, {'yearId': year_id})
+
+
+@core_bp.route('/franchise/<franch_id>/download')
+@login_required
+@conditional_dataset_response('franchise-csv')
+def franchise_download(franch_id: str):
+    record = query_registry.first('FRANCHISE_SEASONS', {'franchId': franch_id})
+    if not record or not record['seasons']:
+        message = f"No records for franchise {franch_id}."
+        return render_template('error.html', message=message), 404
+
+    batting_query = 'FRANCHISE_BATTING_MATERIALIZED' if player_seasons_available() else 'FRANCHISE_BATTING'
+    filename = f"{franch_id}_{record['first_year']}-{record['last_year']}_batting.csv"
+    return _bulk_batting_response(filename, batting_query, {'franchId': franch_id})
+
+
+def _career_range_summary(totals: pd.Series) -> dict:
+    frame = add_rate_columns(totals.to_frame().T.astype(float))
+    row = frame.iloc[0]
+    counts = ['seasons', 'games', 'at_bats', 'hits', 'home_runs', 'runs_batted_in', 'walks', 'stolen_bases']
+    rates = ['avg', 'obp', 'slg', 'ops']
+    return {
+        **dict(zip(counts, format_whole(row[counts]))),
+        **dict(zip(rates, format_rate(row[rates]))),
+    }
+
+
+def _career_table(career) -> pd.DataFrame:
+    seasons = career.season_frame()
+    ages = seasons['yearID'] - career.birth_year if career.birth_year else np.full(len(seasons), np.nan)
+    table = pd.DataFrame({
+        'Year': seasons['yearID'].astype(str),
+        'Team': seasons['teams'],
+        'Age': format_whole(ages),
+        'Games': seasons['games'].astype(int),
+        'At Bats': seasons['at_bats'].astype(int),
+        'Hits': seasons['hits'].astype(int),
+        'Doubles': seasons['doubles'].astype(int),
+        'Triples': seasons['triples'].astype(int),
+        'Home Runs': seasons['home_runs'].astype(int),
+        'RBIs': seasons['runs_batted_in'].astype(int),
+        'Walks': seasons['walks'].astype(int),
+        'Strikeouts': seasons['strikeouts'].astype(int),
+        'Stolen Bases': seasons['stolen_bases'].astype(int),
+        'Caught Stealing': seasons['caught_stealing'].astype(int),
+        'AVG': format_rate(seasons['avg']),
+        'OBP': format_rate(seasons['obp']),
+        'SLG': format_rate(seasons['slg']),
+        'OPS': format_rate(seasons['ops']),
+        'OPS+': format_index(seasons['ops_plus']),
+        'Career AVG': format_rate(seasons['career_avg']),
+        'Career OBP': format_rate(seasons['career_obp']),
+        'Career SLG': format_rate(seasons['career_slg']),
+        'Career OPS': format_rate(seasons['career_ops']),
+    })
+
+    count_columns = {
+        'Games': 'games',
+        'At Bats': 'at_bats',
+        'Hits': 'hits',
+        'Doubles': 'doubles',
+        'Triples': 'triples',
+        'Home Runs': 'home_runs',
+        'RBIs': 'runs_batted_in',
+        'Walks': 'walks',
+        'Strikeouts': 'strikeouts',
+        'Stolen Bases': 'stolen_bases',
+        'Caught Stealing': 'caught_stealing',
+    }
+    rate_columns = {'AVG': 'career_avg', 'OBP': 'career_obp', 'SLG': 'career_slg', 'OPS': 'career_ops'}
+    career_row = {column: '' for column in table.columns}
+    career_row['Year'] = 'Career'
+    career_row.update(zip(count_columns, format_whole(seasons[list(count_columns.values())].sum())))
+    career_row.update(zip(rate_columns, format_rate(seasons[list(rate_columns.values())].iloc[-1])))
+    return pd.concat([table, pd.DataFrame([career_row])], ignore_index=True)
+
+
+@core_bp.route('/player/<player_id>')
+@login_required
+@conditional_dataset_response('player', query_args=('start', 'end'))
+def player_view(player_id: str):
+    career = player_career(player_id)
+    if career is None:
+        message = f"No batting records for player {player_id}."
+        return render_template('error.html', message=message), 404
+
+    start_year = request.args.get('start', type=int) or career.first_year
+    end_year = request.args.get('end', type=int) or career.last_year
+    if start_year > end_year:
+        start_year, end_year = end_year, start_year
+
+    table_html = _career_table(career).to_html(
+        classes='data-table', index=False, border=0, justify='center', escape=False
+    )
+    return render_template(
+        'player.html',
+        career=career,
+        start_year=start_year,
+        end_year=end_year,
+        range_totals=_career_range_summary(career.range_totals(start_year, end_year)),
+        table_html=table_html,
+    )
+
+
+def _leaders_table(leaders: pd.DataFrame, stat: str, scope: str) -> pd.DataFrame:
+    label, kind = LEADERBOARD_STATS[stat]
+    if kind == 'rate':
+        values = format_rate(leaders[stat])
+    elif kind == 'index':
+        values = format_index(leaders[stat])
+    else:
+        values = leaders[stat].astype(int)
+
+    base_url = url_for('core.player_view', player_id='')
+    table = pd.DataFrame({
+        'Rank': leaders['rank'],
+        'Player': player_links(leaders['playerID'], leaders['player_name'], base_url),
+    })
+    if scope == 'season':
+        table['Team'] = leaders['teams'].to_numpy()
+    else:
+        table['Seasons'] = (leaders['first_year'].astype(str) + '–' + leaders['last_year'].astype(str)).to_numpy()
+    table['PA'] = leaders['plate_appearances'].astype(int).to_numpy()
+    table[label] = np.asarray(values)
+
+    context_columns = [
+        ('avg', 'AVG', format_rate),
+        ('obp', 'OBP', format_rate),
+        ('slg', 'SLG', format_rate),
+        ('home_runs', 'Home Runs', None),
+        ('runs_batted_in', 'RBIs', None),
+    ]
+    for column, heading, formatter in context_columns:
+        if column != stat:
+            table[heading] = formatter(leaders[column]) if formatter else leaders[column].astype(int).to_numpy()
+    return table
+
+
+@core_bp.route('/leaders')
+@login_required
+@conditional_dataset_response('leaders', query_args=('stat', 'scope', 'year', 'min_pa', 'page', 'per_page'))
+def leaders_view():
+    stat = request.args.get('stat', 'ops')
+    scope = request.args.get('scope', 'season')
+    if stat not in LEADERBOARD_STATS or scope not in SCOPES:
+        message = f"No leaderboard for {stat} ({scope})."
+        return render_template('error.html', message=message), 404
+
+    year_id = request.args.get('year', type=int) or leaderboards.last_season()
+    min_pa = request.args.get('min_pa', type=int)
+    if min_pa is None:
+        min_pa = leaderboards.default_min_pa(stat, scope)
+    per_page = min(max(request.args.get('per_page', 50, type=int), 1), 200)
+    page = max(request.args.get('page', 1, type=int), 1)
+
+    if scope == 'season' and year_id is None:
+        # No seasons loaded at all: render an empty board.
+        leaders, total = pd.DataFrame(), 0
+    else:
+        leaders, total = leaderboards.leaders(
+            stat, scope, year_id if scope == 'season' else None, max(min_pa, 0), (page - 1) * per_page, per_page
+        )
+    table_html = None
+    if not leaders.empty:
+        table_html = _leaders_table(leaders, stat, scope).to_html(
+            classes='data-table plain-rows', index=False, border=0, justify='center', escape=False
+        )
+
+    page_args = {'stat': stat, 'scope': scope, 'min_pa': min_pa, 'per_page': per_page}
+    if scope == 'season':
+        page_args['year'] = year_id
+    return render_template(
+        'leaders.html',
+        stats=LEADERBOARD_STATS,
+        stat=stat,
+        scope=scope,
+        year_id=year_id,
+        min_pa=min_pa,
+        page=page,
+        pages=max((total + per_page - 1) // per_page, 1),
+        total=total,
+        page_args=page_args,
+        table_html=table_html,
+    )
 
 
 @core_bp.route('/team/<team_id>/<int:year_id>/compare', methods=['GET', 'POST'])
 @login_required
 def team_compare(team_id: str, year_id: int):
-    if year_id < 1871 or year_id > 2024:
+    if not season_directory.covers(year_id):
         message = f"Season {year_id} is outside the supported range."
         return render_template('error.html', message=message), 404
 
@@ -760,36 +897,9 @@ def team_compare(team_id: str, year_id: int):
         ('obp', 'OBP', 'rate'),
         ('slg', 'SLG', 'rate'),
         ('ops', 'OPS', 'rate'),
+        ('ops_plus', 'OPS+', 'int'),
     ]
 
-    def _format_stat(value, metric_type: str) -> str:
-        if pd.isna(value):
-            return '—'
-        if metric_type == 'int':
-            return f"{int(round(value))}"
-        if metric_type == 'percent':
-            return f"{value * 100:.1f}%"
-        return f"{value:.3f}"
-
-    def _format_diff(diff_value, metric_type: str) -> tuple[str, str]:
-        if pd.isna(diff_value):
-            return '—', 'even'
-
-        if metric_type in {'int'}:
-            diff_int = int(round(diff_value))
-            if diff_int == 0:
-                return '0', 'even'
-            return f"{diff_int:+d}", 'positive' if diff_int > 0 else 'negative'
-
-        if metric_type == 'percent':
-            if abs(diff_value) < 0.0005:
-                return '0.0 pts', 'even'
-            return f"{diff_value * 100:+.1f} pts", 'positive' if diff_value > 0 else 'negative'
-
-        if abs(diff_value) < 0.0005:
-            return '0.000', 'even'
-        return f"{diff_value:+.3f}", 'positive' if diff_value > 0 else 'negative'
-
     def _build_player_card(player_id: str, row: pd.Series) -> dict:
         return {
             'id': player_id,
@@ -798,9 +908,9 @@ def team_compare(team_id: str, year_id: int):
             'badges_text': row['badges_text'],
             'hall_of_famer': bool(row['hall_of_famer']),
             'all_star': bool(row['all_star']),
-            'slash_line': f"{_format_stat(row['avg'], 'rate')}/{_format_stat(row['obp'], 'rate')}/{_format_stat(row['slg'], 'rate')}",
-            'ops_display': _format_stat(row['ops'], 'rate'),
-            'sb_pct_display': _format_stat(row['sb_pct'], 'percent'),
+            'slash_line': f"{row['avg_display']}/{row['obp_display']}/{row['slg_display']}",
+            'ops_display': row['ops_display'],
+            'sb_pct_display': row['sb_pct_display'],
         }
 
     def _build_comparison(player_one_id: str, player_two_id: str):
@@ -815,23 +925,22 @@ def team_compare(team_id: str, year_id: int):
             _build_player_card(player_two_id, row_two),
         ]
 
+        keys = [key for key, _, _ in stat_config]
+        metric_types = [metric_type for _, _, metric_type in stat_config]
+        values_one = np.array([row_one.get(key) for key in keys], dtype=float)
+        values_two = np.array([row_two.get(key) for key in keys], dtype=float)
+        displays_one, displays_two = _format_stats(values_one, metric_types), _format_stats(values_two, metric_types)
+        differences, diff_classes = _format_differences(values_one - values_two, metric_types)
+
         comparison_rows = []
-        for key, label, metric_type in stat_config:
-            value_one = row_one.get(key)
-            value_two = row_two.get(key)
-            display_one = _format_stat(value_one, metric_type)
-            display_two = _format_stat(value_two, metric_type)
-            if pd.isna(value_one) or pd.isna(value_two):
-                diff_display, diff_class = '—', 'even'
-            else:
-                diff_val = value_one - value_two
-                diff_display, diff_class = _format_diff(diff_val, metric_type)
+        for index, (key, label, _) in enumerate(stat_config):
+            display_key = f"{key}_display"
             comparison_rows.append({
                 'label': label,
-                'player_one': display_one,
-                'player_two': display_two,
-                'difference': diff_display,
-                'diff_class': diff_class,
+                'player_one': row_one[display_key] if display_key in row_one else displays_one[index],
+                'player_two': row_two[display_key] if display_key in row_two else displays_two[index],
+                'difference': differences[index],
+                'diff_class': diff_classes[index],
             })
         return cards, comparison_rows
 
@@ -903,7 +1012,7 @@ def game():
     game_over = state.get('lives', 0) <= 0
 
     if not game_over and question is None:
-        question = _generate_trivia_question()
+        question = trivia_pool.pop()
         if question:
             session['trivia_question'] = question
         else:
@@ -0,0 +1,42 @@
+import threading
+from typing import Optional
+
+from .registry import query_registry
+
+
+class SeasonDirectory:
+    def __init__(self):
+        self._teams_by_year: Optional[dict[int, list[tuple[str, str]]]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[int, list[tuple[str, str]]]:
+        teams_by_year: dict[int, list[tuple[str, str]]] = {}
+        for row in query_registry.rows('SEASON_TEAM_DIRECTORY'):
+            teams_by_year.setdefault(int(row['yearID']), []).append((row['teamID'], row['name']))
+        return teams_by_year
+
+    def all(self) -> dict[int, list[tuple[str, str]]]:
+        if self._teams_by_year is None:
+            with self._lock:
+                if self._teams_by_year is None:
+                    self._teams_by_year = self._load()
+        return self._teams_by_year
+
+    def teams(self, year_id: int) -> list[tuple[str, str]]:
+        # (teamID, name) pairs ordered by teamID; empty for seasons without teams.
+        return self.all().get(int(year_id), [])
+
+    def bounds(self) -> tuple[int, int]:
+        years = self.all()
+        return (min(years), max(years)) if years else (0, 0)
+
+    def covers(self, year_id: int) -> bool:
+        first, last = self.bounds()
+        return first <= year_id <= last
+
+    def reload(self) -> None:
+        with self._lock:
+            self._teams_by_year = None
+
+
+season_directory = SeasonDirectory()
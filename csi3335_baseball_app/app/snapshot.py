@@ -0,0 +1,351 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+import click
+import numpy as np
+import pandas as pd
+from flask import current_app
+from flask.cli import with_appcontext
+
+from . import db
+from .registry import query_registry
+from .stats import COUNTING_COLUMNS
+
+SNAPSHOT_FORMAT = 1
+MANIFEST_FILE = 'manifest.json'
+STRINGS_FILE = 'strings.npy'
+
+# table -> (export query name, dictionary-encoded columns, sort order). Rows are stored sorted so a
+# season, a team-season or a player is a contiguous slice found by binary search.
+SNAPSHOT_TABLES = {
+    'batting': ('SNAPSHOT_BATTING', ('playerID', 'teamID'), ('yearID', 'teamID', 'playerID', 'stint')),
+    'people': ('SNAPSHOT_PEOPLE', ('playerID', 'nameFirst', 'nameLast'), ('playerID',)),
+    'teams': ('SNAPSHOT_TEAMS', ('teamID', 'name', 'franchID', 'lgID'), ('yearID', 'teamID')),
+    'halloffame': ('HALL_OF_FAME_INDUCTEES', ('playerID',), ('playerID',)),
+    'allstarfull': ('ALL_STAR_SEASONS', ('playerID',), ('playerID', 'yearID')),
+}
+TRIVIA_YEARS = (1901, 2024)
+TEAM_INFO_COLUMNS = ['teamID', 'name', 'franchID', 'lgID', 'W', 'L']
+
+
+def _encode_column(frame: pd.DataFrame, column: str, strings: Optional[np.ndarray]) -> np.ndarray:
+    if strings is not None:
+        return np.searchsorted(strings, frame[column].fillna('').astype(str).to_numpy(dtype=str)).astype(np.int32)
+    # Every reader treats missing counting stats as zero; other numeric NULLs (birthYear) stay NaN.
+    if frame[column].isna().any() and column not in COUNTING_COLUMNS:
+        return frame[column].to_numpy(dtype=np.float64)
+    return frame[column].fillna(0).to_numpy(dtype=np.int64).astype(np.int32)
+
+
+def export_snapshot(directory: str) -> dict[str, int]:
+    frames = {}
+    with db.engine.connect() as connection:
+        for table, (query_name, _, _) in SNAPSHOT_TABLES.items():
+            frames[table] = query_registry.frame(query_name, connection=connection)
+
+    # One sorted dictionary for every ID and name, so codes compare in the same order as the strings.
+    strings = np.unique(np.concatenate([
+        frames[table][column].fillna('').astype(str).to_numpy(dtype=str)
+        for table, (_, string_columns, _) in SNAPSHOT_TABLES.items()
+        for column in string_columns
+    ]))
+
+    directory = os.path.abspath(directory)
+    os.makedirs(os.path.dirname(directory), exist_ok=True)
+    staging = tempfile.mkdtemp(prefix='.snapshot-', dir=os.path.dirname(directory))
+    manifest = {
+        'format': SNAPSHOT_FORMAT,
+        'dataset_version': current_app.config['DATASET_VERSION'],
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'strings': len(strings),
+        'tables': {},
+    }
+    np.save(os.path.join(staging, STRINGS_FILE), strings)
+    for table, (_, string_columns, sort_columns) in SNAPSHOT_TABLES.items():
+        frame = frames[table]
+        columns = {
+            column: _encode_column(frame, column, strings if column in string_columns else None)
+            for column in frame.columns
+        }
+        order = np.lexsort([columns[column] for column in reversed(sort_columns)])
+        os.mkdir(os.path.join(staging, table))
+        for column, values in columns.items():
+            np.save(os.path.join(staging, table, f"{column}.npy"), values[order])
+        manifest['tables'][table] = {'rows': len(frame), 'columns': list(columns)}
+    with open(os.path.join(staging, MANIFEST_FILE), 'w') as handle:
+        json.dump(manifest, handle, indent=2)
+
+    # Swap directories so a reader never sees a half-written snapshot. Workers that already
+    # mapped the old files keep reading them until they restart.
+    previous = None
+    if os.path.exists(directory):
+        previous = f"{staging}-previous"
+        os.rename(directory, previous)
+    os.rename(staging, directory)
+    if previous:
+        shutil.rmtree(previous)
+    return {table: spec['rows'] for table, spec in manifest['tables'].items()}
+
+
+class Snapshot:
+    def __init__(self, directory: str = ''):
+        self.directory = directory
+        self.dataset_version: Optional[str] = None
+        self._logger = None
+        self._data: Optional[dict] = None
+        self._derived: dict = {}
+        self._lock = threading.RLock()
+
+    def init_app(self, app) -> None:
+        self.directory = app.config.setdefault('SNAPSHOT_DIR', self.directory)
+        self.dataset_version = app.config.get('DATASET_VERSION')
+        self._logger = app.logger
+        self.reload()
+
+    def _load(self) -> dict:
+        manifest_path = os.path.join(self.directory, MANIFEST_FILE)
+        if not self.directory or not os.path.exists(manifest_path):
+            return {}
+        with open(manifest_path) as handle:
+            manifest = json.load(handle)
+        if manifest.get('format') != SNAPSHOT_FORMAT or manifest.get('dataset_version') != self.dataset_version:
+            if self._logger is not None:
+                self._logger.warning(
+                    'Ignoring snapshot in %s: built for dataset %s, serving %s. Run flask export-snapshot.',
+                    self.directory, manifest.get('dataset_version'), self.dataset_version,
+                )
+            return {}
+
+        # mmap_mode='r' maps the files read-only, so every worker shares the same page cache pages.
+        data = {'strings': np.load(os.path.join(self.directory, STRINGS_FILE), mmap_mode='r')}
+        for table, spec in manifest['tables'].items():
+            data[table] = {
+                column: np.load(os.path.join(self.directory, table, f"{column}.npy"), mmap_mode='r')
+                for column in spec['columns']
+            }
+        return data
+
+    def _tables(self) -> dict:
+        if self._data is None:
+            with self._lock:
+                if self._data is None:
+                    self._data = self._load()
+        return self._data
+
+    def available(self) -> bool:
+        return bool(self._tables())
+
+    def _code(self, value: str) -> int:
+        strings = self._tables()['strings']
+        position = int(np.searchsorted(strings, value))
+        return position if position < len(strings) and strings[position] == value else -1
+
+    def _decode(self, codes) -> np.ndarray:
+        return np.asarray(self._tables()['strings'][codes]).astype(object)
+
+    def _team_key(self, year_ids, team_codes) -> np.ndarray:
+        # Composite (year, team) key; increases with the teams table's (yearID, teamID) order.
+        return np.asarray(year_ids, dtype=np.int64) * len(self._tables()['strings']) + np.asarray(team_codes, dtype=np.int64)
+
+    def _derived_array(self, name: str, build):
+        # Small per-process lookup arrays computed from the mapped columns on first use.
+        if name not in self._derived:
+            with self._lock:
+                if name not in self._derived:
+                    self._derived[name] = build()
+        return self._derived[name]
+
+    def _season_slice(self, table: str, year_id: int) -> tuple[int, int]:
+        years = self._tables()[table]['yearID']
+        return int(np.searchsorted(years, year_id, side='left')), int(np.searchsorted(years, year_id, side='right'))
+
+    def _team_slice(self, team_code: int, year_id: int) -> tuple[int, int]:
+        start, end = self._season_slice('batting', year_id)
+        teams = self._tables()['batting']['teamID'][start:end]
+        return (
+            start + int(np.searchsorted(teams, team_code, side='left')),
+            start + int(np.searchsorted(teams, team_code, side='right')),
+        )
+
+    def _people(self, player_codes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Returns the people row for each player code plus a mask of the ones that exist.
+        people_ids = self._tables()['people']['playerID']
+        positions = np.minimum(np.searchsorted(people_ids, player_codes), len(people_ids) - 1)
+        return positions, np.asarray(people_ids[positions]) == player_codes
+
+    def _player_names(self, positions: np.ndarray) -> np.ndarray:
+        people = self._tables()['people']
+        first = self._decode(people['nameFirst'][positions])
+        last = self._decode(people['nameLast'][positions])
+        return np.array([' '.join(part for part in pair if part) for pair in zip(first, last)], dtype=object)
+
+    def _player_totals(self, start: int, end: int) -> pd.DataFrame:
+        # Sums stints per player inside one team-season slice, which is sorted by playerID.
+        batting = self._tables()['batting']
+        players = np.asarray(batting['playerID'][start:end])
+        if not len(players):
+            return pd.DataFrame(columns=['playerID', 'player_name', 'birthYear'] + COUNTING_COLUMNS)
+        starts = np.flatnonzero(np.r_[True, players[1:] != players[:-1]])
+        totals = pd.DataFrame({
+            column: np.add.reduceat(np.asarray(batting[column][start:end], dtype=np.int64), starts)
+            for column in COUNTING_COLUMNS
+        })
+        positions, found = self._people(players[starts])
+        totals.insert(0, 'playerID', self._decode(players[starts]))
+        totals.insert(1, 'player_name', self._player_names(positions))
+        totals.insert(2, 'birthYear', np.asarray(self._tables()['people']['birthYear'][positions]))
+        return totals[found].reset_index(drop=True)
+
+    def team_batting(self, team_id: str, year_id: int) -> pd.DataFrame:
+        # Same columns and order as queries.TEAM_BATTING.
+        team_code = self._code(team_id)
+        if team_code < 0:
+            return self._player_totals(0, 0)
+        totals = self._player_totals(*self._team_slice(team_code, year_id))
+        order = np.lexsort((-totals['hits'].to_numpy(), -totals['home_runs'].to_numpy()))
+        return totals.iloc[order].reset_index(drop=True)
+
+    def _team_row(self, team_code: int, year_id: int) -> Optional[dict]:
+        # The team-season's metadata shaped like queries.TEAM_INFO, or None when it is not in the teams table.
+        teams = self._tables()['teams']
+        start, end = self._season_slice('teams', year_id)
+        position = start + int(np.searchsorted(teams['teamID'][start:end], team_code))
+        if team_code < 0 or position >= end or teams['teamID'][position] != team_code:
+            return None
+        strings = self._tables()['strings']
+        return {
+            column: str(strings[teams[column][position]]) if column in SNAPSHOT_TABLES['teams'][1] else int(teams[column][position])
+            for column in TEAM_INFO_COLUMNS
+        }
+
+    def team_info(self, team_id: str, year_id: int) -> Optional[dict]:
+        return self._team_row(self._code(team_id), year_id)
+
+    def teams_comparison(self, team_ids: list[str], year_id: int) -> pd.DataFrame:
+        # Same columns as queries.TEAMS_COMPARISON: one row per player, or one bare row for a team without batting.
+        frames = []
+        for team_code in sorted({self._code(team_id) for team_id in team_ids} - {-1}):
+            team = self._team_row(team_code, year_id)
+            if team is None:
+                continue
+            players = self._player_totals(*self._team_slice(team_code, year_id)).drop(columns=['player_name', 'birthYear'])
+            if players.empty:
+                players = pd.DataFrame({'playerID': [None]})
+            for column in reversed(TEAM_INFO_COLUMNS):
+                players.insert(0, column, team[column])
+            frames.append(players)
+        if not frames:
+            return pd.DataFrame(columns=TEAM_INFO_COLUMNS + ['playerID'] + COUNTING_COLUMNS)
+        return pd.concat(frames, ignore_index=True).reindex(columns=TEAM_INFO_COLUMNS + ['playerID'] + COUNTING_COLUMNS)
+
+    def _trivia_groups(self) -> dict:
+        batting = self._tables()['batting']
+        years = np.asarray(batting['yearID'])
+        teams = np.asarray(batting['teamID'])
+        players = np.asarray(batting['playerID'])
+        starts = np.flatnonzero(np.r_[True, (years[1:] != years[:-1]) | (teams[1:] != teams[:-1]) | (players[1:] != players[:-1])])
+        ends = np.r_[starts[1:], len(years)]
+        in_range = (years[starts] >= TRIVIA_YEARS[0]) & (years[starts] <= TRIVIA_YEARS[1])
+        prefix = {
+            column: np.r_[0, np.cumsum(np.asarray(batting[column], dtype=np.int64))]
+            for column in ('home_runs', 'runs_batted_in', 'hits')
+        }
+        return {'starts': starts[in_range], 'ends': ends[in_range], 'prefix': prefix}
+
+    def _team_keys(self) -> np.ndarray:
+        teams = self._tables()['teams']
+        return self._team_key(teams['yearID'], teams['teamID'])
+
+    def trivia_player_seasons(self, count: int) -> list[dict]:
+        # Uniform sample of (player, team, season) rows shaped like queries.TRIVIA_PLAYER_SEASON_SAMPLE.
+        groups = self._derived_array('trivia_groups', self._trivia_groups)
+        if not len(groups['starts']):
+            return []
+        chosen = np.random.default_rng().choice(len(groups['starts']), size=min(count, len(groups['starts'])), replace=False)
+        starts, ends = groups['starts'][chosen], groups['ends'][chosen]
+
+        batting = self._tables()['batting']
+        player_codes = np.asarray(batting['playerID'][starts])
+        team_codes = np.asarray(batting['teamID'][starts])
+        years = np.asarray(batting['yearID'][starts])
+        people_positions, has_person = self._people(player_codes)
+        team_keys = self._derived_array('team_keys', self._team_keys)
+        team_positions = np.minimum(np.searchsorted(team_keys, self._team_key(years, team_codes)), len(team_keys) - 1)
+        has_team = team_keys[team_positions] == self._team_key(years, team_codes)
+
+        keep = has_person & has_team
+        totals = {column: (prefix[ends] - prefix[starts])[keep] for column, prefix in groups['prefix'].items()}
+        names = self._player_names(people_positions[keep])
+        team_names = self._decode(self._tables()['teams']['name'][team_positions[keep]])
+        return [
+            {
+                'player_name': name,
+                'player_id': player_id,
+                'team_id': team_id,
+                'year_id': int(year_id),
+                'home_runs': int(home_runs),
+                'runs_batted_in': int(runs_batted_in),
+                'hits': int(hits),
+                'team_name': team_name,
+            }
+            for name, player_id, team_id, year_id, home_runs, runs_batted_in, hits, team_name in zip(
+                names,
+                self._decode(player_codes[keep]),
+                self._decode(team_codes[keep]),
+                years[keep],
+                totals['home_runs'],
+                totals['runs_batted_in'],
+                totals['hits'],
+                team_names,
+            )
+        ]
+
+    def teams_for_years(self, year_ids) -> list[dict]:
+        # Shaped like queries.TRIVIA_TEAMS_FOR_YEARS.
+        teams = self._tables()['teams']
+        rows = []
+        for year_id in year_ids:
+            start, end = self._season_slice('teams', year_id)
+            for team_id, team_name in zip(self._decode(teams['teamID'][start:end]), self._decode(teams['name'][start:end])):
+                rows.append({'yearID': int(year_id), 'teamID': team_id, 'team_name': team_name})
+        return rows
+
+    def award_frames(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        # Shaped like queries.HALL_OF_FAME_INDUCTEES and queries.ALL_STAR_SEASONS.
+        tables = self._tables()
+        inductees = pd.DataFrame({'playerID': self._decode(tables['halloffame']['playerID'])})
+        all_stars = pd.DataFrame({
+            'playerID': self._decode(tables['allstarfull']['playerID']),
+            'yearID': np.asarray(tables['allstarfull']['yearID']),
+        })
+        return inductees, all_stars
+
+    def reload(self) -> None:
+        with self._lock:
+            self._data = None
+            self._derived = {}
+
+
+snapshot = Snapshot()
+
+
+@click.command('export-snapshot')
+@click.option('--output', 'directory', default=None, help='Snapshot directory (defaults to SNAPSHOT_DIR).')
+@with_appcontext
+def export_snapshot_command(directory: Optional[str]) -> None:
+    """Export batting, people, teams and award tables as memory-mapped NumPy columns."""
+    directory = directory or current_app.config.get('SNAPSHOT_DIR')
+    if not directory:
+        raise click.ClickException('Pass --output or set SNAPSHOT_DIR.')
+    started = time.perf_counter()
+    row_counts = export_snapshot(directory)
+    elapsed = time.perf_counter() - started
+    summary = ', '.join(f"{table} {rows}" for table, rows in row_counts.items())
+    click.echo(f"Wrote snapshot to {os.path.abspath(directory)} ({summary} rows) in {elapsed:.1f}s.")
+    click.echo('Restart the app workers to serve from it.')
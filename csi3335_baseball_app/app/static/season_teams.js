@@ -0,0 +1,58 @@
+// Fills the team dropdowns from the season directory API while a year is typed, so the
+// "Load Teams" round trip is only needed when JavaScript is off.
+(function () {
+    document.querySelectorAll('form[data-season-teams-url]').forEach(function (form) {
+        var yearInput = form.querySelector('input[name="year"]');
+        var selects = form.getAttribute('data-team-fields').split(' ').map(function (name) {
+            return form.querySelector('select[name="' + name + '"]');
+        });
+        var teamsByYear = {};
+        var timer = null;
+
+        function fill(teams) {
+            var teamIds = teams.map(function (team) { return team.teamID; });
+            selects.forEach(function (select, index) {
+                var previous = select.value;
+                select.innerHTML = '';
+                teams.forEach(function (team) {
+                    var option = document.createElement('option');
+                    option.value = team.teamID;
+                    option.textContent = team.teamID + ' — ' + team.name;
+                    select.appendChild(option);
+                });
+                if (teamIds.indexOf(previous) >= 0) {
+                    select.value = previous;
+                } else if (teamIds.length > index) {
+                    select.value = teamIds[index];
+                }
+                select.disabled = teams.length === 0;
+            });
+        }
+
+        function load() {
+            var year = parseInt(yearInput.value, 10);
+            if (!year) {
+                return;
+            }
+            if (teamsByYear[year]) {
+                fill(teamsByYear[year]);
+                return;
+            }
+            var url = form.getAttribute('data-season-teams-url').replace('{year}', year);
+            fetch(url, { credentials: 'same-origin', headers: { Accept: 'application/json' } })
+                .then(function (response) { return response.ok ? response.json() : { teams: [] }; })
+                .then(function (payload) {
+                    teamsByYear[year] = payload.teams;
+                    if (parseInt(yearInput.value, 10) === year) {
+                        fill(payload.teams);
+                    }
+                })
+                .catch(function () {});
+        }
+
+        yearInput.addEventListener('input', function () {
+            clearTimeout(timer);
+            timer = setTimeout(load, 250);
+        });
+    });
+})();
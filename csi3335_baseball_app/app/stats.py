@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+COUNTING_COLUMNS = [
+    'games',
+    'at_bats',
+    'hits',
+    'doubles',
+    'triples',
+    'home_runs',
+    'runs_batted_in',
+    'walks',
+    'strikeouts',
+    'stolen_bases',
+    'caught_stealing',
+    'hit_by_pitch',
+    'sacrifice_flies',
+    'sacrifice_hits',
+]
+
+
+def add_rate_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    singles = (frame['hits'] - frame['doubles'] - frame['triples'] - frame['home_runs']).clip(lower=0)
+    frame['total_bases'] = singles + (2 * frame['doubles']) + (3 * frame['triples']) + (4 * frame['home_runs'])
+    frame['plate_appearances'] = (
+        frame['at_bats']
+        + frame['walks']
+        + frame['hit_by_pitch']
+        + frame['sacrifice_flies']
+        + frame['sacrifice_hits']
+    )
+    return add_rates_from_totals(frame)
+
+
+def add_rates_from_totals(frame: pd.DataFrame) -> pd.DataFrame:
+    plate_appearances = frame['plate_appearances']
+    frame['avg'] = np.where(frame['at_bats'] > 0, frame['hits'] / frame['at_bats'], 0)
+    frame['obp'] = np.where(
+        plate_appearances > 0,
+        (frame['hits'] + frame['walks'] + frame['hit_by_pitch']) / plate_appearances,
+        0,
+    )
+    frame['slg'] = np.where(frame['at_bats'] > 0, frame['total_bases'] / frame['at_bats'], 0)
+    frame['ops'] = frame['obp'] + frame['slg']
+
+    sb_attempts = frame['stolen_bases'] + frame['caught_stealing']
+    frame['sb_pct'] = np.where(sb_attempts > 0, frame['stolen_bases'] / sb_attempts, np.nan)
+    return frame
+
+
+def ops_plus(obp, slg, league_obp, league_slg):
+    league_obp = np.asarray(league_obp, dtype=float)
+    league_slg = np.asarray(league_slg, dtype=float)
+    valid = (league_obp > 0) & (league_slg > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        value = 100 * (np.asarray(obp, dtype=float) / league_obp + np.asarray(slg, dtype=float) / league_slg - 1)
+    return np.where(valid, value, np.nan)
@@ -0,0 +1,195 @@
+import random
+import threading
+from collections import deque
+from typing import Optional
+
+from .materialized import player_seasons_available
+from .registry import query_registry
+from .snapshot import snapshot
+
+
+def _stat_option_values(correct_value: int, count: int = 4):
+    options = {max(0, int(correct_value))}
+    while len(options) < count:
+        jitter = random.randint(-8, 12)
+        candidate = max(0, correct_value + jitter)
+        options.add(candidate)
+    values = list(options)
+    random.shuffle(values)
+    return values
+
+
+def _build_question(record: dict, other_teams: list[dict]) -> Optional[dict]:
+    question_builders = ['team', 'stat_hits', 'stat_home_runs', 'stat_rbi']
+    random.shuffle(question_builders)
+
+    for builder in question_builders:
+        if builder == 'team':
+            if len(other_teams) < 3:
+                continue
+            options = [
+                {'id': record['team_id'], 'label': f"{record['team_name']} ({record['team_id']})", 'is_correct': True}
+            ]
+            for row in other_teams:
+                options.append({'id': row['teamID'], 'label': f"{row['team_name']} ({row['teamID']})", 'is_correct': False})
+            random.shuffle(options)
+            correct_option = next(opt for opt in options if opt['is_correct'])
+            return {
+                'prompt': f"Which team did {record['player_name']} play for in {record['year_id']}?",
+                'options': [{'id': str(opt['id']), 'label': opt['label']} for opt in options],
+                'correct_id': str(correct_option['id']),
+                'correct_label': correct_option['label'],
+                'detail': f"{record['player_name']} appeared for {record['team_name']} in {record['year_id']}.",
+            }
+
+        if builder.startswith('stat_'):
+            metric_map = {
+                'stat_hits': ('hits', 'hit', 'hits'),
+                'stat_home_runs': ('home_runs', 'home run', 'home runs'),
+                'stat_rbi': ('runs_batted_in', 'RBI', 'RBIs'),
+            }
+            metric_key, singular, plural = metric_map[builder]
+            correct_value = int(record.get(metric_key) or 0)
+            option_values = _stat_option_values(correct_value)
+            options = []
+            for val in option_values:
+                label_text = singular if val == 1 else plural
+                options.append({'id': str(val), 'label': f"{val} {label_text}"})
+            random.shuffle(options)
+            answer_label = singular if correct_value == 1 else plural
+            return {
+                'prompt': f"How many {plural} did {record['player_name']} record for {record['team_name']} in {record['year_id']}?",
+                'options': options,
+                'correct_id': str(correct_value),
+                'correct_label': f"{correct_value} {answer_label}",
+                'detail': f"{record['player_name']} tallied {correct_value} {answer_label} in {record['year_id']}.",
+            }
+
+    return None
+
+
+def _sample_player_seasons(count: int) -> tuple[list[dict], list[dict]]:
+    if snapshot.available():
+        records = snapshot.trivia_player_seasons(count)
+        return records, snapshot.teams_for_years(sorted({record['year_id'] for record in records}))
+
+    sample_query = 'TRIVIA_PLAYER_SEASON_SAMPLE_MATERIALIZED' if player_seasons_available() else 'TRIVIA_PLAYER_SEASON_SAMPLE'
+    records = query_registry.rows(sample_query, {'sampleSize': count})
+    if not records:
+        return [], []
+    year_ids = sorted({record['year_id'] for record in records})
+    return records, query_registry.rows('TRIVIA_TEAMS_FOR_YEARS', {'yearIds': year_ids})
+
+
+def generate_trivia_questions(count: int) -> list[dict]:
+    records, team_rows = _sample_player_seasons(count)
+    if not records:
+        return []
+
+    teams_by_year: dict[int, list[dict]] = {}
+    for row in team_rows:
+        teams_by_year.setdefault(row['yearID'], []).append(dict(row))
+
+    questions = []
+    for record in records:
+        candidates = [row for row in teams_by_year.get(record['year_id'], []) if row['teamID'] != record['team_id']]
+        other_teams = random.sample(candidates, 3) if len(candidates) >= 3 else candidates
+        question = _build_question(record, other_teams)
+        if question:
+            questions.append(question)
+    return questions
+
+
+class TriviaPool:
+    def __init__(self, size: int = 200, low_water: int = 50, batch_size: int = 100):
+        self.size = size
+        self.low_water = low_water
+        self.batch_size = batch_size
+        self.refills = 0
+        self.refill_errors = 0
+        self._app = None
+        self._questions: deque = deque()
+        self._lock = threading.Lock()
+        # Held for a whole refill, so only one sample query runs at a time per process.
+        self._refill_lock = threading.Lock()
+        self._refilling = False
+
+    def init_app(self, app) -> None:
+        self.size = int(app.config.setdefault('TRIVIA_POOL_SIZE', self.size))
+        self.low_water = int(app.config.setdefault('TRIVIA_POOL_LOW_WATER', self.low_water))
+        self.batch_size = int(app.config.setdefault('TRIVIA_REFILL_BATCH_SIZE', self.batch_size))
+        self._app = app
+        with self._lock:
+            self._questions.clear()
+
+    def pop(self) -> Optional[dict]:
+        with self._lock:
+            question = self._questions.popleft() if self._questions else None
+            remaining = len(self._questions)
+        if question is None:
+            # Cold pool: the first caller fills it inline and concurrent callers wait for that
+            # batch instead of each running their own sample.
+            with self._refill_lock:
+                if not len(self):
+                    self._fill()
+            with self._lock:
+                question = self._questions.popleft() if self._questions else None
+                remaining = len(self._questions)
+        if remaining <= self.low_water:
+            self._schedule_refill()
+        return question
+
+    def refill(self) -> int:
+        with self._refill_lock:
+            return self._fill()
+
+    def _fill(self) -> int:
+        with self._lock:
+            wanted = min(self.batch_size, self.size - len(self._questions))
+        if wanted <= 0:
+            return 0
+        questions = generate_trivia_questions(wanted)
+        with self._lock:
+            room = max(0, self.size - len(self._questions))
+            self._questions.extend(questions[:room])
+            self.refills += 1
+        return min(len(questions), room)
+
+    def _schedule_refill(self) -> None:
+        with self._lock:
+            if self._refilling or self._app is None:
+                return
+            self._refilling = True
+        worker = threading.Thread(target=self._refill_in_background, name='trivia-pool-refill', daemon=True)
+        worker.start()
+
+    def _refill_in_background(self) -> None:
+        try:
+            with self._app.app_context():
+                while len(self) < self.size and self.refill():
+                    pass
+        except Exception:
+            self.refill_errors += 1
+            self._app.logger.exception('Trivia pool refill failed')
+        finally:
+            with self._lock:
+                self._refilling = False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'size': len(self._questions),
+                'capacity': self.size,
+                'low_water': self.low_water,
+                'batch_size': self.batch_size,
+                'refills': self.refills,
+                'refill_errors': self.refill_errors,
+                'refilling': self._refilling,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._questions)
+
+
+trivia_pool = TriviaPool()
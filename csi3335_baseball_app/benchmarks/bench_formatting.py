@@ -0,0 +1,113 @@
+"""Compare the old row-wise formatting with the columnar layer in app.formatting.
+
+Run from the project root:
+
+    python -m benchmarks.bench_formatting
+    python -m benchmarks.bench_formatting --rows 50 5000 100000 --repeat 5
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from app.formatting import formatted_batting_columns
+
+
+def synthetic_batting(rows: int, seed: int = 3335) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    at_bats = rng.integers(0, 650, rows).astype(float)
+    hits = np.floor(at_bats * rng.uniform(0.15, 0.35, rows))
+    walks = rng.integers(0, 90, rows).astype(float)
+    plate_appearances = at_bats + walks
+    stolen = rng.integers(0, 40, rows).astype(float)
+    caught = rng.integers(0, 12, rows).astype(float)
+    frame = pd.DataFrame({
+        'age': np.where(rng.random(rows) < 0.05, np.nan, rng.integers(19, 42, rows)),
+        'avg': np.where(at_bats > 0, hits / np.maximum(at_bats, 1), 0),
+        'obp': np.where(plate_appearances > 0, (hits + walks) / np.maximum(plate_appearances, 1), 0),
+        'slg': np.where(at_bats > 0, hits * rng.uniform(1.0, 2.2, rows) / np.maximum(at_bats, 1), 0),
+        'sb_pct': np.where(stolen + caught > 0, stolen / np.maximum(stolen + caught, 1), np.nan),
+        'hall_of_famer': (rng.random(rows) < 0.02).astype(int),
+        'all_star': (rng.random(rows) < 0.08).astype(int),
+    })
+    frame['ops'] = frame['obp'] + frame['slg']
+    frame['ops_plus'] = np.where(plate_appearances > 0, 100 * (frame['obp'] / 0.320 + frame['slg'] / 0.400 - 1), np.nan)
+    return frame
+
+
+def rowwise_batting_columns(frame: pd.DataFrame, year_id: int) -> pd.DataFrame:
+    # Reference copy of the per-row .apply formatting the routes used before app.formatting.
+    def _format_rate(value: float) -> str:
+        return f"{value:.3f}" if not np.isnan(value) else '—'
+
+    def _format_percent(value: float) -> str:
+        return f"{value * 100:.1f}%" if not np.isnan(value) else '—'
+
+    def _format_index(value: float) -> str:
+        return f"{value:.0f}" if not np.isnan(value) else '—'
+
+    def _badge_variants(row):
+        html_badges = []
+        text_badges = []
+        if row['hall_of_famer']:
+            html_badges.append('<span class="badge badge-hof">Hall of Fame</span>')
+            text_badges.append('Hall of Fame')
+        if row['all_star']:
+            badge_text = f"All-Star {year_id}"
+            html_badges.append(f'<span class="badge badge-allstar">{badge_text}</span>')
+            text_badges.append(badge_text)
+        return pd.Series({
+            'badges_html': ' '.join(html_badges),
+            'badges_text': ', '.join(text_badges),
+        })
+
+    badges = frame.apply(_badge_variants, axis=1)
+    return pd.DataFrame({
+        'age_display': frame['age'].apply(lambda v: str(int(v)) if not np.isnan(v) else '—'),
+        'age_export': frame['age'].apply(lambda v: str(int(v)) if not np.isnan(v) else ''),
+        'sb_pct_display': frame['sb_pct'].apply(_format_percent),
+        'avg_display': frame['avg'].apply(_format_rate),
+        'obp_display': frame['obp'].apply(_format_rate),
+        'slg_display': frame['slg'].apply(_format_rate),
+        'ops_display': frame['ops'].apply(_format_rate),
+        'ops_plus_display': frame['ops_plus'].apply(_format_index),
+        'hall_of_famer_display': frame['hall_of_famer'].apply(lambda v: 'Yes' if v else 'No'),
+        'all_star_display': frame['all_star'].apply(lambda v: 'Yes' if v else 'No'),
+        'badges_html': badges['badges_html'],
+        'badges_text': badges['badges_text'],
+    })
+
+
+def _best_of(function, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[50, 1500, 20000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'row-wise ms':>12} {'columnar ms':>12} {'row-wise us/row':>16} {'columnar us/row':>16} {'speedup':>8}")
+    for rows in args.rows:
+        frame = synthetic_batting(rows)
+        expected = rowwise_batting_columns(frame, 2016)
+        actual = formatted_batting_columns(frame, 2016)
+        pd.testing.assert_frame_equal(actual[expected.columns], expected, check_dtype=False)
+
+        rowwise = _best_of(lambda: rowwise_batting_columns(frame, 2016), args.repeat)
+        columnar = _best_of(lambda: formatted_batting_columns(frame, 2016), args.repeat)
+        print(
+            f"{rows:>8} {rowwise * 1e3:>12.2f} {columnar * 1e3:>12.2f} "
+            f"{rowwise / rows * 1e6:>16.2f} {columnar / rows * 1e6:>16.2f} {rowwise / columnar:>7.1f}x"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+"""Time the main routes and helpers against a seeded SQLite database.
+
+Every case runs through the Flask test client (or inside a request context for
+helpers) and reports p50/p95 latency plus peak and retained allocations measured
+with tracemalloc on a separate pass, so tracing never skews the timings.
+
+Run from the project root after building a database with benchmarks.seed:
+
+    python -m benchmarks.bench_routes /tmp/baseball-bench.db
+    python -m benchmarks.bench_routes /tmp/baseball-bench.db --cold --iterations 50
+    python -m benchmarks.bench_routes /tmp/baseball-bench.db --only team_view team_download
+    python -m benchmarks.bench_routes /tmp/baseball-bench.db --cold --snapshot /tmp/baseball-snapshot
+"""
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+
+from app import create_app, db, team_batting_cache, team_fragment_cache
+from app.models import User
+
+from .seed import install_mysql_functions
+
+BENCH_USERNAME = 'bench'
+BENCH_PASSWORD = 'bench-password'
+
+
+def _create_bench_app(path: str, snapshot_dir: str = '', csrf: bool = False, replica_paths=()):
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{path}",
+        'SQLALCHEMY_ENGINE_OPTIONS': {},
+        # Read-only URIs, so a missing replica file fails to connect instead of being created empty.
+        'READ_REPLICA_URIS': [f"sqlite:///file:{replica}?mode=ro&uri=true" for replica in replica_paths],
+        'WTF_CSRF_ENABLED': csrf,
+        'SNAPSHOT_DIR': snapshot_dir,
+    })
+    from app.replicas import replicas
+
+    for engine in replicas.engines():
+        install_mysql_functions(engine)
+    with app.app_context():
+        install_mysql_functions(db.engine)
+        db.create_all()
+        if not db.session.query(User).filter_by(username=BENCH_USERNAME).first():
+            user = User(username=BENCH_USERNAME, email='bench@example.com')
+            user.set_password(BENCH_PASSWORD)
+            db.session.add(user)
+            db.session.commit()
+    return app
+
+
+def _team_seasons(app, samples: int, seed: int) -> list[tuple[str, int, str]]:
+    from sqlalchemy import text
+
+    with app.app_context():
+        rows = db.session.execute(text("SELECT teamID, yearID, franchID FROM teams ORDER BY yearID, teamID")).all()
+    rng = random.Random(seed)
+    return [tuple(row) for row in rng.sample(rows, min(samples, len(rows)))]
+
+
+def _build_cases(app, client, team_seasons):
+    from app.routes import _compute_team_batting, _team_comparison
+    from app.trivia import generate_trivia_questions
+
+    def request_case(method: str, url_for_sample, data_for_sample=None):
+        def run(sample):
+            kwargs = {'data': data_for_sample(sample)} if data_for_sample else {}
+            response = getattr(client, method)(url_for_sample(sample), **kwargs)
+            if response.status_code != 200:
+                raise RuntimeError(f"{url_for_sample(sample)} returned {response.status_code}")
+            # Streamed CSV bodies are only produced as they are read.
+            response.get_data()
+            response.close()
+        return run
+
+    def helper_case(function):
+        def run(sample):
+            with app.test_request_context():
+                function(sample)
+        return run
+
+    return {
+        'team_view': request_case('get', lambda s: f"/team/{s[0]}/{s[1]}"),
+        'team_download': request_case('get', lambda s: f"/team/{s[0]}/{s[1]}/download"),
+        'team_json': request_case('get', lambda s: f"/api/v1/team/{s[0]}/{s[1]}/batting"),
+        'team_compare': request_case('get', lambda s: f"/team/{s[0]}/{s[1]}/compare"),
+        'teams_compare': request_case('post', lambda s: '/teams/compare', lambda s: {
+            'year': s[1], 'team_one': s[0], 'team_two': 'T00' if s[0] != 'T00' else 'T01',
+            'submit_compare': 'Compare Teams',
+        }),
+        'season_download': request_case('get', lambda s: f"/season/{s[1]}/download"),
+        'franchise_download': request_case('get', lambda s: f"/franchise/{s[2]}/download"),
+        'game': request_case('get', lambda s: '/game'),
+        'leaders': request_case('get', lambda s: f"/leaders?stat=ops&year={s[1]}"),
+        'career_leaders': request_case('get', lambda s: '/leaders?stat=home_runs&scope=career&page=2'),
+        '_compute_team_batting': helper_case(lambda s: _compute_team_batting(s[0], s[1])),
+        '_team_comparison': helper_case(lambda s: _team_comparison([s[0], 'T00'], s[1])),
+        'generate_trivia_questions': helper_case(lambda s: generate_trivia_questions(10)),
+    }
+
+
+def _clear_caches() -> None:
+    team_batting_cache.clear()
+    team_fragment_cache.clear()
+
+
+def _percentile(timings: list[float], fraction: float) -> float:
+    if len(timings) == 1:
+        return timings[0]
+    return statistics.quantiles(timings, n=100, method='inclusive')[round(fraction * 100) - 1]
+
+
+def _time_case(run, team_seasons, iterations: int, cold: bool) -> list[float]:
+    timings = []
+    for index in range(iterations):
+        if cold:
+            _clear_caches()
+        sample = team_seasons[index % len(team_seasons)]
+        started = time.perf_counter()
+        run(sample)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def _trace_case(run, team_seasons, iterations: int, cold: bool) -> tuple[int, int]:
+    peak = 0
+    retained = 0
+    for index in range(iterations):
+        if cold:
+            _clear_caches()
+        sample = team_seasons[index % len(team_seasons)]
+        tracemalloc.start()
+        run(sample)
+        current, call_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak = max(peak, call_peak)
+        retained = max(retained, current)
+    return peak, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('database', help='SQLite file built by python -m benchmarks.seed')
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--trace-iterations', type=int, default=3)
+    parser.add_argument('--samples', type=int, default=10, help='distinct team-seasons to rotate through')
+    parser.add_argument('--seed', type=int, default=3335)
+    parser.add_argument('--cold', action='store_true', help='clear the team caches before every call')
+    parser.add_argument('--materialized', action='store_true', help='build player_season_batting first')
+    parser.add_argument('--snapshot', metavar='DIR', default='', help='export a snapshot to DIR first and serve from it')
+    parser.add_argument('--replica', action='append', default=[], metavar='PATH', help='copy of the database to read from (repeatable)')
+    parser.add_argument('--only', nargs='+', metavar='CASE')
+    args = parser.parse_args()
+
+    app = _create_bench_app(args.database, args.snapshot, replica_paths=args.replica)
+    if args.materialized:
+        from app.materialized import build_player_seasons
+
+        with app.app_context():
+            build_player_seasons()
+    if args.snapshot:
+        from app.snapshot import export_snapshot, snapshot
+
+        with app.app_context():
+            export_snapshot(args.snapshot)
+        snapshot.reload()
+
+    client = app.test_client()
+    response = client.post('/auth/login', data={'username': BENCH_USERNAME, 'password': BENCH_PASSWORD})
+    if response.status_code != 302:
+        raise SystemExit(f"Login failed with status {response.status_code}")
+
+    team_seasons = _team_seasons(app, args.samples, args.seed)
+    cases = _build_cases(app, client, team_seasons)
+    if args.only:
+        unknown = sorted(set(args.only) - set(cases))
+        if unknown:
+            raise SystemExit(f"Unknown cases: {', '.join(unknown)}. Available: {', '.join(cases)}")
+        cases = {name: cases[name] for name in args.only}
+
+    mode = 'cold' if args.cold else 'warm'
+    print(f"{args.database} ({mode} caches, {args.iterations} iterations over {len(team_seasons)} team-seasons)")
+    print(f"{'case':<26} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'peak KiB':>10} {'retained KiB':>13}")
+    for name, run in cases.items():
+        # Untimed calls so first-use work (league baselines, trivia pool fill) is not billed to p95,
+        # and in warm mode every sampled team-season is already cached.
+        for sample in team_seasons if not args.cold else team_seasons[:1]:
+            run(sample)
+        timings = _time_case(run, team_seasons, args.iterations, args.cold)
+        peak, retained = _trace_case(run, team_seasons, args.trace_iterations, args.cold)
+        print(
+            f"{name:<26} {_percentile(timings, 0.5) * 1e3:>9.2f} {_percentile(timings, 0.95) * 1e3:>9.2f} "
+            f"{max(timings) * 1e3:>9.2f} {peak / 1024:>10.0f} {retained / 1024:>13.0f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
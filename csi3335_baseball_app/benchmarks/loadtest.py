@@ -0,0 +1,284 @@
+"""Drive a running server with concurrent logged-in users and report per-route throughput.
+
+Each virtual user logs in through /auth/login with its own cookie jar (reading the
+CSRF token from the login form), then sends a weighted mix of requests to the team
+page, CSV download, player and team comparisons, the home page and /game. With
+--rate the users share one schedule of evenly spaced start times, so the server
+sees a steady request rate; without it every user sends back to back. The client
+side only uses the standard library.
+
+Run from the project root, either against a server started here on a SQLite
+database built with benchmarks.seed, or against one already running (for example
+run.py on a local MariaDB):
+
+    python -m benchmarks.loadtest --serve /tmp/baseball-bench.db --users 16 --rate 50 --duration 30
+    python -m benchmarks.loadtest --url http://127.0.0.1:5000 --username alice --password secret
+    python -m benchmarks.loadtest --serve /tmp/baseball-bench.db --weights team_view=1,game=1
+"""
+import argparse
+import json
+import logging
+import random
+import re
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import Counter, defaultdict
+from http.cookiejar import CookieJar
+
+DEFAULT_WEIGHTS = {
+    'index': 2,
+    'team_view': 8,
+    'team_download': 2,
+    'team_compare': 3,
+    'teams_compare': 2,
+    'game': 1,
+}
+LATENCY_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+CSRF_TOKEN = re.compile(r'name="csrf_token"[^>]*value="([^"]+)"')
+
+
+def parse_weights(value: str) -> dict[str, int]:
+    # "team_view=5,game=1" -> {'team_view': 5, 'game': 1}; routes left out are not requested.
+    weights = {}
+    for item in value.split(','):
+        if not item.strip():
+            continue
+        name, _, weight = item.partition('=')
+        if name.strip() not in DEFAULT_WEIGHTS:
+            raise SystemExit(f"Unknown route {name.strip()!r}. Available: {', '.join(DEFAULT_WEIGHTS)}")
+        weights[name.strip()] = int(weight)
+    return weights
+
+
+class _Session:
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip('/')
+        self.csrf_token = ''
+        self._opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(CookieJar()))
+
+    def request(self, path: str, data: dict = None, timeout: float = 60) -> tuple[int, bytes, str]:
+        # Returns the status, the body and the final URL after redirects.
+        body = urllib.parse.urlencode(data).encode() if data is not None else None
+        try:
+            with self._opener.open(self.base_url + path, body, timeout=timeout) as response:
+                return response.status, response.read(), response.url
+        except urllib.error.HTTPError as error:
+            return error.code, error.read(), error.url
+
+    def _read_csrf_token(self, page: bytes) -> None:
+        match = CSRF_TOKEN.search(page.decode())
+        if match:
+            self.csrf_token = match.group(1)
+
+    def login(self, username: str, password: str) -> None:
+        try:
+            _, page, _ = self.request('/auth/login')
+        except urllib.error.URLError as error:
+            raise SystemExit(f"Cannot reach {self.base_url}: {error.reason}")
+        self._read_csrf_token(page)
+        status, page, url = self.request('/auth/login', {
+            'csrf_token': self.csrf_token, 'username': username, 'password': password, 'submit': 'Sign In',
+        })
+        # A successful login redirects away from the login page.
+        if status != 200 or urllib.parse.urlsplit(url).path.endswith('/auth/login'):
+            raise SystemExit(f"Login as {username!r} failed (status {status})")
+        self._read_csrf_token(page)
+
+
+def _discover_seasons(session: _Session, first: int, last: int) -> dict[int, list[str]]:
+    seasons = {}
+    for year in range(first, last + 1):
+        status, body, _ = session.request(f"/api/v1/seasons/{year}/teams")
+        if status == 200:
+            teams = [team['teamID'] for team in json.loads(body)['teams']]
+            if len(teams) >= 2:
+                seasons[year] = teams
+    if not seasons:
+        raise SystemExit(f"No seasons between {first} and {last} have two or more teams")
+    return seasons
+
+
+def _route_request(route: str, rng: random.Random, seasons: dict[int, list[str]], csrf_token: str):
+    year = rng.choice(list(seasons))
+    team_one, team_two = rng.sample(seasons[year], 2)
+    if route == 'index':
+        return '/', None
+    if route == 'team_view':
+        return f"/team/{team_one}/{year}", None
+    if route == 'team_download':
+        return f"/team/{team_one}/{year}/download", None
+    if route == 'team_compare':
+        return f"/team/{team_one}/{year}/compare", None
+    if route == 'teams_compare':
+        return '/teams/compare', {
+            'csrf_token': csrf_token, 'year': year, 'team_one': team_one, 'team_two': team_two,
+            'submit_compare': 'Compare Teams',
+        }
+    return '/game', None
+
+
+class _Pacer:
+    # Hands out evenly spaced start times shared by all users until the run ends.
+    def __init__(self, rate: float, duration: float):
+        self.interval = 1 / rate if rate > 0 else 0
+        self.started = time.perf_counter()
+        self.deadline = self.started + duration
+        self.issued = 0
+        self._lock = threading.Lock()
+
+    def next_start(self):
+        with self._lock:
+            scheduled = self.started + self.issued * self.interval if self.interval else time.perf_counter()
+            if scheduled >= self.deadline:
+                return None
+            self.issued += 1
+        return scheduled
+
+
+class _Results:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, Counter] = defaultdict(Counter)
+        self.lag: list[float] = []
+        self._lock = threading.Lock()
+
+    def record(self, route: str, status: int, latency: float, lag: float) -> None:
+        with self._lock:
+            self.latencies[route].append(latency)
+            self.statuses[route][status] += 1
+            self.lag.append(lag)
+
+
+def _run_user(session: _Session, weights: dict[str, int], seasons, pacer: _Pacer, results: _Results, seed: int) -> None:
+    rng = random.Random(seed)
+    routes, route_weights = list(weights), list(weights.values())
+    while True:
+        scheduled = pacer.next_start()
+        if scheduled is None:
+            return
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        route = rng.choices(routes, route_weights)[0]
+        path, data = _route_request(route, rng, seasons, session.csrf_token)
+        started = time.perf_counter()
+        try:
+            status, _, _ = session.request(path, data)
+        except OSError:
+            status = 0
+        results.record(route, status, time.perf_counter() - started, max(0.0, started - scheduled))
+
+
+def _percentile(timings: list[float], fraction: float) -> float:
+    if len(timings) == 1:
+        return timings[0]
+    return statistics.quantiles(timings, n=100, method='inclusive')[round(fraction * 100) - 1]
+
+
+def _histogram(timings: list[float]) -> list[int]:
+    counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    for timing in timings:
+        milliseconds = timing * 1e3
+        counts[next((i for i, edge in enumerate(LATENCY_BUCKETS_MS) if milliseconds <= edge), -1)] += 1
+    return counts
+
+
+def _report(results: _Results, elapsed: float) -> None:
+    total = sum(len(timings) for timings in results.latencies.values())
+    errors = sum(count for statuses in results.statuses.values() for status, count in statuses.items() if status != 200)
+    print(f"{total} requests in {elapsed:.1f}s: {total / elapsed:.1f} req/s, {errors / max(total, 1):.1%} errors")
+    if results.lag:
+        print(f"start lag behind schedule: p50 {_percentile(results.lag, 0.5) * 1e3:.1f} ms, "
+              f"p95 {_percentile(results.lag, 0.95) * 1e3:.1f} ms")
+
+    print(f"\n{'route':<15} {'requests':>8} {'req/s':>7} {'errors':>7} {'p50 ms':>9} {'p95 ms':>9} "
+          f"{'p99 ms':>9} {'max ms':>9}  statuses")
+    for route in DEFAULT_WEIGHTS:
+        timings = results.latencies.get(route)
+        if not timings:
+            continue
+        statuses = results.statuses[route]
+        failed = sum(count for status, count in statuses.items() if status != 200)
+        print(
+            f"{route:<15} {len(timings):>8} {len(timings) / elapsed:>7.1f} {failed / len(timings):>7.1%} "
+            f"{_percentile(timings, 0.5) * 1e3:>9.1f} {_percentile(timings, 0.95) * 1e3:>9.1f} "
+            f"{_percentile(timings, 0.99) * 1e3:>9.1f} {max(timings) * 1e3:>9.1f}  "
+            + ' '.join(f"{status or 'conn'}:{count}" for status, count in sorted(statuses.items()))
+        )
+
+    labels = [f"<={edge}" for edge in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}"]
+    print(f"\nlatency histogram (ms)\n{'route':<15} " + ' '.join(f"{label:>7}" for label in labels))
+    for route in DEFAULT_WEIGHTS:
+        if results.latencies.get(route):
+            print(f"{route:<15} " + ' '.join(f"{count:>7}" for count in _histogram(results.latencies[route])))
+
+
+def _serve(database: str, snapshot_dir: str, replica_paths: list[str]):
+    # Imported here so --url runs only need the standard library.
+    from werkzeug.serving import make_server
+
+    from .bench_routes import BENCH_PASSWORD, BENCH_USERNAME, _create_bench_app
+
+    app = _create_bench_app(database, snapshot_dir, csrf=True, replica_paths=replica_paths)
+    # Per-request access logs would drown out the report.
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}", BENCH_USERNAME, BENCH_PASSWORD
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--serve', metavar='DATABASE', help='start a threaded server here on a seeded SQLite file')
+    target.add_argument('--url', help='base URL of a server that is already running')
+    parser.add_argument('--username', help='account to log in as (default: the benchmark user with --serve)')
+    parser.add_argument('--password')
+    parser.add_argument('--snapshot', metavar='DIR', default='', help='with --serve, serve from this snapshot')
+    parser.add_argument('--replica', action='append', default=[], metavar='PATH', help='with --serve, read from this copy of the database (repeatable)')
+    parser.add_argument('--users', type=int, default=8, help='concurrent logged-in users')
+    parser.add_argument('--rate', type=float, default=0, help='target requests per second across all users (0: as fast as possible)')
+    parser.add_argument('--duration', type=float, default=20, help='seconds to send requests for')
+    parser.add_argument('--weights', type=parse_weights, default=DEFAULT_WEIGHTS, help='route=weight,... (default: %(default)s)')
+    parser.add_argument('--years', default='1990-2024', help='season range to sample teams from')
+    parser.add_argument('--seed', type=int, default=3335)
+    args = parser.parse_args()
+
+    server = None
+    base_url, username, password = args.url, args.username, args.password
+    if args.serve:
+        server, base_url, bench_username, bench_password = _serve(args.serve, args.snapshot, args.replica)
+        username, password = username or bench_username, password or bench_password
+    if not username or not password:
+        raise SystemExit('--username and --password are required with --url')
+
+    sessions = [_Session(base_url) for _ in range(args.users)]
+    for session in sessions:
+        session.login(username, password)
+    first, _, last = args.years.partition('-')
+    seasons = _discover_seasons(sessions[0], int(first), int(last or first))
+
+    rate = f"{args.rate:g} req/s" if args.rate else 'unpaced'
+    print(f"{base_url}: {args.users} users, {rate}, {args.duration:g}s over {len(seasons)} seasons")
+    results = _Results()
+    pacer = _Pacer(args.rate, args.duration)
+    threads = [
+        threading.Thread(target=_run_user, args=(session, args.weights, seasons, pacer, results, args.seed + index))
+        for index, session in enumerate(sessions)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    _report(results, time.perf_counter() - pacer.started)
+
+    if server is not None:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,224 @@
+"""Build a synthetic SQLite stand-in for the baseball schema.
+
+Only the tables and columns the app reads are created: batting, people, teams,
+halloffame and allstarfull. Scale 1 is roughly Lahman sized (1871-2024, about
+120k batting rows); --scale 10 or 100 deepens every roster by that factor.
+
+Run from the project root:
+
+    python -m benchmarks.seed /tmp/baseball-bench.db
+    python -m benchmarks.seed /tmp/baseball-bench-10x.db --scale 10
+"""
+import argparse
+import os
+import random
+import sqlite3
+import time
+
+FIRST_YEAR = 1871
+LAST_YEAR = 2024
+ROSTER_SIZE = 38
+SECOND_STINT_RATE = 0.08
+RETIREMENT_RATE = 0.2
+ALL_STAR_FIRST_YEAR = 1933
+ALL_STAR_RATE = 0.03
+TWO_GAME_ALL_STAR_YEARS = range(1959, 1963)
+HALL_OF_FAME_RATE = 0.015
+
+FIRST_NAMES = ['Hank', 'Babe', 'Ty', 'Willie', 'Mickey', 'Lou', 'Ted', 'Jackie', 'Roberto', 'Cal',
+               'Ken', 'Derek', 'Ichiro', 'Mike', 'Shohei', 'Tony', 'Reggie', 'Ozzie', 'Frank', 'Joe']
+LAST_NAMES = ['Aaron', 'Ruth', 'Cobb', 'Mays', 'Mantle', 'Gehrig', 'Williams', 'Robinson', 'Clemente',
+              'Ripken', 'Griffey', 'Jeter', 'Suzuki', 'Trout', 'Ohtani', 'Gwynn', 'Jackson', 'Smith',
+              'Thomas', 'DiMaggio']
+
+SCHEMA = """
+CREATE TABLE people (
+    playerID TEXT PRIMARY KEY,
+    nameFirst TEXT,
+    nameLast TEXT,
+    birthYear INTEGER
+);
+CREATE TABLE teams (
+    yearID INTEGER NOT NULL,
+    lgID TEXT NOT NULL,
+    teamID TEXT NOT NULL,
+    franchID TEXT,
+    team_name TEXT,
+    team_W INTEGER,
+    team_L INTEGER,
+    PRIMARY KEY (yearID, lgID, teamID)
+);
+CREATE TABLE batting (
+    playerID TEXT NOT NULL,
+    yearId INTEGER NOT NULL,
+    stint INTEGER NOT NULL,
+    teamID TEXT,
+    b_G INTEGER,
+    b_AB INTEGER,
+    b_H INTEGER,
+    b_2B INTEGER,
+    b_3B INTEGER,
+    b_HR INTEGER,
+    b_RBI INTEGER,
+    b_BB INTEGER,
+    b_SO INTEGER,
+    b_SB INTEGER,
+    b_CS INTEGER,
+    b_HBP INTEGER,
+    b_SF INTEGER,
+    b_SH INTEGER,
+    PRIMARY KEY (playerID, yearId, stint)
+);
+CREATE TABLE halloffame (
+    playerID TEXT NOT NULL,
+    yearID INTEGER NOT NULL,
+    votedBy TEXT NOT NULL,
+    inducted TEXT,
+    PRIMARY KEY (playerID, yearID, votedBy)
+);
+CREATE TABLE allstarfull (
+    playerID TEXT NOT NULL,
+    yearID INTEGER NOT NULL,
+    gameNum INTEGER NOT NULL,
+    PRIMARY KEY (playerID, yearID, gameNum)
+);
+"""
+
+
+def teams_in_season(year: int) -> int:
+    # Grows from 8 clubs in 1871 to 30 in 2024, like the real league expansions.
+    return 8 + round(22 * (year - FIRST_YEAR) / (LAST_YEAR - FIRST_YEAR))
+
+
+def _batting_line(rng: random.Random, player_id: str, year: int, stint: int, team_id: str) -> tuple:
+    games = rng.randint(1, 162)
+    at_bats = rng.randint(0, games * 4)
+    hits = int(at_bats * rng.uniform(0.15, 0.34))
+    home_runs = int(hits * rng.uniform(0, 0.2))
+    doubles = int((hits - home_runs) * rng.uniform(0.1, 0.3))
+    triples = int((hits - home_runs - doubles) * rng.uniform(0, 0.06))
+    stolen_bases = rng.randint(0, max(games // 5, 1))
+    return (
+        player_id,
+        year,
+        stint,
+        team_id,
+        games,
+        at_bats,
+        hits,
+        doubles,
+        triples,
+        home_runs,
+        int(hits * rng.uniform(0.3, 0.7)),
+        int(at_bats * rng.uniform(0.03, 0.14)),
+        int(at_bats * rng.uniform(0.08, 0.3)),
+        stolen_bases,
+        int(stolen_bases * rng.uniform(0, 0.5)),
+        rng.randint(0, 10),
+        rng.randint(0, 8),
+        rng.randint(0, 8),
+    )
+
+
+def build_database(path: str, scale: float = 1.0, seed: int = 3335) -> dict:
+    if os.path.exists(path):
+        os.remove(path)
+    rng = random.Random(seed)
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+
+    roster_size = max(1, round(ROSTER_SIZE * scale))
+    active: list[str] = []
+    next_player = 0
+    counts = {'people': 0, 'teams': 0, 'batting': 0, 'halloffame': 0, 'allstarfull': 0}
+
+    for year in range(FIRST_YEAR, LAST_YEAR + 1):
+        team_ids = [f"T{index:02d}" for index in range(teams_in_season(year))]
+        team_rows = [
+            (year, 'AL' if index % 2 else 'NL', team_id, f"F{team_id[1:]}", f"Team {team_id}",
+             rng.randint(50, 100), rng.randint(50, 100))
+            for index, team_id in enumerate(team_ids)
+        ]
+
+        active = [player_id for player_id in active if rng.random() > RETIREMENT_RATE]
+        people_rows = []
+        while len(active) < len(team_ids) * roster_size:
+            player_id = f"p{next_player:07d}"
+            next_player += 1
+            birth_year = None if rng.random() < 0.03 else year - rng.randint(20, 27)
+            people_rows.append((player_id, rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES), birth_year))
+            active.append(player_id)
+        rng.shuffle(active)
+
+        batting_rows = []
+        for slot, player_id in enumerate(active):
+            team_id = team_ids[slot % len(team_ids)]
+            batting_rows.append(_batting_line(rng, player_id, year, 1, team_id))
+            if rng.random() < SECOND_STINT_RATE:
+                batting_rows.append(_batting_line(rng, player_id, year, 2, rng.choice(team_ids)))
+
+        all_star_rows = []
+        if year >= ALL_STAR_FIRST_YEAR:
+            games = 2 if year in TWO_GAME_ALL_STAR_YEARS else 1
+            for player_id in active:
+                if rng.random() < ALL_STAR_RATE:
+                    all_star_rows.extend((player_id, year, game) for game in range(games))
+
+        connection.executemany("INSERT INTO teams VALUES (?, ?, ?, ?, ?, ?, ?)", team_rows)
+        connection.executemany("INSERT INTO people VALUES (?, ?, ?, ?)", people_rows)
+        connection.executemany(
+            "INSERT INTO batting VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            batting_rows,
+        )
+        connection.executemany("INSERT INTO allstarfull VALUES (?, ?, ?)", all_star_rows)
+        counts['teams'] += len(team_rows)
+        counts['people'] += len(people_rows)
+        counts['batting'] += len(batting_rows)
+        counts['allstarfull'] += len(all_star_rows)
+
+    # Most candidates appear on several ballots before (or without) being inducted.
+    hall_rows = []
+    for index in range(next_player):
+        if rng.random() < HALL_OF_FAME_RATE * 3:
+            player_id = f"p{index:07d}"
+            inducted = rng.random() < 1 / 3
+            ballots = rng.randint(1, 5)
+            for ballot in range(ballots):
+                result = 'Y' if inducted and ballot == ballots - 1 else 'N'
+                hall_rows.append((player_id, 1936 + ballot, 'BBWAA', result))
+    connection.executemany("INSERT INTO halloffame VALUES (?, ?, ?, ?)", hall_rows)
+    counts['halloffame'] = len(hall_rows)
+
+    connection.commit()
+    connection.close()
+    return counts
+
+
+def install_mysql_functions(engine) -> None:
+    # The app's SQL targets MariaDB; SQLite only lacks these two functions.
+    from sqlalchemy import event
+
+    @event.listens_for(engine, 'connect')
+    def _register(dbapi_connection, connection_record):
+        dbapi_connection.create_function(
+            'CONCAT_WS', -1, lambda separator, *values: separator.join(str(v) for v in values if v is not None)
+        )
+        dbapi_connection.create_function('RAND', 0, random.random)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path')
+    parser.add_argument('--scale', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=3335)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    counts = build_database(args.path, args.scale, args.seed)
+    elapsed = time.perf_counter() - started
+    summary = ', '.join(f"{table}={rows:,}" for table, rows in counts.items())
+    print(f"Built {args.path} at scale {args.scale:g} in {elapsed:.1f}s: {summary}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Index the access paths of the hot batting queries
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# MariaDB caps an index at 16 key parts, so TEAM_BATTING gets a narrow seek index
+# (about 40 rows per team-season) while LEAGUE_BATTING_BY_YEAR, which reads every
+# season, gets an index holding all the columns it sums so it never touches the rows.
+INDEXES = [
+    ('ix_batting_year_team_player', 'batting', ['yearId', 'teamID', 'playerID']),
+    (
+        'ix_batting_year_league_totals',
+        'batting',
+        ['yearId', 'b_AB', 'b_H', 'b_2B', 'b_3B', 'b_HR', 'b_BB', 'b_HBP', 'b_SF'],
+    ),
+    ('ix_allstarfull_player_year', 'allstarfull', ['playerID', 'yearID']),
+    ('ix_halloffame_player_inducted', 'halloffame', ['playerID', 'inducted']),
+    ('ix_teams_year_team', 'teams', ['yearID', 'teamID']),
+    ('ix_teams_franchise_year', 'teams', ['franchID', 'yearID', 'teamID']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,55 @@
+import sqlite3
+import threading
+
+import pytest
+
+from app import create_app, db, team_batting_cache, team_fragment_cache
+from app.models import User
+from benchmarks.seed import build_database, install_mysql_functions
+
+
+@pytest.fixture
+def single_worker_app(tmp_path):
+    path = str(tmp_path / 'baseball.db')
+    build_database(path, scale=0.1)
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{path}",
+        'SQLALCHEMY_ENGINE_OPTIONS': {},
+        'WTF_CSRF_ENABLED': False,
+        'QUERY_EXECUTOR_WORKERS': 1,
+    })
+    with app.app_context():
+        install_mysql_functions(db.engine)
+        db.create_all()
+        user = User(username='tester', email='tester@example.com')
+        user.set_password('tester-password')
+        db.session.add(user)
+        db.session.commit()
+    team_batting_cache.clear()
+    team_fragment_cache.clear()
+    with sqlite3.connect(path) as connection:
+        team_seasons = connection.execute(
+            "SELECT teamID, yearID FROM teams WHERE yearID = 2000 ORDER BY teamID LIMIT 8"
+        ).fetchall()
+    return app, team_seasons
+
+
+def test_concurrent_cold_team_views_finish_with_one_worker(single_worker_app):
+    # team_view hands _team_fragments to the pool, which calls run() again for the team batting;
+    # with one worker that nested call used to wait forever on its own slot.
+    app, team_seasons = single_worker_app
+    statuses = {}
+
+    def view(team_id, year_id):
+        client = app.test_client()
+        client.post('/auth/login', data={'username': 'tester', 'password': 'tester-password'})
+        statuses[team_id] = client.get(f"/team/{team_id}/{year_id}").status_code
+
+    threads = [threading.Thread(target=view, args=team_season, daemon=True) for team_season in team_seasons]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert statuses == {team_id: 200 for team_id, _ in team_seasons}